@@ -0,0 +1,222 @@
+"""Import-time and first-widget latency benchmarks for napari_toolkit.
+
+Every measurement runs in a fresh interpreter, so module caches of earlier measurements do not
+hide startup costs. Results are written as JSON and can be compared against a stored baseline:
+
+    python benchmarks/startup.py --output startup.json --baseline benchmarks/startup_baseline.json
+
+A measurement counts as a regression if it is slower than ``baseline * (1 + threshold)``. The
+script exits with status 1 if any regression is found. Use ``--update-baseline`` to (re)write
+the baseline from the current run.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+IMPORT_MODULES = [
+    "napari_toolkit",
+    "napari_toolkit.widgets",
+    "napari_toolkit.containers",
+    "napari_toolkit.utils",
+]
+SETUP_PACKAGES = [
+    "napari_toolkit.widgets",
+    "napari_toolkit.containers",
+    "napari_toolkit.data_structs",
+]
+
+# Values for required arguments, matched by parameter name
+_REQUIRED_ARGS = {
+    "text": "Text",
+    "options": ["A", "B", "C"],
+    "icon_name": "delete",
+    "data": [[1, 2], [3, 4]],
+}
+# Additional keyword arguments for functions which do not work with their defaults
+_EXTRA_KWARGS = {
+    "setup_progressbaredit": {"minimum": 0, "maximum": 100, "default": 0},
+    "setup_icon_wrapper": {"icon_dict": {0: "check"}, "color_dict": {0: "green"}, "default": 0},
+}
+
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return env
+
+
+def measure_importtime(module: str) -> float:
+    """Measures the cumulative import time of a module in microseconds via `-X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=_env(),
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _self, cumulative, name = line[len("import time:") :].split("|")
+        if name.strip() == module:
+            return float(cumulative)
+    raise RuntimeError(f"No importtime entry found for {module}")
+
+
+def _first_widget_child(package: str, name: str) -> None:
+    """Child process: prints the seconds from import to the first constructed widget."""
+    import importlib
+    import inspect
+
+    from qtpy.QtWidgets import QApplication, QPushButton, QVBoxLayout, QWidget
+
+    app = QApplication.instance() or QApplication([])
+    container = QWidget()
+    layout = QVBoxLayout(container)
+
+    start = time.perf_counter()
+    function = getattr(importlib.import_module(package), name)
+
+    kwargs = dict(_EXTRA_KWARGS.get(name, {}))
+    for param in inspect.signature(function).parameters.values():
+        if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+            continue
+        if param.name == "layout":
+            kwargs["layout"] = layout
+        elif param.name == "widget":
+            kwargs["widget"] = QPushButton("Text")
+            layout.addWidget(kwargs["widget"])
+        elif param.default is inspect.Parameter.empty:
+            kwargs[param.name] = _REQUIRED_ARGS[param.name]
+    function(**kwargs)
+    container.show()
+    app.processEvents()
+    print(time.perf_counter() - start)
+
+
+def measure_first_widget(package: str, name: str) -> float:
+    """Measures the wall-clock time to the first widget of a setup function in milliseconds."""
+    result = subprocess.run(
+        [sys.executable, __file__, "--child", package, name],
+        capture_output=True,
+        text=True,
+        env=_env(),
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1]) * 1000
+
+
+def _setup_functions() -> List[tuple]:
+    import importlib
+
+    functions = []
+    for package in SETUP_PACKAGES:
+        for name in importlib.import_module(package).__all__:
+            if name.startswith("setup_"):
+                functions.append((package, name))
+    return functions
+
+
+def run(repeat: int = 5) -> dict:
+    """Runs all benchmarks and returns the median of each measurement.
+
+    Args:
+        repeat (int, optional): Number of repetitions per measurement. Defaults to 5.
+
+    Returns:
+        dict: The results with the sections "importtime_us" and "first_widget_ms".
+    """
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "importtime_us": {},
+        "first_widget_ms": {},
+    }
+    for module in IMPORT_MODULES:
+        values = [measure_importtime(module) for _ in range(repeat)]
+        results["importtime_us"][module] = statistics.median(values)
+    for package, name in _setup_functions():
+        values = [measure_first_widget(package, name) for _ in range(repeat)]
+        results["first_widget_ms"][f"{package}.{name}"] = statistics.median(values)
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+    """Compares the results against a baseline.
+
+    Args:
+        results (dict): The current results.
+        baseline (dict): The baseline results.
+        threshold (float): Allowed relative slowdown, e.g. 0.2 for 20%.
+
+    Returns:
+        List[str]: A description of every measurement exceeding the threshold.
+    """
+    regressions = []
+    for section in ("importtime_us", "first_widget_ms"):
+        for key, value in results.get(section, {}).items():
+            reference = baseline.get(section, {}).get(key)
+            if reference is None:
+                continue
+            if value > reference * (1 + threshold):
+                regressions.append(
+                    f"{section} {key}: {value:.1f} vs baseline {reference:.1f} "
+                    f"(+{(value / reference - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="startup.json", help="JSON file for the results.")
+    parser.add_argument("--baseline", default=None, help="JSON file with the baseline results.")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="Allowed relative slowdown (default 0.2)."
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per measurement.")
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Write the results to the baseline."
+    )
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _first_widget_child(*args.child)
+        return 0
+
+    results = run(args.repeat)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline is None:
+        return 0
+    if args.update_baseline or not os.path.exists(args.baseline):
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print(f"No regressions above {args.threshold * 100:.0f}%")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""Click-to-repaint latency of highlighted switches and toggle buttons.
+
+Compares the previous per-button ``setStyleSheet`` highlighting ("stylesheet") with the
+property driven styling ("property") used by the widgets now. Like inside napari, the
+widgets are placed in a container styled with the napari stylesheet (``--no-napari`` to
+measure plain Qt styling).
+
+    python benchmarks/styling.py --options 5 50 --number 200 --output styling.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Callable, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qtpy.QtWidgets import QApplication, QVBoxLayout, QWidget  # noqa: E402
+
+from napari_toolkit.widgets.buttons.toggle_button import QToggleButton  # noqa: E402
+from napari_toolkit.widgets.switch import QHSwitch  # noqa: E402
+
+HIGHLIGHT = "rgb(0, 100, 167)"
+
+
+def _legacy_select(switch: QHSwitch, idx: int) -> None:
+    """The highlighting of a switch before the styling engine, one stylesheet per button."""
+    for btn in switch.buttons:
+        btn.setChecked(False)
+        btn.setStyleSheet("")
+    switch.buttons[idx].setChecked(True)
+    switch.buttons[idx].setStyleSheet(f"background-color: {HIGHLIGHT};")
+
+
+def _legacy_toggle(button: QToggleButton) -> None:
+    """The highlighting of a toggle button before the styling engine."""
+    button.setStyleSheet(f"background-color: {HIGHLIGHT};" if button.isChecked() else "")
+
+
+def _measure(widget: QWidget, click: Callable[[int], None], number: int, stylesheet: str) -> float:
+    """Mean time in milliseconds from a click until the widget is repainted."""
+    app = QApplication.instance()
+    container = QWidget()
+    container.setStyleSheet(stylesheet)
+    QVBoxLayout(container).addWidget(widget)
+    container.show()
+    app.processEvents()
+    start = time.perf_counter()
+    for i in range(number):
+        click(i)
+        widget.repaint()
+        app.processEvents()
+    duration = time.perf_counter() - start
+    container.close()
+    return duration / number * 1000
+
+
+def run(options: List[int], number: int, stylesheet: str = "") -> dict:
+    """Measures the click-to-repaint latency of both styling approaches.
+
+    Args:
+        options (List[int]): Numbers of switch options to measure.
+        number (int): Clicks per measurement.
+        stylesheet (str, optional): Stylesheet of the surrounding container. Defaults to "".
+
+    Returns:
+        dict: Mapping from widget name to {"stylesheet_ms", "property_ms"}.
+    """
+    results = {}
+    for n in options:
+        items = [f"Option {i}" for i in range(n)]
+
+        legacy = QHSwitch()
+        legacy.setStyleSheet("")
+        legacy.addItems(items)
+        current = QHSwitch()
+        current.addItems(items)
+        results[f"QHSwitch ({n} options)"] = {
+            "stylesheet_ms": _measure(
+                legacy, lambda i, w=legacy, n=n: _legacy_select(w, i % n), number, stylesheet
+            ),
+            "property_ms": _measure(
+                current, lambda i, w=current, n=n: w.setCurrentIndex(i % n), number, stylesheet
+            ),
+        }
+
+    legacy = QToggleButton("Toggle")
+    legacy.setStyleSheet("")
+    legacy.clicked.connect(lambda: _legacy_toggle(legacy))
+    current = QToggleButton("Toggle")
+    results["QToggleButton"] = {
+        "stylesheet_ms": _measure(legacy, lambda i, w=legacy: w.click(), number, stylesheet),
+        "property_ms": _measure(current, lambda i, w=current: w.click(), number, stylesheet),
+    }
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--options", type=int, nargs="+", default=[5, 50], help="Switch sizes.")
+    parser.add_argument("--number", type=int, default=200, help="Clicks per measurement.")
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results.")
+    parser.add_argument("--no-napari", action="store_true", help="Skip the napari stylesheet.")
+    args = parser.parse_args(argv)
+
+    _app = QApplication.instance() or QApplication([])
+    stylesheet = ""
+    if not args.no_napari:
+        from napari.qt import get_stylesheet
+
+        stylesheet = get_stylesheet("dark")
+    results = run(args.options, args.number, stylesheet)
+
+    print(f"{'widget':<28}{'stylesheet [ms]':>18}{'property [ms]':>16}{'speedup':>10}")
+    for name, result in results.items():
+        speedup = result["stylesheet_ms"] / result["property_ms"]
+        print(
+            f"{name:<28}{result['stylesheet_ms']:>18.3f}{result['property_ms']:>16.3f}"
+            f"{speedup:>9.1f}x"
+        )
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Creation time and memory of item based and model based tables.
+
+Compares ``setup_table`` (one ``QTableWidgetItem`` per cell, "items") with
+``setup_tableview`` (a ``QArrayTableModel`` over the columns, "model") for a region
+properties like table of 10 columns. The memory is the growth of the resident set size.
+
+    python benchmarks/table.py --rows 10000 100000 --output table.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Callable, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np  # noqa: E402
+import psutil  # noqa: E402
+from qtpy.QtWidgets import QApplication, QVBoxLayout, QWidget  # noqa: E402
+
+from napari_toolkit.data_structs.table import setup_table, setup_tableview  # noqa: E402
+
+
+def _measure(create: Callable[[QVBoxLayout], QWidget]) -> dict:
+    """Seconds until the table is shown and the growth of the resident set size in MB."""
+    app = QApplication.instance()
+    process = psutil.Process()
+    container = QWidget()
+    layout = QVBoxLayout(container)
+    rss = process.memory_info().rss
+    start = time.perf_counter()
+    create(layout)
+    container.show()
+    app.processEvents()
+    duration = time.perf_counter() - start
+    memory = (process.memory_info().rss - rss) / 1024**2
+    container.close()
+    container.deleteLater()
+    app.processEvents()
+    return {"seconds": duration, "memory_mb": memory}
+
+
+def run(rows: List[int], columns: int = 10) -> dict:
+    """Measures both table implementations.
+
+    Args:
+        rows (List[int]): Numbers of rows to measure.
+        columns (int, optional): Number of float columns. Defaults to 10.
+
+    Returns:
+        dict: Mapping from table size to {"items": ..., "model": ...}.
+    """
+    results = {}
+    names = [f"property {j}" for j in range(columns)]
+    for n in rows:
+        data = np.zeros(n, dtype=[(name, np.float64) for name in names])
+        for name in names:
+            data[name] = np.random.rand(n)
+        nested = data.tolist()
+        results[f"{n} x {columns}"] = {
+            # The model is measured first, the item table could leave memory to be reused
+            "model": _measure(lambda layout, data=data: setup_tableview(layout, data)),
+            "items": _measure(lambda layout, nested=nested: setup_table(layout, nested, names)),
+        }
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000], help="Rows.")
+    parser.add_argument("--columns", type=int, default=10, help="Number of columns.")
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results.")
+    args = parser.parse_args(argv)
+
+    _app = QApplication.instance() or QApplication([])
+    results = run(args.rows, args.columns)
+
+    print(f"{'table':<18}{'items [s]':>12}{'model [s]':>12}{'items [MB]':>13}{'model [MB]':>13}")
+    for name, result in results.items():
+        items, model = result["items"], result["model"]
+        print(
+            f"{name:<18}{items['seconds']:>12.3f}{model['seconds']:>12.3f}"
+            f"{items['memory_mb']:>13.1f}{model['memory_mb']:>13.1f}"
+        )
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""Micro-benchmark of get_value/set_value throughput for all supported widget types.
+
+    python benchmarks/value_dispatch.py --number 20000 --output value_dispatch.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from typing import List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qtpy.QtWidgets import (  # noqa: E402
+    QApplication,
+    QCheckBox,
+    QComboBox,
+    QDateTimeEdit,
+    QDoubleSpinBox,
+    QLineEdit,
+    QPlainTextEdit,
+    QProgressBar,
+    QRadioButton,
+    QSlider,
+    QSpinBox,
+    QTextEdit,
+)
+
+from napari_toolkit.utils import get_value, set_value  # noqa: E402
+from napari_toolkit.widgets.buttons.toggle_button import QToggleButton  # noqa: E402
+from napari_toolkit.widgets.color.color_picker import QColorPicker  # noqa: E402
+from napari_toolkit.widgets.color.edit_color_picker import QEditColorPicker  # noqa: E402
+from napari_toolkit.widgets.file_select import QDirSelect, QFileSelect  # noqa: E402
+from napari_toolkit.widgets.progressbar.progress_edit import QProgressbarEdit  # noqa: E402
+from napari_toolkit.widgets.sliders.double_slider import QDoubleSlider  # noqa: E402
+from napari_toolkit.widgets.sliders.edit_slider import (  # noqa: E402
+    QEditDoubleSlider,
+    QEditSlider,
+)
+from napari_toolkit.widgets.sliders.labeled_slider import (  # noqa: E402
+    QLabeledDoubleSlider,
+    QLabeledSlider,
+)
+from napari_toolkit.widgets.switch import QHSwitch, QVSwitch  # noqa: E402
+
+WIDGETS = [
+    (QCheckBox, True),
+    (QRadioButton, True),
+    (QToggleButton, True),
+    (QLineEdit, "text"),
+    (QTextEdit, "text"),
+    (QPlainTextEdit, "text"),
+    (QSpinBox, 42),
+    (QDoubleSpinBox, 3.14),
+    (QSlider, 75),
+    (QDoubleSlider, 2.7),
+    (QLabeledSlider, 50),
+    (QLabeledDoubleSlider, 1.2),
+    (QEditSlider, 99),
+    (QEditDoubleSlider, 0.1),
+    (QProgressBar, 80),
+    (QProgressbarEdit, 60),
+    (QComboBox, "B"),
+    (QHSwitch, "B"),
+    (QVSwitch, "B"),
+    (QDateTimeEdit, "2025-02-10 14:30:00"),
+    (QFileSelect, "/home/user/file.txt"),
+    (QDirSelect, "/home/user/documents"),
+    (QColorPicker, (255, 0, 0)),
+    (QEditColorPicker, (0, 255, 255, 0.5)),
+]
+
+
+def run(number: int) -> dict:
+    """Measures get/set operations per second for every widget type.
+
+    Args:
+        number (int): Number of calls per measurement.
+
+    Returns:
+        dict: Mapping from widget type name to {"get_per_s", "set_per_s"}.
+    """
+    results = {}
+    for widget_cls, value in WIDGETS:
+        widget = widget_cls()
+        if isinstance(widget, (QComboBox, QHSwitch, QVSwitch)):
+            widget.addItems(["A", "B", "C"])
+        set_value(widget, value)
+
+        get_time = timeit.timeit(lambda w=widget: get_value(w), number=number)
+        set_time = timeit.timeit(lambda w=widget, v=value: set_value(w, v), number=number)
+        results[widget_cls.__name__] = {
+            "get_per_s": number / get_time,
+            "set_per_s": number / set_time,
+        }
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="Calls per measurement.")
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results.")
+    args = parser.parse_args(argv)
+
+    _app = QApplication.instance() or QApplication([])
+    results = run(args.number)
+
+    print(f"{'widget':<24}{'get/s':>14}{'set/s':>14}")
+    for name, result in results.items():
+        print(f"{name:<24}{result['get_per_s']:>14,.0f}{result['set_per_s']:>14,.0f}")
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def attach(
+    package_name: str, name_table: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """Creates lazy ``__getattr__``/``__dir__`` hooks for a package.
+
+    Each public name is mapped to the (relative) submodule which defines it. The submodule is
+    only imported the first time one of its names is accessed, afterwards the resolved object is
+    cached in the package namespace so ``__getattr__`` is not called again for this name.
+
+    Example usage:
+        ```python
+            _LAZY_IMPORTS = {"setup_checkbox": ".checkbox"}
+            __getattr__, __dir__, __all__ = attach(__name__, _LAZY_IMPORTS)
+        ```
+
+    Args:
+        package_name (str): The ``__name__`` of the package to attach the hooks to.
+        name_table (Dict[str, str]): Mapping from public name to the submodule defining it.
+
+    Returns:
+        Tuple[Callable, Callable, List[str]]: The ``__getattr__`` and ``__dir__`` functions and the
+        ``__all__`` list of the package.
+    """
+    __all__ = list(name_table)
+
+    def __getattr__(name: str) -> Any:
+        try:
+            submodule = name_table[name]
+        except KeyError:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}") from None
+
+        module = importlib.import_module(submodule, package_name)
+        value = getattr(module, name)
+        package = importlib.import_module(package_name)
+        setattr(package, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        package = importlib.import_module(package_name)
+        return sorted(set(vars(package)) | set(__all__))
+
+    return __getattr__, __dir__, __all__
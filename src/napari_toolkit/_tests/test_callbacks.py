@@ -0,0 +1,200 @@
+import gc
+import threading
+import time
+
+from qtpy.QtCore import QEvent
+from qtpy.QtWidgets import QApplication, QSpinBox, QVBoxLayout, QWidget
+
+from napari_toolkit.utils.background import is_cancelled
+from napari_toolkit.utils.instrumentation import get_callback_stats, reset_callback_stats
+from napari_toolkit.utils.utils import connect_widget
+from napari_toolkit.widgets import setup_editslider, setup_pushbutton, setup_spinbox
+from napari_toolkit.widgets.callback_stats import QCallbackStats
+
+
+def _setup_root(qtbot):
+    root = QWidget()
+    qtbot.addWidget(root)
+    QVBoxLayout(root)
+    return root
+
+
+def test_debounce_calls_once_with_latest_value(qtbot):
+    """Tests that a burst of value changes results in a single trailing call."""
+    calls = []
+    root = _setup_root(qtbot)
+    spinbox = setup_spinbox(root.layout(), 0, 100, function=calls.append, debounce_ms=30)
+
+    for value in range(1, 20):
+        spinbox.setValue(value)
+    assert calls == []
+
+    qtbot.waitUntil(lambda: calls == [19])
+    qtbot.wait(60)
+    assert calls == [19]
+
+
+def test_debounce_leading(qtbot):
+    """Tests that a leading debounce calls immediately and once more after the burst."""
+    calls = []
+    root = _setup_root(qtbot)
+    slider = setup_editslider(
+        root.layout(),
+        0,
+        10,
+        function=lambda: calls.append(slider.value()),
+        debounce_ms=30,
+        leading=True,
+    )
+    for value in range(1, 6):
+        slider.setValue(value)
+    assert calls == [1]
+
+    qtbot.waitUntil(lambda: calls == [1, 5])
+
+
+def test_throttle(qtbot):
+    """Tests that throttling calls immediately, then at most once per interval."""
+    calls = []
+    root = _setup_root(qtbot)
+    spinbox = setup_spinbox(root.layout(), 0, 100, function=calls.append, throttle_ms=50)
+
+    for value in range(1, 10):
+        spinbox.setValue(value)
+    assert calls == [1]
+
+    qtbot.waitUntil(lambda: calls == [1, 9])
+    spinbox.setValue(10)
+    assert calls == [1, 9]
+    qtbot.waitUntil(lambda: calls == [1, 9, 10])
+
+
+def test_scheduled_callback_drops_surplus_arguments(qtbot):
+    """Tests that callbacks without parameters work with signals that carry arguments."""
+    calls = []
+    root = _setup_root(qtbot)
+    button = setup_pushbutton(
+        root.layout(), "Run", function=lambda: calls.append(1), debounce_ms=10
+    )
+    button.click()
+    qtbot.waitUntil(lambda: calls == [1])
+
+
+def test_background_latest_wins(qtbot):
+    """Tests that only the result of the latest background run is delivered on the GUI thread."""
+    started, cancelled, results = [], [], []
+    main_thread = threading.current_thread()
+
+    def work(value):
+        started.append(value)
+        for _ in range(50):
+            if is_cancelled():
+                cancelled.append(value)
+                return value
+            time.sleep(0.005)
+        return value * 10
+
+    def on_result(result):
+        assert threading.current_thread() is main_thread
+        results.append(result)
+
+    root = _setup_root(qtbot)
+    spinbox = setup_spinbox(
+        root.layout(), 0, 100, function=work, background=True, on_result=on_result
+    )
+    for value in range(1, 4):
+        spinbox.setValue(value)
+
+    qtbot.waitUntil(lambda: results == [30], timeout=3000)
+    qtbot.waitUntil(lambda: len(cancelled) + 1 == len(started), timeout=3000)
+    qtbot.wait(50)
+    assert results == [30]
+    assert 3 not in cancelled
+
+
+def test_background_runs_do_not_overlap(qtbot):
+    """Tests that a worker ignoring `is_cancelled` never runs twice at the same time."""
+    lock = threading.Lock()
+    running, overlaps, started, results = [], [], [], []
+
+    def work(value):
+        with lock:
+            overlaps.append(len(running))
+            running.append(value)
+        started.append(value)
+        time.sleep(0.05)
+        with lock:
+            running.remove(value)
+        return value
+
+    root = _setup_root(qtbot)
+    spinbox = setup_spinbox(
+        root.layout(), 0, 100, function=work, background=True, on_result=results.append
+    )
+    for value in range(1, 6):
+        spinbox.setValue(value)
+        qtbot.wait(10)
+
+    qtbot.waitUntil(lambda: results == [5], timeout=3000)
+    qtbot.wait(100)
+    assert results == [5]
+    assert started == [1, 5]
+    assert max(overlaps) == 0
+
+
+def test_instrumentation(qtbot):
+    """Tests that instrumented callbacks are recorded per widget and setup function."""
+    root = _setup_root(qtbot)
+    spinbox = setup_spinbox(
+        root.layout(), 0, 100, function=lambda _: time.sleep(0.01), instrument=True
+    )
+    spinbox.setObjectName("threshold")
+    setup_pushbutton(root.layout(), "Run", function=lambda: None, instrument=True).click()
+    for value in range(1, 4):
+        spinbox.setValue(value)
+
+    rows = [row for row in get_callback_stats() if row["calls"]]
+    assert rows[0]["widget"] == "threshold"
+    assert rows[0]["setup"] == "setup_spinbox"
+    assert rows[0]["calls"] == 3
+    assert 10 <= rows[0]["mean_ms"] <= rows[0]["p95_ms"] <= rows[0]["max_ms"]
+    assert rows[1]["widget"] == "QPushButton"
+    assert rows[1]["setup"] == "setup_pushbutton"
+
+    table = QCallbackStats()
+    qtbot.addWidget(table)
+    assert table.table.item(0, 1).text() == "threshold"
+
+    reset_callback_stats()
+    assert all(row["calls"] == 0 for row in get_callback_stats())
+
+
+def test_instrumentation_of_deleted_widgets(qtbot):
+    """Tests that probes are released with their widget and named after the inner setup."""
+
+    def setup_panel(layout):
+        return setup_spinbox(layout, 0, 100, function=lambda _: None, instrument=True)
+
+    root = QWidget()
+    QVBoxLayout(root)
+    setup_panel(root.layout()).setObjectName("inner")
+    rows = [row for row in get_callback_stats() if row["widget"] == "inner"]
+    assert [row["setup"] for row in rows] == ["setup_spinbox"]
+
+    # Setup functions of plugins are not reported
+    namespace = {"__name__": "plugin", "connect_widget": connect_widget, "QSpinBox": QSpinBox}
+    exec(
+        "def setup_plugin(layout):\n"
+        "    spinbox = QSpinBox()\n"
+        "    return connect_widget(layout, spinbox, spinbox.valueChanged, print, instrument=True)",
+        namespace,
+    )
+    namespace["setup_plugin"](root.layout()).setObjectName("plugin")
+    rows = [row for row in get_callback_stats() if row["widget"] == "plugin"]
+    assert [row["setup"] for row in rows] == ["connect_widget"]
+
+    root.deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    del root
+    gc.collect()
+    assert not [row for row in get_callback_stats() if row["widget"] in ("inner", "plugin")]
@@ -0,0 +1,67 @@
+import pytest
+
+from napari_toolkit.widgets.progressbar.progress_edit import QProgressbarEdit
+from napari_toolkit.widgets.search_switch import QSearchSwitch
+from napari_toolkit.widgets.sliders.edit_slider import QEditDoubleSlider, QEditSlider
+from napari_toolkit.widgets.switch import QHSwitch, QVSwitch
+
+
+def _count(signal):
+    emitted = []
+    signal.connect(lambda *args: emitted.append(args))
+    return emitted
+
+
+@pytest.mark.parametrize(
+    "widget_cls,value,other",
+    [(QEditSlider, 10, 20), (QEditDoubleSlider, 10.5, 20.5), (QProgressbarEdit, 10, 20)],
+)
+def test_set_value_emits_on_change(qtbot, widget_cls, value, other):
+    """Tests that setValue only emits if the value changed, unless forced."""
+    widget = widget_cls()
+    qtbot.addWidget(widget)
+    emitted = _count(widget.index_changed)
+
+    widget.setValue(value)
+    widget.setValue(value)
+    widget.setValue(1000)  # out of range, ignored
+    assert len(emitted) == 1
+    widget.setValue(value, force=True)
+    assert len(emitted) == 2
+    widget.setValue(other)
+    assert len(emitted) == 3
+    assert widget.value() == other
+
+
+def test_edit_slider_release_emits_once(qtbot):
+    """Tests that a slider drag only updates the text and emits once when it is released."""
+    widget = QEditSlider()
+    qtbot.addWidget(widget)
+    emitted = _count(widget.index_changed)
+    edits = _count(widget.line_edit.textChanged)
+
+    for value in (1, 2, 3):
+        widget.slider.setValue(value)
+    widget.slider.sliderReleased.emit()
+    widget.slider.sliderReleased.emit()
+    assert len(emitted) == 1
+    assert len(edits) == 3
+    assert widget.value() == 3
+
+
+@pytest.mark.parametrize("widget_cls", [QHSwitch, QVSwitch, QSearchSwitch])
+def test_switch_emits_on_change(qtbot, widget_cls):
+    """Tests that selecting the current option of a switch does not emit clicked again."""
+    widget = widget_cls()
+    qtbot.addWidget(widget)
+    widget.addItems(["A", "B", "C"])
+    emitted = _count(widget.clicked)
+
+    widget.setCurrentIndex(1)
+    widget.setCurrentIndex(1)
+    assert len(emitted) == 1
+    widget.setCurrentIndex(1, force=True)
+    assert len(emitted) == 2
+    widget.next()
+    assert widget.currentIndex() == 2
+    assert len(emitted) == 3
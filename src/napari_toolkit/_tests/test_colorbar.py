@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+from qtpy.QtWidgets import QVBoxLayout, QWidget
+
+from napari_toolkit.widgets.color import colorbar
+from napari_toolkit.widgets.color.colorbar import (
+    QColorbar,
+    register_colorbar_backend,
+    set_colorbar_backend,
+    setup_colorbar,
+)
+
+
+@pytest.fixture
+def root(qtbot, monkeypatch):
+    """A widget with a layout, the registered and default backends are restored afterwards."""
+    monkeypatch.setattr(colorbar, "_COLORBAR_BACKENDS", dict(colorbar._COLORBAR_BACKENDS))
+    monkeypatch.setattr(colorbar, "_DEFAULT_BACKEND", colorbar._DEFAULT_BACKEND)
+    widget = QWidget()
+    QVBoxLayout(widget)
+    qtbot.addWidget(widget)
+    return widget
+
+
+@pytest.mark.parametrize(
+    "backend,widget_type", [("matplotlib", FigureCanvasQTAgg), ("napari", QColorbar)]
+)
+def test_backends_render(root, backend, widget_type):
+    """Tests that each backend renders the colormap from its low to its high end."""
+    widget = setup_colorbar(root.layout(), "gray", text_low="", text_high="", backend=backend)
+    assert isinstance(widget, widget_type)
+    assert root.layout().indexOf(widget) == 0
+
+    widget.resize(200, 30)
+    image = widget.grab().toImage()
+    y = image.height() // 2
+    low, high = image.pixelColor(5, y), image.pixelColor(image.width() - 5, y)
+    assert low.value() < 30
+    assert high.value() > 225
+
+
+def test_switch_and_register_backends(root):
+    """Tests that the default backend can be switched and custom backends registered."""
+    set_colorbar_backend("napari")
+    assert isinstance(setup_colorbar(root.layout()), QColorbar)
+
+    calls = []
+
+    def factory(**kwargs):
+        calls.append(kwargs)
+        return QWidget()
+
+    register_colorbar_backend("custom", factory)
+    setup_colorbar(root.layout(), "magma", backend="custom")
+    assert calls[0]["colormap"] == "magma"
+    set_colorbar_backend("custom")
+    setup_colorbar(root.layout())
+    assert len(calls) == 2
+
+
+def test_unknown_backend(root):
+    """Tests that unknown backend names raise a ValueError."""
+    with pytest.raises(ValueError, match="missing"):
+        set_colorbar_backend("missing")
+    with pytest.raises(ValueError, match="missing"):
+        setup_colorbar(root.layout(), backend="missing")
+    assert root.layout().count() == 0
+
+
+def test_qcolorbar_colors(qtbot):
+    """Tests that the colors of a QColorbar are stored as float RGBA array."""
+    widget = QColorbar([[0, 0, 0, 1], [1, 1, 1, 1]], figsize=(2, 0.5))
+    qtbot.addWidget(widget)
+    assert widget.colors.dtype == np.float64
+    assert (widget.sizeHint().width(), widget.sizeHint().height()) == (200, 50)
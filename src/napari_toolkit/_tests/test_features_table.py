@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+from napari.layers import Labels, Points
+from qtpy.QtWidgets import QVBoxLayout, QWidget
+
+from napari_toolkit.widgets.features_table import QFeaturesTable, setup_featurestable
+
+
+def _record(model):
+    signals = {"inserted": [], "removed": [], "changed": [], "reset": []}
+    model.rowsInserted.connect(lambda _, first, last: signals["inserted"].append((first, last)))
+    model.rowsRemoved.connect(lambda _, first, last: signals["removed"].append((first, last)))
+    model.dataChanged.connect(
+        lambda first, last, *args: signals["changed"].append((first.row(), last.row()))
+    )
+    model.modelReset.connect(lambda: signals["reset"].append(True))
+    return signals
+
+
+def _column(table, column):
+    model = table.model()
+    return [model.data(model.index(row, column)) for row in range(model.rowCount())]
+
+
+@pytest.fixture
+def points():
+    return Points(np.arange(20).reshape(10, 2), features={"id": np.arange(10)})
+
+
+def test_edits_are_applied_row_by_row(qtbot, points):
+    """Tests that adding, removing and changing objects does not reset the model."""
+    table = QFeaturesTable(layer=points)
+    qtbot.addWidget(table)
+    signals = _record(table.model())
+
+    points.add([[50, 50], [60, 60]])
+    assert signals["inserted"] == [(10, 11)]
+    points.selected_data = {2, 3, 7}
+    points.remove_selected()
+    assert signals["removed"] == [(7, 7), (2, 3)]
+    assert _column(table, 0) == ["0", "1", "4", "5", "6", "8", "9", "9", "9"]
+
+    features = points.features.copy()
+    features.loc[4, "id"] = 100
+    points.features = features
+    assert signals["changed"] == [(4, 4)]
+    assert table.model().data(table.model().index(4, 0)) == "100"
+
+    # In place changes of the selected points can only be signaled for all rows
+    points.selected_data = {1}
+    points.current_properties = {"id": np.array([42])}
+    assert signals["changed"][-1] == (0, 8)
+    assert table.model().data(table.model().index(1, 0)) == "42"
+
+    points.features = {"size": np.zeros(len(points.data))}
+    assert signals["reset"] == [True]
+    assert table.model().headerData(0, 1) == "size"
+
+
+def test_selection_is_synchronized(qtbot, points):
+    """Tests that rows and points are selected together in both directions."""
+    root = QWidget()
+    qtbot.addWidget(root)
+    selections = []
+    table = setup_featurestable(QVBoxLayout(root), points, function=selections.append)
+
+    points.selected_data = {1, 4, 5}
+    assert table.selectedRows() == [1, 4, 5]
+    table.selectRow(8)
+    assert points.selected_data == {8}
+    assert selections == [[1, 4, 5], [8]]
+
+    # The selection follows the removal of rows above it
+    points.selected_data = {0}
+    points.remove_selected()
+    points.selected_data = {7}
+    assert table.selectedRows() == [7]
+    assert table.model().rowCount() == 9
+
+
+def test_labels_selection(qtbot):
+    """Tests that the selected label is matched with the "index" feature."""
+    labels = Labels(np.zeros((4, 4), dtype=int), features={"index": [0, 3, 5], "area": [10, 2, 4]})
+    table = QFeaturesTable(layer=labels)
+    qtbot.addWidget(table)
+
+    labels.selected_label = 5
+    assert table.selectedRows() == [2]
+    table.selectRow(1)
+    assert labels.selected_label == 3
+
+    table.connect(None)
+    assert table.model().rowCount() == 0
+    labels.selected_label = 5
+    assert table.selectedRows() == []
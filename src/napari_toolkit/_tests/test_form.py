@@ -0,0 +1,161 @@
+import json
+
+from qtpy.QtCore import QEvent
+from qtpy.QtWidgets import QApplication, QVBoxLayout, QWidget
+
+from napari_toolkit.utils import form, persistence
+from napari_toolkit.utils.form import (
+    apply_values,
+    diff_values,
+    get_form_notifier,
+    get_values,
+    set_values,
+)
+from napari_toolkit.utils.persistence import QFormPersistence
+from napari_toolkit.widgets import (
+    setup_checkbox,
+    setup_editslider,
+    setup_hswitch,
+    setup_lineedit,
+    setup_spinbox,
+)
+
+
+def _setup_form(qtbot, calls):
+    """Creates a form with named widgets, each callback appends its name to calls."""
+    root = QWidget()
+    qtbot.addWidget(root)
+    layout = QVBoxLayout(root)
+
+    setup_spinbox(layout, 0, 100, default=5, function=lambda *_: calls.append("size"))
+    setup_hswitch(layout, ["A", "B", "C"], default=0, function=lambda *_: calls.append("mode"))
+    setup_checkbox(layout, "Flag", function=lambda *_: calls.append("flag"))
+    setup_editslider(layout, 0, 10, default=1, function=lambda *_: calls.append("slider"))
+    setup_lineedit(layout, "unnamed", function=lambda *_: calls.append("unnamed"))
+    for i, name in enumerate(["size", "mode", "flag", "slider"]):
+        layout.itemAt(i).widget().setObjectName(name)
+    return root
+
+
+def test_get_values(qtbot):
+    """Tests that only named widgets are part of the snapshot."""
+    root = _setup_form(qtbot, [])
+    assert get_values(root) == {"size": 5, "mode": ("A", 0), "flag": False, "slider": 1}
+
+
+def test_set_values_blocks_signals(qtbot):
+    """Tests that a bulk restore emits one form_changed signal instead of widget signals."""
+    calls = []
+    root = _setup_form(qtbot, calls)
+    changed_keys = []
+    get_form_notifier(root).form_changed.connect(changed_keys.append)
+
+    changed = set_values(
+        root, {"size": 42, "mode": ("C", 2), "flag": False, "slider": 7, "missing": 1}
+    )
+
+    assert changed == {"size", "mode", "slider"}
+    assert changed_keys == [{"size", "mode", "slider"}]
+    assert calls == []
+    assert get_values(root) == {"size": 42, "mode": ("C", 2), "flag": False, "slider": 7}
+
+
+def test_set_values_roundtrip(qtbot):
+    """Tests that restoring a snapshot of the current state changes nothing."""
+    root = _setup_form(qtbot, [])
+    changed_keys = []
+    get_form_notifier(root).form_changed.connect(changed_keys.append)
+
+    assert set_values(root, get_values(root)) == set()
+    assert changed_keys == []
+
+
+def test_apply_values_only_touches_differences(qtbot, monkeypatch):
+    """Tests that an incremental apply only sets widgets whose value differs."""
+    calls = []
+    root = _setup_form(qtbot, calls)
+    changed_keys = []
+    get_form_notifier(root).form_changed.connect(changed_keys.append)
+
+    touched = []
+    _set_value = form.set_value
+    monkeypatch.setattr(
+        form, "set_value", lambda w, v: (touched.append(w.objectName()), _set_value(w, v))
+    )
+
+    target = {"size": 5, "mode": "B", "flag": False, "slider": 1}
+    assert diff_values(root, target) == {"mode": (("A", 0), "B")}
+
+    diff = apply_values(root, target)
+
+    assert diff == {"mode": (("A", 0), ("B", 1))}
+    assert touched == ["mode"]
+    assert changed_keys == [{"mode"}]
+    assert calls == []
+    assert apply_values(root, target) == {}
+
+
+def test_persistence_debounced_write_and_restore(qtbot, monkeypatch, tmp_path):
+    """Tests that a burst of changes results in one write which can be restored."""
+    path = str(tmp_path / "state.json")
+    writes = []
+    _write_json = persistence._write_json
+    monkeypatch.setattr(
+        persistence, "_write_json", lambda p, s: (writes.append(s), _write_json(p, s))
+    )
+
+    root = _setup_form(qtbot, [])
+    store = QFormPersistence(root, path, delay_ms=50)
+    spinbox = root.layout().itemAt(0).widget()
+    for value in range(10, 20):
+        spinbox.setValue(value)
+    root.layout().itemAt(1).widget().setCurrentIndex(2)
+
+    qtbot.waitUntil(lambda: len(writes) == 1)
+    store.close()
+    assert writes == [{"size": 19, "mode": ("C", 2), "flag": False, "slider": 1}]
+
+    calls = []
+    restored = _setup_form(qtbot, calls)
+    store = QFormPersistence(restored, path, delay_ms=50)
+    assert store.restore() == {"size", "mode"}
+    assert get_values(restored) == {"size": 19, "mode": ("C", 2), "flag": False, "slider": 1}
+    assert calls == []
+    assert not store._timer.isActive()
+    store.close()
+
+
+def test_persistence_saves_single_widget_edits(qtbot, tmp_path):
+    """Tests that an edit of only a spinbox or only a checkbox is written."""
+    path = str(tmp_path / "state.json")
+    root = _setup_form(qtbot, [])
+    store = QFormPersistence(root, path, delay_ms=10)
+
+    root.layout().itemAt(0).widget().setValue(33)
+    qtbot.waitUntil(lambda: not store._timer.isActive())
+    store.close()
+    with open(path) as f:
+        assert json.load(f)["size"] == 33
+
+    store = QFormPersistence(root, path, delay_ms=10)
+    root.layout().itemAt(2).widget().setChecked(True)
+    assert store._timer.isActive()
+    store.close()
+    with open(path) as f:
+        assert json.load(f)["flag"] is True
+
+
+def test_persistence_writes_pending_edit_on_delete(qtbot, tmp_path):
+    """Tests that an edit scheduled before the root is deleted is still written."""
+    path = str(tmp_path / "state.json")
+    root = _setup_form(qtbot, [])
+    store = QFormPersistence(root, path, delay_ms=10_000)
+    root.layout().itemAt(0).widget().setValue(42)
+    assert store._timer.isActive()
+
+    root.deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    assert store._closed
+    assert store._executor._shutdown
+    with open(path) as f:
+        assert json.load(f)["size"] == 42
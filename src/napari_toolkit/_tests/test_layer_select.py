@@ -0,0 +1,209 @@
+import numpy as np
+import pytest
+from napari.components import ViewerModel
+from napari.layers import Image, Labels
+from napari.utils.events import EmitterGroup, EventedList
+
+from napari_toolkit.utils.layer_model import QLayerFilterProxyModel, get_layer_model
+from napari_toolkit.widgets.layer_select import QLayerSelect
+
+
+@pytest.fixture
+def viewer():
+    """A napari viewer model without a window."""
+    return ViewerModel()
+
+
+def _items(widget):
+    return [widget.itemText(i) for i in range(widget.count())]
+
+
+def _selector(qtbot, viewer, layer_type):
+    widget = QLayerSelect(layer_type=layer_type)
+    qtbot.addWidget(widget)
+    widget.connect(viewer)
+    return widget
+
+
+def test_selectors_share_one_model(qtbot, viewer):
+    """Tests that layer events are subscribed once per viewer, not once per selector."""
+    viewer.add_image(np.zeros((4, 4)), name="image")
+    callbacks = len(viewer.layers.events.inserted.callbacks)
+    selectors = [_selector(qtbot, viewer, Image) for _ in range(20)]
+
+    assert len(viewer.layers.events.inserted.callbacks) == callbacks + 1
+    assert len({id(s.model()) for s in selectors}) == 1
+    viewer.add_image(np.zeros((4, 4)), name="image 2")
+    assert all(_items(s) == ["image", "image 2"] for s in selectors)
+
+
+def test_selector_follows_layer_events(qtbot, viewer):
+    """Tests that inserts, removals, renames and moves are reflected per layer type."""
+    images = _selector(qtbot, viewer, Image)
+    labels = _selector(qtbot, viewer, Labels)
+    everything = _selector(qtbot, viewer, None)
+
+    viewer.add_image(np.zeros((4, 4)), name="a")
+    viewer.add_labels(np.zeros((4, 4), dtype=int), name="b")
+    viewer.add_image(np.zeros((4, 4)), name="c")
+    assert _items(images) == ["a", "c"]
+    assert _items(labels) == ["b"]
+    assert images.currentText() == "a"
+
+    viewer.layers["c"].name = "d"
+    assert _items(images) == ["a", "d"]
+    viewer.layers.move(2, 0)
+    assert _items(everything) == ["d", "a", "b"]
+    viewer.layers.reverse()
+    assert _items(everything) == ["b", "a", "d"]
+    assert images.currentText() == "a"
+
+    viewer.layers.remove("a")
+    assert _items(images) == ["d"]
+    assert images.currentText() == "d"
+    assert get_layer_model(viewer).rowCount() == 2
+
+
+class _Viewer:
+    def __init__(self):
+        self.layers = EventedList()
+
+
+class _Layer:
+    """A minimal layer with a name event, napari layers are too slow to create by thousands."""
+
+    def __init__(self, name):
+        self.events = EmitterGroup(source=self, name=None)
+        self._name = name
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+        self.events.name()
+
+
+def test_selector_tracks_layers_by_identity(qtbot):
+    """Tests duplicate names, renames and removals with 1000 layers."""
+    viewer = _Viewer()
+    layers = [_Layer(f"layer {i}") for i in range(1000)]
+    viewer.layers.extend(layers)
+    widget = _selector(qtbot, viewer, None)
+    model = get_layer_model(viewer)
+
+    duplicate = _Layer("layer 500")
+    viewer.layers.insert(10, duplicate)
+    assert widget.findLayer(duplicate) == 10
+    assert widget.findLayer(layers[500]) == 501
+    widget.setCurrentLayer(layers[500])
+    assert widget.currentText() == "layer 500"
+    assert widget.currentLayer() is layers[500]
+
+    viewer.layers.remove(duplicate)
+    assert widget.currentLayer() is layers[500]
+    assert widget.itemText(500) == "layer 500"
+    layers[999].name = "renamed"
+    assert widget.itemText(999) == "renamed"
+    layers[0].name = "layer 500"
+    viewer.layers.pop(0)
+    assert widget.currentLayer() is layers[500]
+    assert model.row(layers[0]) == -1
+    assert model.row(layers[999]) == 998
+    assert widget.count() == 999
+
+
+def test_coalesced_bursts(qtbot):
+    """Tests that bursts of layer events are applied in one batch with one notification."""
+    viewer = _Viewer()
+    viewer.layers.append(_Layer("first"))
+    widget = QLayerSelect(layer_type=None)
+    qtbot.addWidget(widget)
+    widget.connect(viewer, coalesce=True)
+    inserted, changed = [], []
+    widget.model().rowsInserted.connect(lambda *args: inserted.append(args))
+    widget.currentTextChanged.connect(changed.append)
+
+    layers = [_Layer(f"tile {i}") for i in range(500)]
+    for layer in layers:
+        viewer.layers.append(layer)
+    viewer.layers.insert(0, _Layer("front"))
+    assert widget.count() == 1
+    qtbot.waitUntil(lambda: widget.count() == 502)
+    assert len(inserted) == 2
+    assert changed == []
+    assert widget.currentText() == "first"
+
+    viewer.layers.move(2, 0)
+    viewer.layers.reverse()
+    widget.model().sourceModel().flush()
+    assert widget.itemText(0) == "tile 499"
+    assert widget.itemText(501) == "tile 0"
+    assert widget.currentText() == "first"
+    assert changed == []
+
+    viewer.layers.clear()
+    viewer.layers.append(_Layer("new"))
+    qtbot.waitUntil(lambda: widget.count() == 1)
+    assert changed == ["new"]
+
+
+def test_failed_batch_releases_signals(qtbot, monkeypatch):
+    """Tests that a failing batch does not leave the selectors with blocked signals."""
+    viewer = _Viewer()
+    widget = QLayerSelect(layer_type=None)
+    qtbot.addWidget(widget)
+    widget.connect(viewer, coalesce=True)
+    model = widget.model().sourceModel()
+
+    def _track(layer):
+        raise ValueError("broken layer")
+
+    monkeypatch.setattr(model, "_track", _track)
+    viewer.layers.append(_Layer("broken"))
+    with pytest.raises(ValueError):
+        model.flush()
+    assert not widget.signalsBlocked()
+
+    # Signals blocked by the caller stay blocked
+    monkeypatch.undo()
+    widget.blockSignals(True)
+    viewer.layers.append(_Layer("layer"))
+    model.flush()
+    assert widget.signalsBlocked()
+
+
+def test_predicate_filters_on_layer_info(qtbot, viewer):
+    """Tests predicates on the metadata index, updated by data, scale and metadata events."""
+    image = viewer.add_image(np.zeros((4, 8, 8), dtype=np.float32), name="image")
+    viewer.add_labels(np.zeros((4, 8, 8), dtype=np.uint8), name="match")
+    viewer.add_labels(np.zeros((8, 8), dtype=np.uint8), name="2d")
+    model = get_layer_model(viewer)
+    same_shape = QLayerSelect(
+        layer_type=Labels, predicate=lambda info: info.shape == model.info(image).shape
+    )
+    qtbot.addWidget(same_shape)
+    same_shape.connect(viewer)
+    tagged = _selector(qtbot, viewer, None)
+    tagged.setPredicate(lambda info: "spacing" in info.metadata_keys)
+
+    assert model.info(image).dtype == np.float32
+    assert same_shape.model().info(image) == model.info(image)
+    assert QLayerFilterProxyModel(Labels).info(image) is None
+    assert model.info(image).ndim == 3
+    assert _items(same_shape) == ["match"]
+    assert _items(tagged) == []
+
+    viewer.layers["2d"].metadata = {"spacing": 1}
+    viewer.layers["2d"].data = np.zeros((4, 8, 8), dtype=np.uint8)
+    assert _items(tagged) == ["2d"]
+    assert _items(same_shape) == ["match", "2d"]
+
+    # Predicates on other layers are re-evaluated when that layer changes
+    image.data = np.zeros((8, 8), dtype=np.float32)
+    assert _items(same_shape) == []
+    viewer.layers.remove("2d")
+    assert _items(tagged) == []
+    assert model.info(viewer.layers["match"]).scale == (1.0, 1.0, 1.0)
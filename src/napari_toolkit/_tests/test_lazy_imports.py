@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+import pytest
+
+import napari_toolkit.containers
+import napari_toolkit.data_structs
+import napari_toolkit.utils
+import napari_toolkit.widgets
+
+
+def _loaded_modules(code: str) -> set:
+    """Runs the code in a fresh interpreter and returns the names of all loaded modules."""
+    script = f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+def _is_heavy(name: str) -> bool:
+    return name.split(".")[0] in ("matplotlib", "napari")
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import napari_toolkit.widgets",
+        "import napari_toolkit.containers",
+        "import napari_toolkit.data_structs",
+        "import napari_toolkit.utils",
+        "from napari_toolkit.widgets import setup_checkbox",
+        "from napari_toolkit.widgets import setup_colorbar",
+    ],
+)
+def test_import_is_lightweight(code):
+    """Tests that importing the packages does not pull in matplotlib or napari."""
+    heavy = sorted(name for name in _loaded_modules(code) if _is_heavy(name))
+    assert heavy == [], f"'{code}' loaded {heavy}"
+
+
+@pytest.mark.parametrize(
+    "package",
+    [
+        napari_toolkit.widgets,
+        napari_toolkit.containers,
+        napari_toolkit.data_structs,
+        napari_toolkit.utils,
+    ],
+)
+def test_lazy_exports_resolve(package):
+    """Tests that every name in __all__ resolves and is listed by dir()."""
+    for name in package.__all__:
+        assert callable(getattr(package, name)), f"{package.__name__}.{name} is not callable"
+        assert name in dir(package)
+
+    with pytest.raises(AttributeError):
+        package.does_not_exist  # noqa: B018
@@ -0,0 +1,101 @@
+import gc
+
+import numpy as np
+from napari.components import ViewerModel
+from qtpy.QtCore import QEvent
+from qtpy.QtWidgets import QApplication, QVBoxLayout, QWidget
+
+from napari_toolkit.utils.layer_model import get_layer_model
+from napari_toolkit.utils.lifecycle import (
+    add_teardown,
+    connect_tracked,
+    disconnect_tracked,
+    remove_teardown,
+    tracked_count,
+)
+from napari_toolkit.utils.theme import get_theme_broadcaster
+from napari_toolkit.widgets.layer_select import setup_layerselect
+from napari_toolkit.widgets.switch import setup_hswitch
+
+
+class _Panel(QWidget):
+    """A plugin panel with layer selectors, a themed switch and own napari connections."""
+
+    def __init__(self, viewer, layer):
+        super().__init__()
+        self.events = []
+        layout = QVBoxLayout(self)
+        setup_layerselect(layout, viewer)
+        setup_hswitch(layout, ["A", "B"])
+        connect_tracked(self, viewer.layers.events.inserted, self._on_inserted)
+        connect_tracked(self, layer.events.name, self._on_inserted)
+
+    def _on_inserted(self, event):
+        self.events.append(event)
+
+
+def _delete(widget):
+    widget.deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+def _counts(viewer, layer):
+    gc.collect()
+    return (
+        len(viewer.layers.events.inserted.callbacks),
+        len(layer.events.name.callbacks),
+        len(get_theme_broadcaster()),
+    )
+
+
+def test_teardown_on_destroyed(qtbot):
+    """Tests that teardowns are called once on destruction and can be removed before."""
+    owner = QWidget()
+    calls = []
+    add_teardown(owner, lambda: calls.append("a"))
+    key = add_teardown(owner, lambda: calls.append("b"))
+    assert tracked_count(owner) == 2
+
+    remove_teardown(owner, key)
+    _delete(owner)
+    assert calls == ["a"]
+
+
+def test_disconnect_tracked(qtbot):
+    """Tests that a tracked connection can be removed before the owner is destroyed."""
+    viewer = ViewerModel()
+    owner = QWidget()
+    qtbot.addWidget(owner)
+    events = []
+    callbacks = len(viewer.layers.events.inserted.callbacks)
+
+    connect_tracked(owner, viewer.layers.events.inserted, events.append)
+    assert len(viewer.layers.events.inserted.callbacks) == callbacks + 1
+    disconnect_tracked(owner, viewer.layers.events.inserted, events.append)
+    assert len(viewer.layers.events.inserted.callbacks) == callbacks
+    assert tracked_count(owner) == 0
+    viewer.add_image(np.zeros((4, 4)))
+    assert events == []
+
+
+def test_rebuilt_panels_do_not_leak_listeners(qtbot):
+    """Tests that closing and reopening a panel 1000 times keeps the listener counts flat."""
+    viewer = ViewerModel()
+    layer = viewer.add_image(np.zeros((4, 4)), name="image")
+    _delete(_Panel(viewer, layer))
+    baseline = _counts(viewer, layer)
+
+    for _ in range(1000):
+        panel = _Panel(viewer, layer)
+        assert tracked_count(panel) == 2
+        _delete(panel)
+    del panel
+    assert _counts(viewer, layer) == baseline
+
+    # The shared layer model is still connected once and keeps working
+    panel = _Panel(viewer, layer)
+    qtbot.addWidget(panel)
+    viewer.add_image(np.zeros((4, 4)), name="image 2")
+    layer.name = "renamed"
+    assert len(panel.events) == 2
+    assert get_layer_model(viewer).rowCount() == 2
@@ -0,0 +1,108 @@
+import pytest
+from qtpy.QtCore import QEvent
+from qtpy.QtWidgets import QApplication, QShortcut, QVBoxLayout, QWidget
+
+from napari_toolkit.utils.shortcuts import QShortcutManager, get_shortcut_manager
+from napari_toolkit.widgets.buttons.push_button import setup_pushbutton
+from napari_toolkit.widgets.switch import setup_hswitch
+
+
+def _setup_root(qtbot):
+    root = QWidget()
+    QVBoxLayout(root)
+    qtbot.addWidget(root)
+    root.show()
+    return root
+
+
+def _activate(manager, root, sequence):
+    table = manager._tables[id(root)]
+    manager._dispatch(table, sequence)
+
+
+def test_one_qshortcut_per_window_and_sequence(qtbot):
+    """Tests that widgets of a window share the QShortcuts of its dispatch table."""
+    root = _setup_root(qtbot)
+    calls = []
+    setup_pushbutton(root.layout(), "A", function=lambda: calls.append("a"), shortcut="Ctrl+J")
+    setup_hswitch(root.layout(), ["X", "Y"], default=0, shortcut="Ctrl+K")
+    # Children added to a visible widget are shown with the next event loop iteration
+    QApplication.processEvents()
+
+    assert len(root.findChildren(QShortcut)) == 2
+    _activate(get_shortcut_manager(), root, "Ctrl+J")
+    assert calls == ["a"]
+
+
+def test_duplicates_are_reported(qtbot):
+    """Tests that a sequence used twice in a window warns and dispatches to the latest one."""
+    manager = QShortcutManager()
+    root = _setup_root(qtbot)
+    first, second = QWidget(root), QWidget(root)
+    first.show()
+    second.show()
+    calls = []
+    manager.register(first, "Ctrl+D", lambda: calls.append(1))
+    with pytest.warns(UserWarning, match="Ctrl\\+D"):
+        manager.register(second, "ctrl+d", lambda: calls.append(2))
+
+    _activate(manager, root, "Ctrl+D")
+    second.setEnabled(False)
+    _activate(manager, root, "Ctrl+D")
+    assert calls == [2, 1]
+
+
+def test_group_enabled(qtbot):
+    """Tests that a group of shortcuts can be disabled and enabled in one call."""
+    manager = QShortcutManager()
+    root = _setup_root(qtbot)
+    calls = []
+    manager.register(root, "Ctrl+G", lambda: calls.append(1), group="plugin")
+
+    manager.set_group_enabled("plugin", False)
+    assert not manager._tables[id(root)].shortcuts["Ctrl+G"].isEnabled()
+    _activate(manager, root, "Ctrl+G")
+    manager.set_group_enabled("plugin", True)
+    assert manager._tables[id(root)].shortcuts["Ctrl+G"].isEnabled()
+    _activate(manager, root, "Ctrl+G")
+    assert calls == [1]
+
+
+def test_unregister_on_destroy(qtbot):
+    """Tests that shortcuts of deleted widgets are removed."""
+    manager = QShortcutManager()
+    root = _setup_root(qtbot)
+    widget = QWidget(root)
+    widget.show()
+    manager.register(widget, "Ctrl+U", lambda: None)
+    assert manager.shortcuts() == ["Ctrl+U"]
+
+    widget.deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    assert manager.shortcuts() == []
+    assert "Ctrl+U" not in manager._tables[id(root)].shortcuts
+
+
+def test_window_is_resolved_when_shown(qtbot):
+    """Tests that widgets of a layout attached to a window later share its dispatch table."""
+    manager = get_shortcut_manager()
+    layout = QVBoxLayout()
+    calls = []
+    setup_pushbutton(layout, "A", function=lambda: calls.append("a"), shortcut="Ctrl+L")
+    setup_pushbutton(layout, "B", function=lambda: calls.append("b"), shortcut="Ctrl+L")
+    root = QWidget()
+    qtbot.addWidget(root)
+    root.setLayout(layout)
+    with pytest.warns(UserWarning, match="Ctrl\\+L"):
+        root.show()
+    assert len(root.findChildren(QShortcut)) == 1
+    _activate(manager, root, "Ctrl+L")
+    assert calls == ["b"]
+
+    # Docking the panel into another window moves its shortcuts
+    window = _setup_root(qtbot)
+    with pytest.warns(UserWarning, match="Ctrl\\+L"):
+        window.layout().addWidget(root)
+        root.show()
+    assert list(manager._tables[id(window)].shortcuts) == ["Ctrl+L"]
+    assert "Ctrl+L" not in manager._tables[id(root)].shortcuts
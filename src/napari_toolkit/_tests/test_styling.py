@@ -0,0 +1,31 @@
+from napari_toolkit.utils.styling import ACTIVE_PROPERTY, CHECKED_STATE
+from napari_toolkit.widgets.buttons.toggle_button import QToggleButton
+from napari_toolkit.widgets.switch import QHSwitch
+
+
+def test_switch_highlight_is_property_driven(qtbot):
+    """Tests that selecting an option flips properties instead of setting stylesheets."""
+    switch = QHSwitch()
+    qtbot.addWidget(switch)
+    switch.addItems(["A", "B", "C"])
+    stylesheet = switch.styleSheet()
+    assert ACTIVE_PROPERTY in stylesheet
+
+    switch.buttons[1].click()
+    assert [bool(b.property(ACTIVE_PROPERTY)) for b in switch.buttons] == [False, True, False]
+    switch.setCurrentIndex(2)
+    assert [bool(b.property(ACTIVE_PROPERTY)) for b in switch.buttons] == [False, False, True]
+    assert switch.styleSheet() == stylesheet
+    assert all(b.styleSheet() == "" for b in switch.buttons)
+
+
+def test_togglebutton_highlight_follows_checked_state(qtbot):
+    """Tests that toggling does not touch the stylesheet of a toggle button."""
+    button = QToggleButton()
+    qtbot.addWidget(button)
+    stylesheet = button.styleSheet()
+    assert CHECKED_STATE in stylesheet
+
+    button.click()
+    button.setChecked(False)
+    assert button.styleSheet() == stylesheet
@@ -0,0 +1,114 @@
+from qtpy.QtCore import Qt
+
+from napari_toolkit.widgets import switch
+from napari_toolkit.widgets.search_switch import QSearchSwitch
+from napari_toolkit.widgets.switch import QHSwitch, QVSwitch
+
+
+def test_switch_selection_touches_two_buttons(qtbot, monkeypatch):
+    """Tests that a selection change restyles only the previous and the new button."""
+    widget = QVSwitch()
+    qtbot.addWidget(widget)
+    widget.addItems([f"class {i}" for i in range(300)])
+    widget.setCurrentIndex(10)
+    clicked = []
+    widget.clicked.connect(lambda: clicked.append(widget.currentIndex()))
+
+    touched = []
+    _set_active = switch.set_active
+    monkeypatch.setattr(
+        switch, "set_active", lambda btn, active: (touched.append(btn), _set_active(btn, active))
+    )
+    widget.buttons[250].click()
+
+    assert touched == [widget.buttons[10], widget.buttons[250]]
+    assert clicked == [250]
+
+    # Pressing the active button again emits without restyling
+    widget.buttons[250].click()
+    assert touched == [widget.buttons[10], widget.buttons[250]]
+    assert clicked == [250, 250]
+    widget.setCurrentIndex(250)
+    assert clicked == [250, 250]
+    assert (widget.currentText(), widget.currentIndex()) == ("class 250", 250)
+    assert widget.findText("class 299") == 299
+    assert widget.findText("missing") == -1
+
+
+def test_switch_set_items(qtbot):
+    """Tests that setItems replaces all options and keeps the current option."""
+    widget = QHSwitch()
+    qtbot.addWidget(widget)
+    widget.addItems(["A", "B", "C"])
+    widget.setCurrentIndex(1)
+
+    widget.setItems(["X", "B"])
+    assert widget.options == ["X", "B"]
+    assert len(widget.buttons) == 2
+    assert (widget.currentText(), widget.currentIndex()) == ("B", 1)
+    assert widget.findText("A") == -1
+
+    widget.setItems(["Y"])
+    assert widget.currentIndex() is None
+    widget.buttons[0].click()
+    assert widget.currentText() == "Y"
+
+
+def test_search_switch(qtbot):
+    """Tests filtering, selection and next on a switch with many options."""
+    widget = QSearchSwitch()
+    qtbot.addWidget(widget)
+    widget.addItems([f"class {i}" for i in range(5000)])
+    clicked = []
+    widget.clicked.connect(lambda: clicked.append(widget.currentIndex()))
+
+    widget.setCurrentIndex(4321)
+    assert (widget.currentText(), widget.currentIndex()) == ("class 4321", 4321)
+    assert widget.findText("class 4999") == 4999
+
+    widget.filter_edit.setText("class 12")
+    assert widget.view.model().rowCount() == 111
+    assert not widget.view.selectionModel().hasSelection()
+
+    widget.next()
+    assert widget.currentText() == "class 12"
+    widget.next()
+    assert widget.currentText() == "class 120"
+    widget._on_item_pressed(widget.view.model().index(5, 0))
+    assert widget.currentText() == "class 124"
+    assert widget.view.currentIndex().data() == "class 124"
+    assert clicked == [4321, 12, 120, 124]
+
+    widget.setFilterText("")
+    assert widget.view.model().rowCount() == 5000
+    assert widget.view.currentIndex().row() == 124
+
+
+def test_search_switch_user_input(qtbot):
+    """Tests that clicks emit like switch buttons and arrow keys select the options."""
+    widget = QSearchSwitch()
+    qtbot.addWidget(widget)
+    widget.addItems([f"class {i}" for i in range(20)])
+    widget.show()
+    qtbot.waitExposed(widget)
+    clicked = []
+    widget.clicked.connect(lambda: clicked.append(widget.currentIndex()))
+
+    def click(row):
+        rect = widget.view.visualRect(widget.view.model().index(row, 0))
+        qtbot.mouseClick(widget.view.viewport(), Qt.LeftButton, pos=rect.center())
+
+    click(3)
+    click(3)
+    click(4)
+    assert clicked == [3, 3, 4]
+
+    widget.view.setFocus()
+    qtbot.keyClick(widget.view, Qt.Key_Right)
+    assert (widget.currentText(), widget.currentIndex()) == ("class 5", 5)
+    assert clicked == [3, 3, 4, 5]
+
+    # Filtering moves the current index of the view without selecting another option
+    widget.setFilterText("class 1")
+    assert widget.currentIndex() == 5
+    assert clicked == [3, 3, 4, 5]
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from qtpy.QtCore import Qt
+from qtpy.QtGui import QStandardItemModel
+from qtpy.QtWidgets import QVBoxLayout, QWidget
+
+from napari_toolkit.data_structs.table import setup_tableview
+from napari_toolkit.data_structs.table_model import QArrayTableModel
+
+
+def _cell(model, row, column, role=Qt.DisplayRole):
+    return model.data(model.index(row, column), role)
+
+
+def _region_props(rows):
+    data = np.zeros(rows, dtype=[("label", np.int32), ("area", np.float64), ("name", "U8")])
+    data["label"] = np.arange(rows)
+    data["area"] = np.arange(rows) * 0.5
+    data["name"] = "cell"
+    return data
+
+
+@pytest.fixture
+def root(qtbot):
+    widget = QWidget()
+    widget.setLayout(QVBoxLayout())
+    qtbot.addWidget(widget)
+    return widget
+
+
+def test_structured_array_is_not_copied(root):
+    """Tests that a large structured array is shown through views of its columns."""
+    data = _region_props(1_000_000)
+    view = setup_tableview(root.layout(), data)
+    model = view.model()
+
+    assert (model.rowCount(), model.columnCount()) == (1_000_000, 3)
+    assert model.headerData(1, Qt.Horizontal) == "area"
+    assert model.headerData(0, Qt.Vertical) == "1"
+    assert np.shares_memory(model.column(0), data)
+    assert _cell(model, 999_999, 1) == "499999.5"
+    assert _cell(model, 3, 0, Qt.EditRole) == 3
+    assert type(_cell(model, 3, 0, Qt.EditRole)) is int
+
+
+@pytest.mark.parametrize(
+    "data,header",
+    [
+        ({"label": np.arange(3), "area": [1.5, 2.5, 3.5]}, ["label", "area"]),
+        (np.arange(6).reshape(3, 2) // 2, ["1", "2"]),
+        ([[0, 1.5], [1, 2.5], [2]], ["1", "2"]),
+    ],
+)
+def test_sources(data, header):
+    """Tests dicts of columns, 2D arrays and nested lists (rows may be shorter)."""
+    model = QArrayTableModel(data)
+    assert model.rowCount() == 3
+    assert [model.headerData(j, Qt.Horizontal) for j in range(model.columnCount())] == header
+    assert _cell(model, 1, 0) == "1"
+    assert model.rowCount(model.index(0, 0)) == 0
+
+
+def test_dataframe_edit():
+    """Tests that edits are converted to the column dtype and written to a DataFrame."""
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame({"label": [1, 2], "area": [0.5, 1.5]})
+    model = QArrayTableModel(frame, editable=True)
+    changed = []
+    model.dataChanged.connect(lambda *args: changed.append(args))
+
+    assert model.flags(model.index(0, 0)) & Qt.ItemIsEditable
+    assert model.setData(model.index(1, 1), "2.25")
+    assert frame["area"].tolist() == [0.5, 2.25]
+    assert _cell(model, 1, 1) == "2.25"
+    assert not model.setData(model.index(0, 0), "not a number")
+    assert len(changed) == 1
+
+
+def test_readonly_and_custom_model(root):
+    """Tests that read-only models reject edits and that a custom model can be passed."""
+    model = QArrayTableModel(_region_props(2))
+    assert not model.flags(model.index(0, 0)) & Qt.ItemIsEditable
+    assert not model.setData(model.index(0, 0), 5)
+    model.setSource({"a": [1]}, header=["A"])
+    assert model.headerData(0, Qt.Horizontal) == "A"
+    assert _cell(model, 0, 0) == "1"
+
+    custom = QStandardItemModel(2, 2)
+    view = setup_tableview(root.layout(), None, model=custom)
+    assert view.model() is custom
+
+
+def test_tableview_function_on_selection(root):
+    """Tests that the function of the table view is called when the selection changes."""
+    rows = []
+
+    def on_selection(selected, deselected):
+        rows.append([index.row() for index in view.selectionModel().selectedRows()])
+
+    view = setup_tableview(root.layout(), _region_props(10), function=on_selection)
+    view.selectRow(3)
+    view.selectRow(5)
+    assert rows == [[3], [5]]
+
+
+def test_tableview_forwards_callback_options(root, qtbot):
+    """Tests that callback options like debouncing are forwarded to `connect_widget`."""
+    calls = []
+    view = setup_tableview(
+        root.layout(), _region_props(10), function=lambda *_: calls.append(1), debounce_ms=20
+    )
+    for row in range(5):
+        view.selectRow(row)
+    assert calls == []
+    qtbot.waitUntil(lambda: calls == [1])
@@ -0,0 +1,129 @@
+import gc
+import sys
+
+from napari.settings import get_settings
+from napari.utils.theme import get_theme, register_theme, unregister_theme
+from qtpy.QtCore import QEvent
+from qtpy.QtWidgets import QApplication
+
+from napari_toolkit.utils import theme
+from napari_toolkit.utils.theme import (
+    connect_theme_change,
+    disconnect_theme_change,
+    get_theme_broadcaster,
+    get_theme_colors,
+    get_theme_palette,
+)
+from napari_toolkit.widgets.buttons.toggle_button import QToggleButton
+from napari_toolkit.widgets.switch import QHSwitch
+
+
+def _flush_deleted():
+    QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    gc.collect()
+
+
+class _Listener:
+    def __init__(self):
+        self.calls = 0
+
+    def on_theme_change(self):
+        self.calls += 1
+
+
+def test_theme_listeners_are_released(qtbot):
+    """Tests that rebuilt widgets do not accumulate theme listeners."""
+    _flush_deleted()
+    broadcaster = get_theme_broadcaster()
+    n_listeners = len(broadcaster)
+
+    for _ in range(100):
+        for widget in [QToggleButton(), QHSwitch()]:
+            widget.deleteLater()
+        del widget
+        QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    _flush_deleted()
+
+    assert len(broadcaster) == n_listeners
+
+
+def test_theme_change_is_broadcast_once(qtbot):
+    """Tests that a burst of theme events calls each live listener once."""
+    listener, dead_listener = _Listener(), _Listener()
+    connect_theme_change(listener.on_theme_change)
+    connect_theme_change(dead_listener.on_theme_change)
+    n_listeners = len(get_theme_broadcaster())
+    del dead_listener
+    assert len(get_theme_broadcaster()) == n_listeners - 1
+
+    event = get_settings().appearance.events.theme
+    for _ in range(3):
+        event(value=get_settings().appearance.theme)
+    qtbot.waitUntil(lambda: listener.calls > 0)
+    qtbot.wait(10)
+    assert listener.calls == 1
+
+
+def test_theme_colors_are_cached(monkeypatch):
+    """Tests that theme lookups are cached until a theme is (re)registered."""
+    lookups = []
+    _get_theme = theme.get_theme
+    monkeypatch.setattr(
+        theme, "get_theme", lambda name: (lookups.append(name), _get_theme(name))[1]
+    )
+    theme._invalidate_theme_cache()
+
+    palette = get_theme_palette()
+    for _ in range(100):
+        assert get_theme_palette() is palette
+        assert get_theme_colors().highlight.as_rgb() == palette.highlight
+    assert len(lookups) == 1
+    assert palette.disabled not in (palette.text, palette.foreground)
+
+    custom = get_theme("dark")
+    custom.id = "toolkit_test"
+    register_theme("toolkit_test", custom, "toolkit_test")
+    try:
+        get_theme_palette()
+        assert len(lookups) == 2
+    finally:
+        unregister_theme("toolkit_test")
+
+
+def test_theme_listeners_get_the_event_and_are_isolated(qtbot, monkeypatch):
+    """Tests that listeners receive the theme event and a failing one does not stop others."""
+    events, errors = [], []
+    monkeypatch.setattr(sys, "excepthook", lambda *exc_info: errors.append(exc_info[0]))
+    listener = _Listener()
+
+    def failing(event):
+        raise ValueError("broken listener")
+
+    keys = [connect_theme_change(funct) for funct in (failing, events.append)]
+    connect_theme_change(listener.on_theme_change)
+    try:
+        get_settings().appearance.events.theme(value=get_settings().appearance.theme)
+        get_theme_broadcaster().broadcast()
+    finally:
+        for key in keys:
+            disconnect_theme_change(key)
+    assert errors == [ValueError]
+    assert events[0].value == get_settings().appearance.theme
+    assert listener.calls == 1
+
+
+def test_theme_colors_without_theme_registry(monkeypatch):
+    """Tests that themes are not cached if registered themes can not be observed."""
+    lookups = []
+    _get_theme = theme.get_theme
+    monkeypatch.setattr(
+        theme, "get_theme", lambda name: (lookups.append(name), _get_theme(name))[1]
+    )
+    monkeypatch.setattr(theme, "_themes", None)
+    monkeypatch.setattr(theme, "_cache_connected", False)
+    monkeypatch.setattr(theme, "_cache_enabled", True)
+    theme._invalidate_theme_cache()
+
+    assert get_theme_palette() == get_theme_palette()
+    assert len(lookups) == 2
+    assert not theme._THEME_CACHE
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+from napari.components import ViewerModel
+
+from napari_toolkit.utils import thumbnails
+from napari_toolkit.utils.thumbnails import QThumbnailCache, get_thumbnail_cache
+from napari_toolkit.widgets.layer_select import QLayerSelect
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """Records the sources of all rendered thumbnails."""
+    sources = []
+    _render = thumbnails._render
+
+    def render(source, *args):
+        sources.append(source)
+        return _render(source, *args)
+
+    monkeypatch.setattr(thumbnails, "_render", render)
+    return sources
+
+
+def _wait_rendered(qtbot, cache, layer):
+    with qtbot.waitSignal(cache.thumbnail_ready):
+        assert cache.request(layer) is None
+    return cache.cached(layer)
+
+
+def test_thumbnails_are_rendered_once_per_state(qtbot, renders):
+    """Tests that thumbnails are cached per data version and contrast limits."""
+    layer = ViewerModel().add_image(np.random.rand(64, 128))
+    cache = QThumbnailCache()
+
+    pixmap = _wait_rendered(qtbot, cache, layer)
+    assert max(pixmap.width(), pixmap.height()) <= cache.size
+    assert cache.request(layer) is pixmap
+    assert len(renders) == 1
+
+    layer.contrast_limits = (0.2, 0.8)
+    assert cache.cached(layer) is None
+    _wait_rendered(qtbot, cache, layer)
+    layer.data = np.random.rand(64, 64)
+    assert cache.cached(layer) is None
+    _wait_rendered(qtbot, cache, layer)
+    assert len(renders) == 3
+    assert len(cache) == 1
+
+
+def test_thumbnails_follow_visual_changes(qtbot):
+    """Tests that colormap changes and in-place label edits invalidate the thumbnail."""
+    viewer = ViewerModel()
+    image = viewer.add_image(np.random.rand(16, 16))
+    cache = QThumbnailCache()
+    grey = _wait_rendered(qtbot, cache, image).toImage().pixelColor(4, 4)
+
+    image.colormap = "red"
+    assert cache.cached(image) is None
+    red = _wait_rendered(qtbot, cache, image).toImage().pixelColor(4, 4)
+    assert (red.green(), red.blue()) == (0, 0)
+    assert grey.red() == grey.green() == grey.blue()
+
+    labels = viewer.add_labels(np.zeros((16, 16), dtype=np.uint8))
+    before = _wait_rendered(qtbot, cache, labels).toImage()
+    labels.paint((8, 8), 3, refresh=True)
+    assert cache.cached(labels) is None
+    after = _wait_rendered(qtbot, cache, labels).toImage()
+    assert after != before
+
+
+def test_thumbnail_from_strided_data():
+    """Tests the fallback to a downsample of the central plane for layers without thumbnail."""
+    data = np.zeros((5, 1000, 500), dtype=np.uint16)
+    data[2, :, 250:] = 100
+    image = thumbnails._render(data, False, (0.0, 100.0), 32)
+    assert (image.width(), image.height()) == (16, 32)
+    assert image.pixelColor(2, 2).value() == 0
+    assert image.pixelColor(13, 2).value() == 255
+
+
+def test_lru_byte_budget(qtbot):
+    """Tests that the least recently used thumbnails are dropped above the byte budget."""
+    viewer = ViewerModel()
+    layers = [viewer.add_image(np.random.rand(32, 32)) for _ in range(3)]
+    cache = QThumbnailCache(max_bytes=2 * 32 * 32 * 4)
+    for layer in layers[:2]:
+        _wait_rendered(qtbot, cache, layer)
+    cache.cached(layers[0])
+    _wait_rendered(qtbot, cache, layers[2])
+
+    assert cache.cached(layers[1]) is None
+    assert cache.cached(layers[0]) is not None
+    assert cache.nbytes() <= cache.max_bytes
+    cache.setMaxBytes(0)
+    assert len(cache) == 0
+
+
+def test_selector_requests_thumbnails_on_popup(qtbot, renders):
+    """Tests that the selector only renders thumbnails once its popup is shown."""
+    viewer = ViewerModel()
+    for i in range(3):
+        viewer.add_image(np.random.rand(16, 16), name=f"image {i}")
+    widget = QLayerSelect(thumbnails=True)
+    qtbot.addWidget(widget)
+    widget.connect(viewer)
+    cache = get_thumbnail_cache()
+    cache.clear()
+    assert renders == []
+
+    widget.showPopup()
+    qtbot.waitUntil(lambda: all(cache.cached(layer) is not None for layer in viewer.layers))
+    assert len(renders) == 3
+    widget.hidePopup()
+    widget.showPopup()
+    assert len(renders) == 3
+    widget.hidePopup()
@@ -12,15 +12,18 @@ from qtpy.QtWidgets import (
     QSlider,
     QSpinBox,
     QTextEdit,
+    QWidget,
 )
 
 from napari_toolkit.utils.widget_getter import get_value
+from napari_toolkit.utils.widget_registry import register_widget
 from napari_toolkit.utils.widget_setter import set_value
 from napari_toolkit.widgets.buttons.toggle_button import QToggleButton
 from napari_toolkit.widgets.color.color_picker import QColorPicker
 from napari_toolkit.widgets.color.edit_color_picker import QEditColorPicker
 from napari_toolkit.widgets.file_select import QDirSelect, QFileSelect
 from napari_toolkit.widgets.progressbar.progress_edit import QProgressbarEdit
+from napari_toolkit.widgets.search_switch import QSearchSwitch
 from napari_toolkit.widgets.sliders.double_slider import QDoubleSlider
 from napari_toolkit.widgets.sliders.edit_slider import QEditDoubleSlider, QEditSlider
 from napari_toolkit.widgets.sliders.labeled_slider import QLabeledDoubleSlider, QLabeledSlider
@@ -59,6 +62,8 @@ app = QApplication([])
         (QComboBox, 1),
         (QVSwitch, 1),
         (QHSwitch, 1),
+        (QSearchSwitch, "Blue"),
+        (QSearchSwitch, 1),
         # Date & Time
         (QDateTimeEdit, "2025-02-10 14:30:00"),
         # File & Directory Selectors
@@ -75,7 +80,7 @@ def test_widget_set_get(widget_cls, value):
     widget = widget_cls()
 
     # Special handling for QComboBox (it requires predefined items)
-    if isinstance(widget, (QComboBox, QHSwitch, QVSwitch)):
+    if isinstance(widget, (QComboBox, QHSwitch, QVSwitch, QSearchSwitch)):
         widget.addItems(["Red", "Green", "Blue"])
 
     # Apply the setter function
@@ -87,7 +92,7 @@ def test_widget_set_get(widget_cls, value):
     # Special handling for QColorPicker (returns tuple, needs conversion)
     if isinstance(widget, (QColorPicker, QEditColorPicker)) and isinstance(value, tuple):
         assert tuple(retrieved_value) == value
-    elif isinstance(widget, (QComboBox, QHSwitch, QVSwitch)):
+    elif isinstance(widget, (QComboBox, QHSwitch, QVSwitch, QSearchSwitch)):
         if isinstance(value, str):
             assert retrieved_value[0] == value
         else:
@@ -96,3 +101,32 @@ def test_widget_set_get(widget_cls, value):
         assert (
             retrieved_value == value
         ), f"Mismatch for {widget_cls.__name__}: Expected {value}, got {retrieved_value}"
+
+
+def test_register_custom_widget():
+    """Tests that third-party widgets and their subclasses can be registered."""
+
+    class CustomWidget(QWidget):
+        def __init__(self):
+            super().__init__()
+            self.custom_value = 0
+
+    class CustomSubWidget(CustomWidget):
+        pass
+
+    with pytest.raises(TypeError):
+        get_value(CustomWidget())
+
+    register_widget(
+        CustomWidget,
+        getter=lambda w: w.custom_value,
+        setter=lambda w, v: setattr(w, "custom_value", v),
+        validator=int,
+        expected="an integer",
+    )
+
+    widget = CustomSubWidget()
+    set_value(widget, 5)
+    assert get_value(widget) == 5
+    with pytest.raises(ValueError):
+        set_value(widget, "5")
@@ -1,21 +1,28 @@
-from .collapsible_groupbox import (
-    setup_collapsiblegroupbox,
-    setup_hcollapsiblegroupbox,
-    setup_vcollapsiblegroupbox,
-)
-from .groupbox import setup_groupbox, setup_hgroupbox, setup_vgroupbox
-from .scroll_area import setup_hscrollarea, setup_scrollarea, setup_vscrollarea
-from .tab_widget import setup_tabwidget
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "setup_collapsiblegroupbox",
-    "setup_hcollapsiblegroupbox",
-    "setup_vcollapsiblegroupbox",
-    "setup_groupbox",
-    "setup_hgroupbox",
-    "setup_vgroupbox",
-    "setup_scrollarea",
-    "setup_hscrollarea",
-    "setup_vscrollarea",
-    "setup_tabwidget",
-]
+from napari_toolkit._lazy import attach
+
+_LAZY_IMPORTS = {
+    "setup_collapsiblegroupbox": ".collapsible_groupbox",
+    "setup_hcollapsiblegroupbox": ".collapsible_groupbox",
+    "setup_vcollapsiblegroupbox": ".collapsible_groupbox",
+    "setup_groupbox": ".groupbox",
+    "setup_hgroupbox": ".groupbox",
+    "setup_vgroupbox": ".groupbox",
+    "setup_scrollarea": ".scroll_area",
+    "setup_hscrollarea": ".scroll_area",
+    "setup_vscrollarea": ".scroll_area",
+    "setup_tabwidget": ".tab_widget",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, _LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    from .collapsible_groupbox import (  # noqa: F401
+        setup_collapsiblegroupbox,
+        setup_hcollapsiblegroupbox,
+        setup_vcollapsiblegroupbox,
+    )
+    from .groupbox import setup_groupbox, setup_hgroupbox, setup_vgroupbox  # noqa: F401
+    from .scroll_area import setup_hscrollarea, setup_scrollarea, setup_vscrollarea  # noqa: F401
+    from .tab_widget import setup_tabwidget  # noqa: F401
@@ -1,5 +1,17 @@
-from .list import setup_list
-from .table import setup_table
-from .tree import setup_tree
+from typing import TYPE_CHECKING
 
-__all__ = ["setup_list", "setup_table", "setup_tree"]
+from napari_toolkit._lazy import attach
+
+_LAZY_IMPORTS = {
+    "setup_list": ".list",
+    "setup_table": ".table",
+    "setup_tableview": ".table",
+    "setup_tree": ".tree",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, _LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    from .list import setup_list  # noqa: F401
+    from .table import setup_table, setup_tableview  # noqa: F401
+    from .tree import setup_tree  # noqa: F401
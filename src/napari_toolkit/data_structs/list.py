@@ -13,6 +13,7 @@ def setup_list(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QListWidget, configure selection mode, and add it to a layout.
 
@@ -28,6 +29,7 @@ def setup_list(
         tooltips (Optional[str], optional): Tooltip text to display when hovering over the list widget. Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut to trigger an action on the list. Defaults to None.
         stretch (int, optional): The stretch factor for the list widget in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QListWidget added to the layout.
@@ -45,4 +47,5 @@ def setup_list(
         shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
@@ -1,7 +1,17 @@
 from typing import Any, Callable, List, Optional
 
-from qtpy.QtWidgets import QLayout, QSizePolicy, QTableWidget, QTableWidgetItem, QWidget
+from qtpy.QtCore import QAbstractItemModel
+from qtpy.QtWidgets import (
+    QAbstractItemView,
+    QLayout,
+    QSizePolicy,
+    QTableView,
+    QTableWidget,
+    QTableWidgetItem,
+    QWidget,
+)
 
+from napari_toolkit.data_structs.table_model import QArrayTableModel
 from napari_toolkit.utils.utils import connect_widget
 
 
@@ -68,3 +78,75 @@ def setup_table(
         tooltips=tooltips,
         stretch=stretch,
     )
+
+
+def setup_tableview(
+    layout: QLayout,
+    data: Any,
+    header: Optional[List[str]] = None,
+    show_index=True,
+    editable=False,
+    function: Optional[Callable] = None,
+    tooltips: Optional[str] = None,
+    shortcut: Optional[str] = None,
+    stretch: int = 1,
+    model: Optional[QAbstractItemModel] = None,
+    **kwargs,
+) -> QWidget:
+    """Create a QTableView backed by a table model and add it to a layout.
+
+    Unlike `setup_table`, no item is created per cell. The view shows a `QArrayTableModel`
+    which references the columns of the data and formats only the visible cells, so tables
+    with millions of rows are created instantly and need no additional memory. It is a
+    separate function because the returned QTableView has no item API (`item`, `setItem`)
+    which code written for `setup_table` relies on, the signature is the same otherwise.
+
+    The function is connected to `selectionChanged` of the selection model and called with
+    the selected and deselected QItemSelection, the selected rows are available through
+    `view.selectionModel().selectedRows()`. Replacing the model with `setModel` replaces the
+    selection model and disconnects the function.
+
+    Example usage:
+        ```python
+            props = regionprops_table(labels, properties=("label", "area", "centroid"))
+            setup_tableview(layout, props)  # dict of columns
+            setup_tableview(layout, np.zeros(10, dtype=[("label", int), ("area", float)]))
+            setup_tableview(layout, None, model=MyModel())
+        ```
+    Args:
+        layout (QLayout): The layout to which the QTableView will be added.
+        data (Any): A NumPy structured or 2D array, a dict of columns, a pandas DataFrame or a 2D list.
+        header (Optional[List[str]], optional): A list of column headers, by default the field names, keys or DataFrame columns. Defaults to None.
+        show_index (bool, optional): Whether to display the row index. Defaults to True.
+        editable (bool, optional): If False, disables table editing. Defaults to False.
+        function (Optional[Callable], optional): A callback function executed when the selection changes. Defaults to None.
+        tooltips (Optional[str], optional): Tooltip text to display when hovering over the table. Defaults to None.
+        shortcut (Optional[str], optional): A keyboard shortcut to trigger an action on the table. Defaults to None.
+        stretch (int, optional): The stretch factor for the table in the layout. Defaults to 1.
+        model (Optional[QAbstractItemModel], optional): A custom model shown instead of a model of the data, data, header and editable are ignored. Defaults to None.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
+
+    Returns:
+        QWidget: The QTableView added to the layout.
+    """
+
+    _widget = QTableView()
+    if model is None:
+        model = QArrayTableModel(data, header, editable, parent=_widget)
+    _widget.setModel(model)
+    # Only the visible rows are measured
+    _widget.resizeColumnsToContents()
+    if not editable:
+        _widget.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    _widget.verticalHeader().setVisible(show_index)
+    _widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+    return connect_widget(
+        layout,
+        _widget,
+        widget_event=_widget.selectionModel().selectionChanged,
+        function=function,
+        shortcut=shortcut,
+        tooltips=tooltips,
+        stretch=stretch,
+        **kwargs,
+    )
@@ -0,0 +1,160 @@
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+from qtpy.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt
+
+
+def _is_dataframe(data: Any) -> bool:
+    # pandas is optional, DataFrames are detected without importing it
+    return hasattr(data, "columns") and hasattr(data, "iloc") and hasattr(data, "iat")
+
+
+class QArrayTableModel(QAbstractTableModel):
+    """A table model over column based data, the cells are formatted on demand.
+
+    Supported sources are NumPy structured arrays, 2D NumPy arrays, dicts of columns (arrays
+    or lists), pandas DataFrames and nested lists of rows. The model keeps references to the
+    columns of the source instead of copying them (DataFrame columns are accessed through
+    `to_numpy`, which is a view for columns of a single dtype), so the memory usage does not
+    depend on the table size. Cells are only converted to text in `data` when the view paints
+    them, a view only requests the visible cells.
+
+    With `editable=True` edits are written back to the source, converted to the dtype of the
+    column. Edits of a DataFrame are written with `iat`.
+
+    Example usage:
+        ```python
+            props = skimage.measure.regionprops_table(labels, properties=("label", "area"))
+            view.setModel(QArrayTableModel(props))
+        ```
+
+    Args:
+        data (Any): The source, see above. None creates an empty model.
+        header (Optional[List[str]], optional): Column names, by default the field names, dict
+            keys or DataFrame columns are used. Defaults to None.
+        editable (bool, optional): Whether cells can be edited. Defaults to False.
+        parent (Optional[QObject], optional): The parent object. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        data: Any = None,
+        header: Optional[List[str]] = None,
+        editable: bool = False,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.editable = editable
+        self._source: Any = None
+        self._columns: List[Sequence] = []
+        self._rows: Optional[Sequence[Sequence]] = None
+        self._header: List[str] = []
+        self._row_count = 0
+        self._set_source(data, header)
+
+    def setSource(self, data: Any, header: Optional[List[str]] = None) -> None:
+        """Replaces the source of the model, views are reset.
+
+        Args:
+            data (Any): The new source.
+            header (Optional[List[str]], optional): Column names. Defaults to None.
+        """
+        self.beginResetModel()
+        self._set_source(data, header)
+        self.endResetModel()
+
+    def source(self) -> Any:
+        """Returns the source passed to the model."""
+        return self._source
+
+    def column(self, column: int) -> Sequence:
+        """Returns the values of a column, a view of the source where possible."""
+        if self._rows is not None:
+            return [row[column] if column < len(row) else None for row in self._rows]
+        return self._columns[column]
+
+    def _set_source(self, data: Any, header: Optional[List[str]]) -> None:
+        self._source = data
+        self._rows = None
+        self._columns = []
+        names: List[str] = []
+        if data is None:
+            pass
+        elif _is_dataframe(data):
+            names = [str(name) for name in data.columns]
+            self._columns = [data.iloc[:, j].to_numpy() for j in range(len(names))]
+        elif isinstance(data, np.ndarray) and data.dtype.names is not None:
+            names = list(data.dtype.names)
+            self._columns = [data[name] for name in names]
+        elif isinstance(data, np.ndarray):
+            data = data.reshape(len(data), -1) if data.ndim != 2 else data
+            self._columns = [data[:, j] for j in range(data.shape[1])]
+        elif isinstance(data, dict):
+            names = [str(name) for name in data]
+            self._columns = list(data.values())
+        else:
+            self._rows = data
+        if self._rows is not None:
+            self._row_count = len(self._rows)
+            column_count = max((len(row) for row in self._rows), default=0)
+        else:
+            self._row_count = min((len(column) for column in self._columns), default=0)
+            column_count = len(self._columns)
+
+        if header is not None:
+            names = [str(name) for name in header]
+        names = names[:column_count] + [str(j + 1) for j in range(len(names), column_count)]
+        self._header = names
+
+    def _value(self, row: int, column: int) -> Any:
+        if self._rows is not None:
+            values = self._rows[row]
+            return values[column] if column < len(values) else None
+        return self._columns[column][row]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(self._header)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        value = self._value(index.row(), index.column())
+        if role == Qt.EditRole:
+            # Python scalars, Qt picks the matching editor (spinbox, line edit, ...)
+            return value.item() if isinstance(value, np.generic) else value
+        return "" if value is None else str(value)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._header[section] if section < len(self._header) else None
+        return str(section + 1)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        flags = super().flags(index)
+        if self.editable and index.isValid():
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        if not self.editable or not index.isValid() or role != Qt.EditRole:
+            return False
+        row, column = index.row(), index.column()
+        try:
+            if self._rows is not None:
+                self._rows[row][column] = value
+            elif _is_dataframe(self._source):
+                dtype = self._columns[column].dtype
+                self._source.iat[row, column] = value if dtype.kind == "O" else dtype.type(value)
+                # Writing may replace the column array (copy on write), fetch the current one
+                self._columns[column] = self._source.iloc[:, column].to_numpy()
+            else:
+                self._columns[column][row] = value
+        except (TypeError, ValueError, IndexError):
+            return False
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
@@ -13,6 +13,7 @@ def setup_tree(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QTreeWidget, configure selection mode, and add it to a layout.
 
@@ -38,6 +39,7 @@ def setup_tree(
         tooltips (Optional[str], optional): Tooltip text to display when hovering over the tree widget. Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut to trigger an action on the tree widget. Defaults to None.
         stretch (int, optional): The stretch factor for the tree widget in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QTreeWidget added to the layout.
@@ -57,4 +59,5 @@ def setup_tree(
         shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
@@ -1,4 +1,51 @@
-from .widget_getter import get_value
-from .widget_setter import set_value
+from typing import TYPE_CHECKING
 
-__all__ = ["set_value", "get_value"]
+from napari_toolkit._lazy import attach
+
+_LAZY_IMPORTS = {
+    "set_value": ".widget_setter",
+    "get_value": ".widget_getter",
+    "register_widget": ".widget_registry",
+    "get_values": ".form",
+    "set_values": ".form",
+    "get_form_notifier": ".form",
+    "diff_values": ".form",
+    "apply_values": ".form",
+    "QFormPersistence": ".persistence",
+    "is_cancelled": ".background",
+    "enable_instrumentation": ".instrumentation",
+    "get_callback_stats": ".instrumentation",
+    "reset_callback_stats": ".instrumentation",
+    "get_layer_model": ".layer_model",
+    "connect_tracked": ".lifecycle",
+    "disconnect_tracked": ".lifecycle",
+    "add_teardown": ".lifecycle",
+    "get_shortcut_manager": ".shortcuts",
+    "set_shortcut_group_enabled": ".shortcuts",
+    "get_thumbnail_cache": ".thumbnails",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, _LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    from .background import is_cancelled  # noqa: F401
+    from .form import (  # noqa: F401
+        apply_values,
+        diff_values,
+        get_form_notifier,
+        get_values,
+        set_values,
+    )
+    from .instrumentation import (  # noqa: F401
+        enable_instrumentation,
+        get_callback_stats,
+        reset_callback_stats,
+    )
+    from .layer_model import get_layer_model  # noqa: F401
+    from .lifecycle import add_teardown, connect_tracked, disconnect_tracked  # noqa: F401
+    from .persistence import QFormPersistence  # noqa: F401
+    from .shortcuts import get_shortcut_manager, set_shortcut_group_enabled  # noqa: F401
+    from .thumbnails import get_thumbnail_cache  # noqa: F401
+    from .widget_getter import get_value  # noqa: F401
+    from .widget_registry import register_widget  # noqa: F401
+    from .widget_setter import set_value  # noqa: F401
@@ -0,0 +1,118 @@
+import contextlib
+import sys
+import threading
+from typing import Any, Callable, Optional
+
+from qtpy.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+_local = threading.local()
+
+
+def is_cancelled() -> bool:
+    """Checks if the background run calling this function got outdated by a newer trigger.
+
+    Long running callbacks connected with `background=True` can call this periodically and
+    return early, their result would be dropped anyway. Outside of a background run this
+    always returns False.
+
+    Example usage:
+        ```python
+            def segment(value):
+                for z in range(volume.shape[0]):
+                    if is_cancelled():
+                        return None
+                    ...
+        ```
+
+    Returns:
+        bool: True if a newer run was triggered.
+    """
+    task = getattr(_local, "task", None)
+    return task is not None and task.generation != task.runner.generation
+
+
+class _Task(QRunnable):
+    """Executes one run of a QBackgroundRunner on the thread pool."""
+
+    def __init__(self, runner: "QBackgroundRunner", generation: int, args: tuple) -> None:
+        super().__init__()
+        self.runner = runner
+        self.generation = generation
+        self.args = args
+
+    def run(self) -> None:
+        _local.task = self
+        result, exc_info = None, None
+        try:
+            if not is_cancelled():
+                result = self.runner.function(*self.args)
+        except Exception:  # noqa: BLE001
+            exc_info = sys.exc_info()
+        finally:
+            _local.task = None
+        # The runner might be deleted together with its widget in the meantime
+        with contextlib.suppress(RuntimeError):
+            self.runner.finished.emit(self.generation, result, exc_info)
+
+
+class QBackgroundRunner(QObject):
+    """Runs a function on the global QThreadPool, only the result of the latest run is used.
+
+    Each call makes all previous runs stale. Runs never overlap, so the function does not
+    need to be thread-safe towards itself: at most one run is in flight, a call during a run
+    only stores its arguments (replacing the ones of earlier calls) and the latest arguments
+    are run once the current run finished. Stale runs can stop early by checking
+    `is_cancelled`, their results are dropped in any case. The result of the latest run is
+    passed to `on_result` on the GUI thread, exceptions are passed to `sys.excepthook`
+    (which napari shows as notification).
+
+    Attributes:
+        function (Callable): The function executed on the worker thread.
+        on_result (Optional[Callable]): Called with the result on the GUI thread.
+        generation (int): Counter of the started runs.
+        finished (Signal): Emitted by the workers with (generation, result, exc_info).
+    """
+
+    finished = Signal(int, object, object)
+
+    def __init__(
+        self,
+        function: Callable,
+        on_result: Optional[Callable[[Any], None]] = None,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.function = function
+        self.on_result = on_result
+        self.generation = 0
+        self._running = False
+        self._pending: Optional[tuple] = None
+        self.finished.connect(self._on_finished)
+
+    def __call__(self, *args) -> None:
+        self.generation += 1
+        if self._running:
+            self._pending = args
+        else:
+            self._start(args)
+
+    def cancel(self) -> None:
+        """Makes all started runs stale and drops the pending run."""
+        self.generation += 1
+        self._pending = None
+
+    def _start(self, args: tuple) -> None:
+        self._running = True
+        QThreadPool.globalInstance().start(_Task(self, self.generation, args))
+
+    def _on_finished(self, generation: int, result: Any, exc_info: Optional[tuple]) -> None:
+        self._running = False
+        if self._pending is not None:
+            args, self._pending = self._pending, None
+            self._start(args)
+        if generation != self.generation:
+            return
+        if exc_info is not None:
+            sys.excepthook(*exc_info)
+        elif self.on_result is not None:
+            self.on_result(result)
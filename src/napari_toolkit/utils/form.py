@@ -0,0 +1,217 @@
+from typing import Any, Dict, Mapping, Optional, Set, Tuple
+
+from qtpy.QtCore import QObject, Qt, Signal
+from qtpy.QtWidgets import QWidget
+
+from napari_toolkit.utils.widget_getter import get_value
+from napari_toolkit.utils.widget_registry import get_handler
+from napari_toolkit.utils.widget_setter import set_value
+
+_NOTIFIER_NAME = "napari_toolkit_form_notifier"
+
+
+class QFormNotifier(QObject):
+    """Emits a single aggregated signal after a form was changed by `set_values`.
+
+    Attributes:
+        form_changed (Signal): Emitted with the set of changed keys.
+    """
+
+    form_changed = Signal(object)
+
+
+def get_form_notifier(root: QWidget) -> QFormNotifier:
+    """Returns the form notifier of a root widget, it is created on first use.
+
+    Example usage:
+        ```python
+            get_form_notifier(root).form_changed.connect(lambda keys: print(keys))
+        ```
+
+    Args:
+        root (QWidget): The root widget of the form.
+
+    Returns:
+        QFormNotifier: The notifier, owned by the root widget.
+    """
+    notifier = root.findChild(QFormNotifier, _NOTIFIER_NAME, Qt.FindDirectChildrenOnly)
+    if notifier is None:
+        notifier = QFormNotifier(root)
+        notifier.setObjectName(_NOTIFIER_NAME)
+    return notifier
+
+
+def collect_widgets(
+    root: QWidget, registry: Optional[Mapping[str, QWidget]] = None
+) -> Dict[str, QWidget]:
+    """Collects the value widgets of a form, keyed by their objectName.
+
+    The widget tree is walked depth first. A widget is collected if it has an objectName and
+    is supported by `get_value`/`set_value`, its children are not visited (so the internals of
+    composite widgets are skipped). Qt internal names (prefix "qt_") are ignored. If a name
+    occurs multiple times the first widget is used.
+
+    Args:
+        root (QWidget): The root widget of the form.
+        registry (Optional[Mapping[str, QWidget]], optional): An explicit mapping from key to
+            widget. If given, the widget tree is not walked. Defaults to None.
+
+    Returns:
+        Dict[str, QWidget]: Mapping from key to widget.
+    """
+    if registry is not None:
+        return dict(registry)
+
+    widgets = {}
+    stack = list(reversed(root.children()))
+    while stack:
+        child = stack.pop()
+        if not isinstance(child, QWidget):
+            continue
+        name = child.objectName()
+        if name and not name.startswith("qt_") and get_handler(type(child)) is not None:
+            widgets.setdefault(name, child)
+        else:
+            stack.extend(reversed(child.children()))
+    return widgets
+
+
+def get_values(root: QWidget, registry: Optional[Mapping[str, QWidget]] = None) -> Dict[str, Any]:
+    """Takes a snapshot of all values of a form.
+
+    Args:
+        root (QWidget): The root widget of the form.
+        registry (Optional[Mapping[str, QWidget]], optional): An explicit mapping from key to
+            widget, see `collect_widgets`. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: Mapping from key to the value returned by `get_value`.
+    """
+    return {key: get_value(widget) for key, widget in collect_widgets(root, registry).items()}
+
+
+def _is_equal(current: Any, target: Any) -> bool:
+    """Compares a widget value with a target value accepted by `set_value`.
+
+    Selection widgets return (text, index) pairs but can be set by text or index alone,
+    sequences (e.g. colors) are compared independent of their container type.
+    """
+    if isinstance(current, tuple) and len(current) == 2 and isinstance(current[0], str):
+        if isinstance(target, str):
+            return current[0] == target
+        if isinstance(target, int) and not isinstance(target, bool):
+            return current[1] == target
+    if isinstance(current, (tuple, list)) and isinstance(target, (tuple, list)):
+        return tuple(current) == tuple(target)
+    return current == target
+
+
+def _assign(widgets: Dict[str, QWidget], mapping: Mapping[str, Any]) -> Dict[str, Tuple[Any, Any]]:
+    """Sets the values with blocked signals and returns the (old, new) value of changed keys."""
+    changes = {}
+    for key, value in mapping.items():
+        widget = widgets[key]
+        before = get_value(widget)
+        was_blocked = widget.blockSignals(True)
+        try:
+            set_value(widget, value)
+        finally:
+            widget.blockSignals(was_blocked)
+        after = get_value(widget)
+        if after != before:
+            changes[key] = (before, after)
+    return changes
+
+
+def set_values(
+    root: QWidget,
+    mapping: Mapping[str, Any],
+    registry: Optional[Mapping[str, QWidget]] = None,
+) -> Set[str]:
+    """Restores the values of a form in one bulk pass.
+
+    The signals of each widget are blocked while its value is set, so no per widget
+    callbacks (e.g. `valueChanged`, `clicked`) are triggered. Afterwards the `form_changed`
+    signal of the form notifier (see `get_form_notifier`) is emitted once with all changed
+    keys. Keys without a matching widget are ignored.
+
+    Args:
+        root (QWidget): The root widget of the form.
+        mapping (Mapping[str, Any]): Mapping from key to value, as returned by `get_values`.
+        registry (Optional[Mapping[str, QWidget]], optional): An explicit mapping from key to
+            widget, see `collect_widgets`. Defaults to None.
+
+    Returns:
+        Set[str]: The keys whose value changed.
+    """
+    widgets = collect_widgets(root, registry)
+    changed = set(_assign(widgets, {k: v for k, v in mapping.items() if k in widgets}))
+
+    if changed:
+        get_form_notifier(root).form_changed.emit(changed)
+    return changed
+
+
+def diff_values(
+    root: QWidget,
+    mapping: Mapping[str, Any],
+    registry: Optional[Mapping[str, QWidget]] = None,
+) -> Dict[str, Tuple[Any, Any]]:
+    """Compares a target state with the current state of a form.
+
+    Args:
+        root (QWidget): The root widget of the form.
+        mapping (Mapping[str, Any]): Mapping from key to target value.
+        registry (Optional[Mapping[str, QWidget]], optional): An explicit mapping from key to
+            widget, see `collect_widgets`. Defaults to None.
+
+    Returns:
+        Dict[str, Tuple[Any, Any]]: The (current, target) values of all keys which differ.
+        Keys without a matching widget are ignored.
+    """
+    widgets = collect_widgets(root, registry)
+    diff = {}
+    for key, target in mapping.items():
+        widget = widgets.get(key)
+        if widget is None:
+            continue
+        current = get_value(widget)
+        if not _is_equal(current, target):
+            diff[key] = (current, target)
+    return diff
+
+
+def apply_values(
+    root: QWidget,
+    mapping: Mapping[str, Any],
+    registry: Optional[Mapping[str, QWidget]] = None,
+) -> Dict[str, Tuple[Any, Any]]:
+    """Incrementally applies a target state to a form.
+
+    Only widgets whose current value differs from the target are touched, which avoids
+    needless repaints and restyling when switching between similar presets. Like
+    `set_values`, signals are blocked and `form_changed` is emitted once with the changed keys.
+
+    Example usage:
+        ```python
+            diff = apply_values(root, preset)
+            if "threshold" in diff:
+                recompute_mask()
+        ```
+
+    Args:
+        root (QWidget): The root widget of the form.
+        mapping (Mapping[str, Any]): Mapping from key to target value.
+        registry (Optional[Mapping[str, QWidget]], optional): An explicit mapping from key to
+            widget, see `collect_widgets`. Defaults to None.
+
+    Returns:
+        Dict[str, Tuple[Any, Any]]: The (old, new) values of all changed keys.
+    """
+    widgets = collect_widgets(root, registry)
+    diff = diff_values(root, mapping, widgets)
+    changes = _assign(widgets, {key: mapping[key] for key in diff})
+
+    if changes:
+        get_form_notifier(root).form_changed.emit(set(changes))
+    return changes
@@ -0,0 +1,170 @@
+import inspect
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any, Callable, Dict, List, Set
+
+from qtpy.QtWidgets import QWidget
+
+_ENABLED = False
+_PROBES: Set["CallbackProbe"] = set()
+_SAMPLES = 1024
+
+
+def enable_instrumentation(enabled: bool = True) -> None:
+    """Instruments all callbacks connected by `connect_widget` from now on.
+
+    This is the global counterpart of the `instrument` argument of `connect_widget`, call it
+    before the widgets of a plugin are created.
+
+    Args:
+        enabled (bool, optional): Whether new callbacks are instrumented. Defaults to True.
+    """
+    global _ENABLED
+    _ENABLED = enabled
+
+
+def is_instrumentation_enabled() -> bool:
+    """Returns if all new callbacks are instrumented, see `enable_instrumentation`."""
+    return _ENABLED
+
+
+def _find_setup_function() -> str:
+    """Returns the name of the innermost `setup_*` function of napari_toolkit in the stack."""
+    frame = inspect.currentframe()
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if frame.f_code.co_name.startswith("setup_") and module.startswith("napari_toolkit."):
+            return frame.f_code.co_name
+        frame = frame.f_back
+    return "connect_widget"
+
+
+class CallbackProbe:
+    """Records the timings of one connected callback.
+
+    `trigger` wraps the callable which is connected to the signal and remembers the time of
+    the signal, `measure` wraps the callback itself. Debouncing, throttling and background
+    execution happen in between, so the delay between both is part of the statistics.
+
+    Attributes:
+        setup (str): Name of the setup function which created the widget.
+        widget_type (str): Class name of the widget.
+    """
+
+    def __init__(self, widget: QWidget, setup: str) -> None:
+        self.setup = setup
+        self.widget_type = type(widget).__name__
+        self._widget = weakref.ref(widget)
+        self._name = ""
+        self._lock = threading.Lock()
+        self._signal_time = None
+        self.reset()
+        _PROBES.add(self)
+        # Statistics of deleted widgets are dropped, rebuilt panels do not accumulate probes
+        widget.destroyed.connect(lambda *_: _PROBES.discard(self))
+
+    @property
+    def widget(self) -> str:
+        """The objectName of the widget, or its class name if it has no name."""
+        widget = self._widget()
+        if widget is not None:
+            try:
+                self._name = widget.objectName()
+            except RuntimeError:
+                # The widget was deleted, keep the last known name
+                self._widget = lambda: None
+        return self._name or self.widget_type
+
+    def reset(self) -> None:
+        """Clears all recorded timings."""
+        with self._lock:
+            self.calls = 0
+            self.total = 0.0
+            self.max = 0.0
+            self.durations = deque(maxlen=_SAMPLES)
+            self.delay_total = 0.0
+            self.delay_max = 0.0
+
+    def trigger(self, function: Callable) -> Callable:
+        """Wraps the callable connected to the signal."""
+
+        def _triggered(*args):
+            self._signal_time = time.perf_counter()
+            return function(*args)
+
+        return _triggered
+
+    def measure(self, function: Callable) -> Callable:
+        """Wraps the callback, may be called on a worker thread."""
+
+        def _measured(*args):
+            start = time.perf_counter()
+            try:
+                return function(*args)
+            finally:
+                self._record(start, time.perf_counter())
+
+        return _measured
+
+    def _record(self, start: float, end: float) -> None:
+        duration = end - start
+        delay = 0.0 if self._signal_time is None else max(0.0, start - self._signal_time)
+        with self._lock:
+            self.calls += 1
+            self.total += duration
+            self.max = max(self.max, duration)
+            self.durations.append(duration)
+            self.delay_total += delay
+            self.delay_max = max(self.delay_max, delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the statistics in milliseconds, see `get_callback_stats`."""
+        with self._lock:
+            durations = sorted(self.durations)
+            calls = self.calls
+            p95 = durations[min(len(durations) - 1, int(0.95 * len(durations)))] if calls else 0.0
+            return {
+                "widget": self.widget,
+                "type": self.widget_type,
+                "setup": self.setup,
+                "calls": calls,
+                "total_ms": self.total * 1000,
+                "mean_ms": self.total / calls * 1000 if calls else 0.0,
+                "p95_ms": p95 * 1000,
+                "max_ms": self.max * 1000,
+                "mean_delay_ms": self.delay_total / calls * 1000 if calls else 0.0,
+                "max_delay_ms": self.delay_max * 1000,
+            }
+
+
+def get_callback_stats() -> List[Dict[str, Any]]:
+    """Returns the timings of all instrumented callbacks, the most expensive first.
+
+    Each entry contains the widget (objectName or class name), its type and the setup
+    function which created it, the number of calls and the total, mean, 95th percentile
+    and maximum duration in milliseconds. `mean_delay_ms` and `max_delay_ms` are the times
+    between the latest triggering signal and the start of the callback, which includes
+    debounce delays and waiting for a worker thread. The percentile is computed over the
+    last 1024 calls.
+
+    Example usage:
+        ```python
+            enable_instrumentation()
+            ...  # build the plugin and use it
+            for row in get_callback_stats()[:5]:
+                print(row["setup"], row["widget"], row["mean_ms"])
+        ```
+
+    Returns:
+        List[Dict[str, Any]]: One entry per instrumented callback, sorted by total duration.
+    """
+    stats = [probe.stats() for probe in _PROBES]
+    return sorted(stats, key=lambda row: row["total_ms"], reverse=True)
+
+
+def reset_callback_stats() -> None:
+    """Clears the timings of all instrumented callbacks."""
+    for probe in _PROBES:
+        probe.reset()
@@ -0,0 +1,495 @@
+import weakref
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from qtpy.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QSortFilterProxyModel,
+    Qt,
+    QTimer,
+    Signal,
+)
+
+from napari_toolkit.utils.lifecycle import connect_tracked, disconnect_tracked
+
+if TYPE_CHECKING:
+    from napari.layers import Layer
+    from napari.viewer import Viewer
+
+LAYER_ROLE = Qt.UserRole + 1
+LAYER_INFO_ROLE = Qt.UserRole + 2
+
+# Layer events which change the LayerInfo of a layer
+_INFO_EVENTS = ("data", "scale", "metadata")
+
+
+class LayerInfo(NamedTuple):
+    """Cheap metadata of a layer, read without touching the values of the layer data.
+
+    Attributes are None if a layer does not provide them (e.g. the dtype of a shapes layer).
+    """
+
+    layer_type: type
+    dtype: Any
+    shape: Optional[Tuple[int, ...]]
+    ndim: Optional[int]
+    scale: Optional[Tuple[float, ...]]
+    multiscale: bool
+    metadata_keys: FrozenSet[str]
+
+
+def layer_info(layer: "Layer") -> LayerInfo:
+    """Collects the metadata of a layer, only the array attributes of the data are read.
+
+    Args:
+        layer (Layer): The layer.
+
+    Returns:
+        LayerInfo: The metadata of the layer.
+    """
+    data = getattr(layer, "data", None)
+    # Multiscale data reports the shape and dtype of its first level
+    dtype = getattr(layer, "dtype", None)
+    if dtype is None:
+        dtype = getattr(data, "dtype", None)
+    shape = getattr(data, "shape", None)
+    scale = getattr(layer, "scale", None)
+    return LayerInfo(
+        layer_type=type(layer),
+        dtype=dtype,
+        shape=tuple(shape) if shape is not None else None,
+        ndim=getattr(layer, "ndim", None),
+        scale=tuple(float(value) for value in scale) if scale is not None else None,
+        multiscale=bool(getattr(layer, "multiscale", False)),
+        metadata_keys=frozenset(getattr(layer, "metadata", None) or ()),
+    )
+
+
+def _runs(rows: List[int]) -> List[Tuple[int, int]]:
+    """Groups sorted rows into (first, last) ranges of consecutive rows."""
+    runs = []
+    for row in rows:
+        if runs and runs[-1][1] == row - 1:
+            runs[-1] = (runs[-1][0], row)
+        else:
+            runs.append((row, row))
+    return runs
+
+
+class QLayerListModel(QAbstractListModel):
+    """A list model of the layers of a napari viewer, shared by all layer selectors of a viewer.
+
+    The model subscribes once to the layer list events of the viewer and to the name event of
+    each layer, so each viewer event is processed once no matter how many views exist. The
+    rows follow the order of `viewer.layers`, the display text is the layer name and the layer
+    itself is available with `LAYER_ROLE`. Views filter the layers with `proxy`.
+
+    The model also maintains an index of cheap layer metadata (`LayerInfo`, available with
+    `LAYER_INFO_ROLE` or `info`), which is updated on the data, scale and metadata events of
+    the layers. Filters run against this index and never touch the layer data, which might be
+    a lazily loaded dask or zarr array. Note that changing `layer.metadata` in place emits no
+    event, assign a new dict instead.
+
+    Layers are tracked by identity, duplicate names are no problem. The rows only hold weak
+    references to the layers and a layer -> row map makes lookups (e.g. on renames) O(1).
+    The map is updated lazily: appending keeps it valid, inserting or removing in the middle
+    only invalidates the rows behind, which are re-indexed on the next lookup.
+
+    In coalescing mode (`setCoalescing`) the layer list events are accumulated and applied
+    with the next event loop iteration as one batched update, e.g. opening hundreds of tiles
+    results in one row insertion instead of hundreds. The batch is enclosed by `batch_started`
+    and `batch_finished`, which views use to notify selection changes once per batch.
+
+    Use `get_layer_model` to get the model of a viewer instead of creating one.
+
+    Attributes:
+        batch_started (Signal): Emitted before a coalesced batch is applied.
+        batch_finished (Signal): Emitted after a coalesced batch was applied.
+        info_changed (Signal): Emitted with the layer when its LayerInfo changed.
+    """
+
+    batch_started = Signal()
+    batch_finished = Signal()
+    info_changed = Signal(object)
+
+    def __init__(self, viewer: "Viewer", parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._coalescing = False
+        self._pending = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self.flush)
+        self._refs: List[weakref.ReferenceType] = []
+        self._rows: Dict[int, int] = {}
+        self._rows_valid = 0
+        self._infos: Dict[int, LayerInfo] = {}
+        self._proxies: Dict[Any, QLayerFilterProxyModel] = {}
+        self._layer_list = weakref.ref(viewer.layers)
+
+        # Tracked connections are removed when the model is released together with the viewer
+        events = viewer.layers.events
+        connect_tracked(self, events.inserted, self._on_inserted)
+        connect_tracked(self, events.removed, self._on_removed)
+        connect_tracked(self, events.moved, self._on_moved)
+        connect_tracked(self, events.reordered, self._on_reordered)
+        for index, layer in enumerate(viewer.layers):
+            self._insert(index, layer)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(self._refs)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self._refs):
+            return None
+        layer = self._refs[index.row()]()
+        if layer is None:
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return layer.name
+        if role == LAYER_ROLE:
+            return layer
+        if role == LAYER_INFO_ROLE:
+            return self._infos.get(id(layer))
+        return None
+
+    def layer(self, row: int) -> Optional["Layer"]:
+        """Returns the layer of a row, None if it was deleted."""
+        return self._refs[row]()
+
+    def info(self, layer: "Layer") -> Optional[LayerInfo]:
+        """Returns the indexed metadata of a layer, None if it is not in the model."""
+        return self._infos.get(id(layer))
+
+    def row(self, layer: "Layer") -> int:
+        """Returns the row of a layer, -1 if it is not in the model."""
+        row = self._rows.get(id(layer))
+        if row is None or row >= self._rows_valid:
+            self._reindex()
+            row = self._rows.get(id(layer))
+        if row is None or self._refs[row]() is not layer:
+            return -1
+        return row
+
+    def proxy(
+        self,
+        layer_type: Optional[Type["Layer"]] = None,
+        predicate: Optional[Callable[[LayerInfo], bool]] = None,
+        parent: Optional[QObject] = None,
+    ) -> "QLayerFilterProxyModel":
+        """Returns the model filtered by layer type and an optional predicate.
+
+        Proxies without a predicate are shared between views. Proxies with a predicate are
+        created per call and owned by `parent`, so they are deleted together with their view.
+
+        Args:
+            layer_type (Optional[Type[Layer]], optional): Only layers of this type are shown,
+                None shows all layers. Defaults to None.
+            predicate (Optional[Callable[[LayerInfo], bool]], optional): Only layers whose
+                LayerInfo fulfills the predicate are shown. Defaults to None.
+            parent (Optional[QObject], optional): The owner of a proxy with a predicate,
+                the model if None. Defaults to None.
+
+        Returns:
+            QLayerFilterProxyModel: The filtered model.
+        """
+        if predicate is not None:
+            proxy = QLayerFilterProxyModel(layer_type, parent or self, predicate)
+            proxy.setSourceModel(self)
+            return proxy
+        proxy = self._proxies.get(layer_type)
+        if proxy is None:
+            proxy = self._proxies[layer_type] = QLayerFilterProxyModel(layer_type, self)
+            proxy.setSourceModel(self)
+        return proxy
+
+    def isCoalescing(self) -> bool:
+        """Returns if layer list events are applied in batches."""
+        return self._coalescing
+
+    def setCoalescing(self, enabled: bool) -> None:
+        """Enables or disables the coalescing mode, pending events are applied when disabled.
+
+        Args:
+            enabled (bool): Whether layer list events are applied in batches.
+        """
+        self._coalescing = enabled
+        if not enabled:
+            self.flush()
+
+    def flush(self) -> None:
+        """Applies the pending layer list events of the coalescing mode at once."""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        self._pending = False
+        layer_list = self._layer_list()
+        if layer_list is None:
+            return
+        self.batch_started.emit()
+        try:
+            self._apply(list(layer_list))
+        finally:
+            # Views block their signals during a batch, they must be released in any case
+            self.batch_finished.emit()
+
+    def _apply(self, target: List["Layer"]) -> None:
+        """Updates the rows to the layer list, rows are removed and inserted in ranges."""
+        target_ids = {id(layer) for layer in target}
+        # Removals, one range per run of consecutive rows starting at the end
+        removed = [
+            row
+            for row, ref in enumerate(self._refs)
+            if ref() is None or id(ref()) not in target_ids
+        ]
+        for first, last in reversed(_runs(removed)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for ref in self._refs[first : last + 1]:
+                if ref() is not None:
+                    self._untrack(ref())
+            del self._refs[first : last + 1]
+            self.endRemoveRows()
+
+        # Insertions, one range per run of consecutive new layers
+        kept = [id(ref()) for ref in self._refs]
+        present = set(kept)
+        in_order = [id(layer) for layer in target if id(layer) in present] == kept
+        new_rows = [row for row, layer in enumerate(target) if id(layer) not in present]
+        for first, last in _runs(new_rows):
+            # With the previous layers in order, the new layers are inserted at their target
+            # rows, otherwise they are appended and the rows are reordered below
+            row = first if in_order else len(self._refs)
+            self.beginInsertRows(QModelIndex(), row, row + last - first)
+            for offset, layer in enumerate(target[first : last + 1]):
+                self._refs.insert(row + offset, weakref.ref(layer))
+                self._track(layer)
+            self.endInsertRows()
+
+        self._rows = {}
+        self._rows_valid = 0
+        if not in_order:
+            self._relayout(target)
+
+    def _defer(self) -> bool:
+        """Marks the model as outdated in coalescing mode, returns if the event is deferred."""
+        if not self._coalescing:
+            return False
+        self._pending = True
+        self._flush_timer.start()
+        return True
+
+    def _reindex(self) -> None:
+        for row in range(self._rows_valid, len(self._refs)):
+            layer = self._refs[row]()
+            if layer is not None:
+                self._rows[id(layer)] = row
+        self._rows_valid = len(self._refs)
+
+    def _invalidate(self, row: int) -> None:
+        self._rows_valid = min(self._rows_valid, row)
+
+    def _insert(self, index: int, layer: "Layer") -> None:
+        self.beginInsertRows(QModelIndex(), index, index)
+        self._refs.insert(index, weakref.ref(layer))
+        self._rows[id(layer)] = index
+        if index == self._rows_valid == len(self._refs) - 1:
+            self._rows_valid += 1
+        else:
+            self._invalidate(index)
+        self._track(layer)
+        self.endInsertRows()
+
+    def _info_events(self, layer: "Layer") -> List[Any]:
+        return [getattr(layer.events, name, None) for name in _INFO_EVENTS]
+
+    def _track(self, layer: "Layer") -> None:
+        self._infos[id(layer)] = layer_info(layer)
+        connect_tracked(self, layer.events.name, self._on_name)
+        for emitter in self._info_events(layer):
+            if emitter is not None:
+                connect_tracked(self, emitter, self._on_info)
+
+    def _untrack(self, layer: "Layer") -> None:
+        self._infos.pop(id(layer), None)
+        disconnect_tracked(self, layer.events.name, self._on_name)
+        for emitter in self._info_events(layer):
+            if emitter is not None:
+                disconnect_tracked(self, emitter, self._on_info)
+
+    def _on_inserted(self, event) -> None:
+        if not self._defer():
+            self._insert(event.index, event.value)
+
+    def _on_removed(self, event) -> None:
+        if self._defer():
+            return
+        layer = event.value
+        self.beginRemoveRows(QModelIndex(), event.index, event.index)
+        self._refs.pop(event.index)
+        self._rows.pop(id(layer), None)
+        self._invalidate(event.index)
+        self._untrack(layer)
+        self.endRemoveRows()
+
+    def _on_moved(self, event) -> None:
+        if self._defer():
+            return
+        # napari reports the destination after removal, Qt expects it before removal
+        source, dest = event.index, event.new_index
+        qt_dest = dest + 1 if dest > source else dest
+        self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), qt_dest)
+        self._refs.insert(dest, self._refs.pop(source))
+        self._invalidate(min(source, dest))
+        self.endMoveRows()
+
+    def _on_reordered(self, event) -> None:
+        # Moves were already applied one by one, only e.g. `reverse` lands here
+        layer_list = self._layer_list()
+        if layer_list is not None and not self._defer():
+            self._relayout(list(layer_list))
+
+    def _relayout(self, layers: List["Layer"]) -> None:
+        """Reorders the rows to the given layers, which have to be the layers of the model."""
+        if [id(layer) for layer in layers] == [id(ref()) for ref in self._refs]:
+            return
+        self.layoutAboutToBeChanged.emit()
+        old_refs = self._refs
+        self._refs = [weakref.ref(layer) for layer in layers]
+        self._rows = {}
+        self._rows_valid = 0
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(self.row(old_refs[index.row()]())) for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def _on_name(self, event) -> None:
+        row = self.row(event.source)
+        if row != -1:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.ToolTipRole])
+
+    def _on_info(self, event) -> None:
+        layer = event.source
+        if id(layer) not in self._infos:
+            return
+        info = layer_info(layer)
+        if info == self._infos[id(layer)]:
+            return
+        self._infos[id(layer)] = info
+        row = self.row(layer)
+        if row != -1:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [LAYER_INFO_ROLE])
+        self.info_changed.emit(layer)
+
+
+class QLayerFilterProxyModel(QSortFilterProxyModel):
+    """A view of a QLayerListModel which only contains the layers of one type.
+
+    The layers can be further filtered with a predicate on their `LayerInfo`, e.g.
+    `lambda info: info.ndim == 3 and info.dtype == np.float32`. The predicate is re-evaluated
+    for all layers whenever the info of any layer changes, so predicates may depend on other
+    layers (e.g. "same shape as image X"). Call `invalidateFilter` if a predicate depends on
+    anything else.
+
+    Args:
+        layer_type (Optional[Type[Layer]]): The accepted layer type, None accepts all layers.
+        parent (Optional[QObject], optional): The parent object. Defaults to None.
+        predicate (Optional[Callable[[LayerInfo], bool]], optional): Only layers fulfilling
+            the predicate are accepted. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        layer_type: Optional[Type["Layer"]] = None,
+        parent: Optional[QObject] = None,
+        predicate: Optional[Callable[[LayerInfo], bool]] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.layer_type = layer_type
+        self.predicate = predicate
+
+    def setSourceModel(self, model: "QLayerListModel") -> None:
+        if self.predicate is not None:
+            if self.sourceModel() is not None:
+                self.sourceModel().info_changed.disconnect(self._on_info_changed)
+            model.info_changed.connect(self._on_info_changed)
+        super().setSourceModel(model)
+
+    def _on_info_changed(self, layer: "Layer") -> None:
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        model = self.sourceModel()
+        layer = model.layer(source_row)
+        if self.layer_type is not None and not isinstance(layer, self.layer_type):
+            return False
+        if self.predicate is None:
+            return True
+        info = model.info(layer)
+        return info is not None and bool(self.predicate(info))
+
+    def layer(self, row: int) -> Optional["Layer"]:
+        """Returns the layer of a row of the proxy."""
+        return self.sourceModel().layer(self.mapToSource(self.index(row, 0)).row())
+
+    def info(self, layer: "Layer") -> Optional[LayerInfo]:
+        """Returns the indexed metadata of a layer, None if it is not in the source model."""
+        model = self.sourceModel()
+        return model.info(layer) if model is not None else None
+
+    def row(self, layer: "Layer") -> int:
+        """Returns the row of a layer in the proxy, -1 if it is not shown."""
+        source_row = self.sourceModel().row(layer)
+        if source_row == -1:
+            return -1
+        return self.mapFromSource(self.sourceModel().index(source_row)).row()
+
+
+_MODELS: Dict[int, QLayerListModel] = {}
+
+
+def _release_model(viewer_id: int) -> None:
+    model = _MODELS.pop(viewer_id, None)
+    if model is not None:
+        model.deleteLater()
+
+
+def get_layer_model(viewer: "Viewer", coalesce: Optional[bool] = None) -> QLayerListModel:
+    """Returns the layer list model of a viewer, it is created on first use.
+
+    The model is shared by all layer selectors of the viewer and released with the viewer.
+
+    Example usage:
+        ```python
+            combobox.setModel(get_layer_model(viewer).proxy(Labels))
+        ```
+
+    Args:
+        viewer (Viewer): The napari viewer.
+        coalesce (Optional[bool], optional): Enable or disable the coalescing mode of the
+            model, see `QLayerListModel.setCoalescing`. None keeps the current mode.
+            Defaults to None.
+
+    Returns:
+        QLayerListModel: The model of the viewer layers.
+    """
+    model = _MODELS.get(id(viewer))
+    if model is None:
+        model = _MODELS[id(viewer)] = QLayerListModel(viewer)
+        weakref.finalize(viewer, _release_model, id(viewer))
+    if coalesce is not None:
+        model.setCoalescing(coalesce)
+    return model
@@ -0,0 +1,129 @@
+import contextlib
+import functools
+import itertools
+import weakref
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from qtpy.QtCore import QObject
+
+# The teardowns are stored on the owner, ids of Python wrappers can be reused while the
+# C++ object still waits for its deferred deletion
+_TEARDOWNS_ATTR = "_toolkit_teardowns"
+_counter = itertools.count()
+
+
+def _ref(obj: Any) -> Callable[[], Any]:
+    """Returns a weak reference to an object or bound method, a strong one if not possible."""
+    if hasattr(obj, "__self__") and hasattr(obj, "__func__"):
+        return weakref.WeakMethod(obj)
+    try:
+        return weakref.ref(obj)
+    except TypeError:
+        return lambda: obj
+
+
+def _connection_key(emitter: Any, callback: Callable) -> Hashable:
+    # Bound methods are recreated on every attribute access, their self and function are not
+    if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+        return id(emitter), id(callback.__self__), callback.__func__
+    if getattr(callback, "__self__", None) is not None and hasattr(callback, "__name__"):
+        return id(emitter), id(callback.__self__), callback.__name__
+    return id(emitter), id(callback)
+
+
+def _teardown(teardowns: Dict[Hashable, Callable[[], None]], *args) -> None:
+    while teardowns:
+        _, teardown = teardowns.popitem()
+        # The connection may already be removed or its emitter deleted
+        with contextlib.suppress(RuntimeError, TypeError, ValueError):
+            teardown()
+
+
+def add_teardown(
+    owner: QObject, teardown: Callable[[], None], key: Optional[Hashable] = None
+) -> Hashable:
+    """Registers a function which is called once when the owner is destroyed.
+
+    The teardown must not reference the owner, otherwise the owner would be kept alive.
+
+    Args:
+        owner (QObject): The owner, usually a widget.
+        teardown (Callable[[], None]): Called without arguments when the owner is destroyed.
+        key (Optional[Hashable], optional): A key for `remove_teardown`, a new one is created
+            if not given. Defaults to None.
+
+    Returns:
+        Hashable: The key of the teardown.
+    """
+    teardowns = getattr(owner, _TEARDOWNS_ATTR, None)
+    if teardowns is None:
+        teardowns = {}
+        setattr(owner, _TEARDOWNS_ATTR, teardowns)
+        owner.destroyed.connect(functools.partial(_teardown, teardowns))
+    if key is None:
+        key = next(_counter)
+    teardowns[key] = teardown
+    return key
+
+
+def remove_teardown(owner: QObject, key: Hashable) -> Optional[Callable[[], None]]:
+    """Removes a teardown without calling it.
+
+    Args:
+        owner (QObject): The owner passed to `add_teardown`.
+        key (Hashable): The key returned by `add_teardown`.
+
+    Returns:
+        Optional[Callable[[], None]]: The removed teardown, None if it was not registered.
+    """
+    return getattr(owner, _TEARDOWNS_ATTR, {}).pop(key, None)
+
+
+def _disconnect(emitter_ref: Callable[[], Any], callback_ref: Callable[[], Any]) -> None:
+    emitter, callback = emitter_ref(), callback_ref()
+    if emitter is not None and callback is not None:
+        emitter.disconnect(callback)
+
+
+def connect_tracked(owner: QObject, emitter: Any, callback: Callable) -> Callable:
+    """Connects a callback to an external event and disconnects it when the owner is destroyed.
+
+    Meant for napari event emitters (e.g. `viewer.layers.events.inserted`, `layer.events.name`
+    or settings events), which are not disconnected by Qt. The emitter and bound method
+    callbacks are only referenced weakly.
+
+    Example usage:
+        ```python
+            connect_tracked(self, viewer.layers.events.inserted, self._on_inserted)
+        ```
+
+    Args:
+        owner (QObject): The object the connection belongs to, usually the widget itself.
+        emitter (Any): An object with `connect` and `disconnect` methods.
+        callback (Callable): The callback.
+
+    Returns:
+        Callable: The callback.
+    """
+    emitter.connect(callback)
+    teardown = functools.partial(_disconnect, _ref(emitter), _ref(callback))
+    add_teardown(owner, teardown, _connection_key(emitter, callback))
+    return callback
+
+
+def disconnect_tracked(owner: QObject, emitter: Any, callback: Callable) -> None:
+    """Disconnects a callback connected by `connect_tracked` before the owner is destroyed.
+
+    Args:
+        owner (QObject): The owner passed to `connect_tracked`.
+        emitter (Any): The emitter passed to `connect_tracked`.
+        callback (Callable): The callback passed to `connect_tracked`.
+    """
+    teardown = remove_teardown(owner, _connection_key(emitter, callback))
+    if teardown is not None:
+        teardown()
+
+
+def tracked_count(owner: QObject) -> int:
+    """Returns the number of pending teardowns of an owner."""
+    return len(getattr(owner, _TEARDOWNS_ATTR, {}))
@@ -0,0 +1,155 @@
+import json
+import os
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Mapping, Optional, Set
+
+from qtpy.QtCore import QEvent, QObject, QTimer
+from qtpy.QtWidgets import QApplication, QWidget
+
+from napari_toolkit.utils.form import collect_widgets, get_form_notifier, get_values, set_values
+from napari_toolkit.utils.widget_registry import get_handler
+
+
+def _write_json(path: str, state: Dict[str, Any]) -> None:
+    """Writes the state atomically, a crash during the write never leaves a truncated file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+_FLUSH_EVENTS = (QEvent.Hide, QEvent.Close, QEvent.DeferredDelete)
+
+
+class QFormPersistence(QObject):
+    """Persists the values of a form as JSON, keyed by the objectName of each widget.
+
+    Every value change (re)starts a debounce timer, so bursts of changes (e.g. dragging a
+    slider) are coalesced into a single write once the form is idle for `delay_ms`. The
+    values are collected on the GUI thread, serializing and writing the file happens on a
+    background thread. Writes are executed in order by a single worker.
+
+    A scheduled write is executed immediately when the root is hidden, closed or deleted
+    (e.g. when its dock widget is closed), the worker is shut down together with the root or
+    when the application quits.
+
+    The stored values are the ones returned by `get_value`, e.g. (R, G, B) colors, paths,
+    datetimes as "yyyy-MM-dd HH:mm:ss" strings and (text, index) pairs for switches and combo
+    boxes (stored as JSON lists, which `set_value` accepts as well).
+
+    Example usage:
+        ```python
+            persistence = QFormPersistence(self, "~/.my_plugin/state.json")
+            persistence.restore()
+        ```
+
+    Attributes:
+        root (QWidget): The root widget of the form.
+        path (str): Path of the JSON file.
+        delay_ms (int): Debounce delay in milliseconds.
+    """
+
+    def __init__(
+        self,
+        root: QWidget,
+        path: str,
+        registry: Optional[Mapping[str, QWidget]] = None,
+        delay_ms: int = 500,
+    ) -> None:
+        """Initializes the persistence and connects it to the value signals of the form.
+
+        Args:
+            root (QWidget): The root widget of the form, also the parent of this object.
+            path (str): Path of the JSON file, "~" is expanded.
+            registry (Optional[Mapping[str, QWidget]], optional): An explicit mapping from key to
+                widget, see `collect_widgets`. Defaults to None.
+            delay_ms (int, optional): Debounce delay in milliseconds. Defaults to 500.
+        """
+        super().__init__(root)
+        self.root = root
+        self.path = os.path.expanduser(path)
+        self.delay_ms = delay_ms
+        self._registry = collect_widgets(root, registry)
+        self._restoring = False
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="napari_toolkit")
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.flush)
+
+        for widget in self._registry.values():
+            handler = get_handler(type(widget))
+            if handler.signal is not None:
+                handler.signal(widget).connect(self.schedule_save)
+        get_form_notifier(root).form_changed.connect(self.schedule_save)
+
+        root.installEventFilter(self)
+        # This object is deleted before the root emits destroyed, only Python state is used
+        root.destroyed.connect(lambda *_: self._shutdown())
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.close)
+
+    def restore(self) -> Set[str]:
+        """Restores the stored state in one bulk pass (see `set_values`).
+
+        Returns:
+            Set[str]: The keys whose value changed, empty if no state is stored yet.
+        """
+        if not os.path.exists(self.path):
+            return set()
+        with open(self.path) as f:
+            state = json.load(f)
+
+        self._restoring = True
+        try:
+            return set_values(self.root, state, self._registry)
+        finally:
+            self._restoring = False
+
+    def schedule_save(self, *args, **kwargs) -> None:
+        """Schedules a write, restarting the debounce timer if a write is already scheduled."""
+        if not self._restoring and not self._closed:
+            self._timer.start()
+
+    def flush(self) -> Future:
+        """Collects the current values and writes them on the background thread.
+
+        Returns:
+            Future: The future of the write.
+        """
+        self._timer.stop()
+        state = get_values(self.root, self._registry)
+        future = self._executor.submit(_write_json, self.path, state)
+        future.add_done_callback(self._on_written)
+        return future
+
+    def _on_written(self, future: Future) -> None:
+        exception = future.exception()
+        if exception is not None:
+            warnings.warn(
+                f"Failed to save the form state to {self.path}: {exception}", stacklevel=1
+            )
+
+    def close(self) -> None:
+        """Writes a scheduled state immediately and waits until all writes are finished."""
+        if self._closed:
+            return
+        if self._timer.isActive():
+            self.flush()
+        self._shutdown()
+
+    def _shutdown(self) -> None:
+        self._closed = True
+        self._executor.shutdown(wait=True)
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        # The values can not be collected anymore once the root is destroyed
+        if event.type() in _FLUSH_EVENTS and self._timer.isActive():
+            self.flush()
+        return False
@@ -0,0 +1,161 @@
+import heapq
+import itertools
+import math
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+from qtpy.QtCore import QObject, QTimer
+
+
+class QCallbackScheduler(QObject):
+    """Runs delayed callbacks of many widgets with a single QTimer.
+
+    Deadlines are kept in a heap and the timer is always armed for the earliest one. A
+    rescheduled entry simply gets a new deadline, outdated heap items are skipped when they
+    become due.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._counter = itertools.count()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run_due)
+
+    def schedule(self, entry: Any, delay_ms: int) -> None:
+        """(Re)schedules an entry, its `_fire` method is called after `delay_ms`.
+
+        Args:
+            entry (Any): An object with a `_fire()` method and a `_token` attribute.
+            delay_ms (int): Delay in milliseconds.
+        """
+        token = next(self._counter)
+        entry._token = token
+        deadline = time.monotonic() + delay_ms / 1000
+        heapq.heappush(self._heap, (deadline, token, entry))
+        if self._heap[0][1] == token:
+            self._arm()
+
+    def cancel(self, entry: Any) -> None:
+        """Cancels a scheduled entry."""
+        entry._token = None
+
+    def _arm(self) -> None:
+        if self._heap:
+            remaining = self._heap[0][0] - time.monotonic()
+            self._timer.start(max(0, math.ceil(remaining * 1000)))
+
+    def _run_due(self) -> None:
+        now = time.monotonic()
+        while self._heap and self._heap[0][0] <= now:
+            _deadline, token, entry = heapq.heappop(self._heap)
+            if entry._token == token:
+                entry._token = None
+                entry._fire()
+        self._arm()
+
+
+_scheduler: Optional[QCallbackScheduler] = None
+
+
+def get_scheduler() -> QCallbackScheduler:
+    """Returns the scheduler shared by all debounced and throttled callbacks."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = QCallbackScheduler()
+    return _scheduler
+
+
+class Debounced:
+    """Calls a function once the calls to this wrapper paused for `wait_ms`.
+
+    Attributes:
+        function (Callable): The wrapped function.
+        wait_ms (int): The quiet period in milliseconds.
+        leading (bool): Call the function at the first call of a burst.
+        trailing (bool): Call the function with the latest arguments at the end of a burst.
+    """
+
+    def __init__(
+        self, function: Callable, wait_ms: int, leading: bool = False, trailing: bool = True
+    ) -> None:
+        if not (leading or trailing):
+            raise ValueError("At least one of leading and trailing has to be True.")
+        self.function = function
+        self.wait_ms = wait_ms
+        self.leading = leading
+        self.trailing = trailing
+        self._token = None
+        self._args = ()
+        self._pending = False
+
+    def __call__(self, *args) -> None:
+        in_burst = self._token is not None
+        self._args = args
+        if self.leading and not in_burst:
+            self.function(*args)
+            self._pending = False
+        else:
+            self._pending = True
+        get_scheduler().schedule(self, self.wait_ms)
+
+    def _fire(self) -> None:
+        if self.trailing and self._pending:
+            self._pending = False
+            self.function(*self._args)
+        self._args = ()
+
+    def cancel(self) -> None:
+        """Drops a pending trailing call."""
+        get_scheduler().cancel(self)
+        self._pending = False
+
+
+class Throttled:
+    """Calls a function at most once every `wait_ms`.
+
+    Attributes:
+        function (Callable): The wrapped function.
+        wait_ms (int): The minimal interval between two calls in milliseconds.
+        leading (bool): Call the function immediately when no interval is running.
+        trailing (bool): Call the function with the latest arguments at the end of an interval.
+    """
+
+    def __init__(
+        self, function: Callable, wait_ms: int, leading: bool = True, trailing: bool = True
+    ) -> None:
+        if not (leading or trailing):
+            raise ValueError("At least one of leading and trailing has to be True.")
+        self.function = function
+        self.wait_ms = wait_ms
+        self.leading = leading
+        self.trailing = trailing
+        self._token = None
+        self._args = ()
+        self._pending = False
+
+    def __call__(self, *args) -> None:
+        self._args = args
+        if self._token is not None:
+            self._pending = True
+            return
+        if self.leading:
+            self.function(*args)
+            self._pending = False
+        else:
+            self._pending = True
+        get_scheduler().schedule(self, self.wait_ms)
+
+    def _fire(self) -> None:
+        if self.trailing and self._pending:
+            self._pending = False
+            self.function(*self._args)
+            # The trailing call opens a new interval
+            get_scheduler().schedule(self, self.wait_ms)
+        self._args = ()
+
+    def cancel(self) -> None:
+        """Drops a pending trailing call."""
+        get_scheduler().cancel(self)
+        self._pending = False
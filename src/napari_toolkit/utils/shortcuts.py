@@ -0,0 +1,248 @@
+import itertools
+import warnings
+import weakref
+from typing import Callable, Dict, List, Optional, Set
+
+from qtpy.QtCore import QEvent, QObject, Qt
+from qtpy.QtGui import QKeySequence
+from qtpy.QtWidgets import QShortcut, QWidget
+
+
+class _ShortcutEntry:
+    """A registered shortcut of a widget."""
+
+    def __init__(
+        self,
+        key: int,
+        widget: QWidget,
+        sequence: str,
+        function: Callable,
+        group: Optional[str],
+    ) -> None:
+        self.key = key
+        self.widget = weakref.ref(widget)
+        self.widget_id = id(widget)
+        self.sequence = sequence
+        self.function = function
+        self.group = group
+        self.table: Optional[_ShortcutTable] = None
+
+    def describe(self) -> str:
+        widget = self.widget()
+        if widget is None:
+            return "a deleted widget"
+        return widget.objectName() or type(widget).__name__
+
+
+class _ShortcutTable:
+    """The dispatch table of one top-level window: one QShortcut per key sequence."""
+
+    def __init__(self, window: QWidget) -> None:
+        self.window = weakref.ref(window)
+        self.shortcuts: Dict[str, QShortcut] = {}
+        self.entries: Dict[str, List[_ShortcutEntry]] = {}
+
+
+class QShortcutManager(QObject):
+    """Owns the keyboard shortcuts of all toolkit widgets.
+
+    Shortcuts are collected in one dispatch table per top-level window. Widgets are usually
+    created before their layout is attached to a window, so a shortcut is assigned to the
+    window of its widget when the widget is shown (immediately if it is already visible)
+    and moves to the new window whenever the widget is shown in another one, e.g. after its
+    panel was docked. Each table creates a single QShortcut per key sequence which
+    dispatches to the registered functions, instead of one QShortcut per widget. Duplicates
+    within a window are reported when they are assigned, entries are removed automatically
+    when their widget is destroyed and shortcuts can be enabled or disabled per group.
+
+    When several functions share a key sequence, the last registered one whose widget is
+    visible and enabled is called.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._tables: Dict[int, _ShortcutTable] = {}
+        self._entries: Dict[int, _ShortcutEntry] = {}
+        self._widget_entries: Dict[int, List[_ShortcutEntry]] = {}
+        self._disabled_groups: Set[str] = set()
+        self._counter = itertools.count()
+
+    def register(
+        self,
+        widget: QWidget,
+        shortcut: str,
+        function: Callable,
+        group: Optional[str] = None,
+    ) -> int:
+        """Registers a shortcut for a widget.
+
+        The shortcut becomes active once the widget is shown in a window.
+
+        Args:
+            widget (QWidget): The widget the shortcut belongs to.
+            shortcut (str): The key sequence, e.g. "Ctrl+A".
+            function (Callable): Called without arguments when the shortcut is activated.
+            group (Optional[str], optional): A group name, see `set_group_enabled`.
+                Defaults to None.
+
+        Returns:
+            int: A key which can be passed to `unregister`.
+        """
+        sequence = QKeySequence(shortcut).toString(QKeySequence.PortableText)
+        entry = _ShortcutEntry(next(self._counter), widget, sequence, function, group)
+        self._entries[entry.key] = entry
+        widget_entries = self._widget_entries.get(entry.widget_id)
+        if widget_entries is None:
+            widget_entries = self._widget_entries[entry.widget_id] = []
+            widget.installEventFilter(self)
+        widget_entries.append(entry)
+        widget.destroyed.connect(lambda *_, key=entry.key: self.unregister(key))
+        if widget.isVisible():
+            self._attach(entry, widget.window())
+        return entry.key
+
+    def unregister(self, key: int) -> None:
+        """Removes a shortcut.
+
+        Args:
+            key (int): The key returned by `register`.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        widget_entries = self._widget_entries.get(entry.widget_id, [])
+        if entry in widget_entries:
+            widget_entries.remove(entry)
+        if not widget_entries:
+            self._widget_entries.pop(entry.widget_id, None)
+        self._detach(entry)
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Show:
+            for entry in list(self._widget_entries.get(id(obj), [])):
+                self._attach(entry, obj.window())
+        return False
+
+    def _table(self, window: QWidget) -> _ShortcutTable:
+        window_id = id(window)
+        table = self._tables.get(window_id)
+        # Ids are reused after a window is deleted, a table must belong to this very window
+        if table is None or table.window() is not window:
+            table = self._tables[window_id] = _ShortcutTable(window)
+            window.destroyed.connect(lambda *_, t=table: self._drop_table(window_id, t))
+        return table
+
+    def _drop_table(self, window_id: int, table: _ShortcutTable) -> None:
+        if self._tables.get(window_id) is table:
+            del self._tables[window_id]
+
+    def _attach(self, entry: _ShortcutEntry, window: QWidget) -> None:
+        """Moves an entry to the dispatch table of a window."""
+        if entry.table is not None and entry.table.window() is window:
+            return
+        self._detach(entry)
+        table = entry.table = self._table(window)
+        sequence = entry.sequence
+        entries = table.entries.setdefault(sequence, [])
+        for other in entries:
+            warnings.warn(
+                f"Shortcut '{sequence}' of {entry.describe()} is already used by "
+                f"{other.describe()} in the same window.",
+                stacklevel=2,
+            )
+        entries.append(entry)
+
+        if sequence not in table.shortcuts:
+            qshortcut = QShortcut(QKeySequence(sequence), window)
+            qshortcut.setContext(Qt.WindowShortcut)
+            qshortcut.activated.connect(lambda t=table, s=sequence: self._dispatch(t, s))
+            table.shortcuts[sequence] = qshortcut
+        self._update_enabled(table, sequence)
+
+    def _detach(self, entry: _ShortcutEntry) -> None:
+        """Removes an entry from its dispatch table, unused QShortcuts are deleted."""
+        table, entry.table = entry.table, None
+        if table is None:
+            return
+        entries = table.entries.get(entry.sequence, [])
+        if entry in entries:
+            entries.remove(entry)
+        if not entries and entry.sequence in table.shortcuts:
+            table.entries.pop(entry.sequence, None)
+            qshortcut = table.shortcuts.pop(entry.sequence)
+            try:
+                qshortcut.setEnabled(False)
+                qshortcut.deleteLater()
+            except RuntimeError:
+                # Already deleted together with the window
+                pass
+        elif entries:
+            self._update_enabled(table, entry.sequence)
+
+    def set_group_enabled(self, group: str, enabled: bool) -> None:
+        """Enables or disables all shortcuts of a group.
+
+        Args:
+            group (str): The group name given at registration.
+            enabled (bool): Whether the shortcuts of the group are active.
+        """
+        if enabled:
+            self._disabled_groups.discard(group)
+        else:
+            self._disabled_groups.add(group)
+        for table in self._tables.values():
+            for sequence in table.shortcuts:
+                self._update_enabled(table, sequence)
+
+    def is_group_enabled(self, group: str) -> bool:
+        """Returns if the shortcuts of a group are active."""
+        return group not in self._disabled_groups
+
+    def shortcuts(self, widget: Optional[QWidget] = None) -> List[str]:
+        """Returns the registered key sequences, optionally only of one widget."""
+        return [
+            entry.sequence
+            for entry in self._entries.values()
+            if widget is None or entry.widget() is widget
+        ]
+
+    def _update_enabled(self, table: _ShortcutTable, sequence: str) -> None:
+        # A QShortcut without active entries must not consume the key
+        enabled = any(entry.group not in self._disabled_groups for entry in table.entries[sequence])
+        table.shortcuts[sequence].setEnabled(enabled)
+
+    def _dispatch(self, table: _ShortcutTable, sequence: str) -> None:
+        for entry in reversed(table.entries.get(sequence, [])):
+            if entry.group in self._disabled_groups:
+                continue
+            widget = entry.widget()
+            if widget is not None and widget.isVisible() and widget.isEnabled():
+                entry.function()
+                return
+
+
+_manager: Optional[QShortcutManager] = None
+
+
+def get_shortcut_manager() -> QShortcutManager:
+    """Returns the shortcut manager shared by all widgets, it is created on first use."""
+    global _manager
+    if _manager is None:
+        _manager = QShortcutManager()
+    return _manager
+
+
+def set_shortcut_group_enabled(group: str, enabled: bool) -> None:
+    """Enables or disables all shortcuts of a group in one call.
+
+    Example usage:
+        ```python
+            setup_pushbutton(layout, "Run", function=run, shortcut="R", shortcut_group="my_plugin")
+            set_shortcut_group_enabled("my_plugin", False)
+        ```
+
+    Args:
+        group (str): The group name passed as `shortcut_group`.
+        enabled (bool): Whether the shortcuts of the group are active.
+    """
+    get_shortcut_manager().set_group_enabled(group, enabled)
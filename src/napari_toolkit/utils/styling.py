@@ -0,0 +1,69 @@
+from qtpy.QtWidgets import QWidget
+
+ACTIVE_PROPERTY = "tk_active"
+ACTIVE_STATE = f'[{ACTIVE_PROPERTY}="true"]'
+# Pseudo-states are evaluated by Qt while painting, checkable widgets need no re-polish at all
+CHECKED_STATE = ":checked"
+
+
+def highlight_stylesheet(
+    color: str, selector: str = "QPushButton", state: str = ACTIVE_STATE
+) -> str:
+    """Builds a stylesheet which highlights all matching widgets in the given state.
+
+    Args:
+        color (str): The highlight color, any stylesheet color (e.g. "rgb(0, 100, 167)").
+        selector (str, optional): The widget type selector. Defaults to "QPushButton".
+        state (str, optional): The property selector or pseudo-state of highlighted widgets.
+            Defaults to ACTIVE_STATE (the property set by `set_active`).
+
+    Returns:
+        str: The stylesheet.
+    """
+    return f"{selector}{state} {{ background-color: {color}; }}"
+
+
+def install_highlight_style(
+    widget: QWidget, color: str, selector: str = "QPushButton", state: str = ACTIVE_STATE
+) -> None:
+    """Installs the highlight stylesheet on a widget, it applies to the widget and its children.
+
+    The stylesheet is only parsed when it is installed (e.g. on creation and theme changes),
+    state changes afterwards are done with `set_active` (or by Qt for pseudo-states like
+    CHECKED_STATE). Installing the same stylesheet again is a no-op.
+
+    Args:
+        widget (QWidget): The widget, usually the container of the highlighted widgets.
+        color (str): The highlight color.
+        selector (str, optional): The widget type selector. Defaults to "QPushButton".
+        state (str, optional): The property selector or pseudo-state of highlighted widgets.
+            Defaults to ACTIVE_STATE.
+    """
+    stylesheet = highlight_stylesheet(color, selector, state)
+    if widget.styleSheet() != stylesheet:
+        widget.setStyleSheet(stylesheet)
+
+
+def set_active(widget: QWidget, active: bool) -> None:
+    """Highlights or resets a widget by flipping its active property.
+
+    Only the widget itself is re-polished, which is much cheaper than `setStyleSheet` that
+    re-parses the stylesheet and re-polishes the widget and all its children.
+
+    Example usage:
+        ```python
+            install_highlight_style(container, get_theme_palette().highlight)
+            set_active(button, True)
+        ```
+
+    Args:
+        widget (QWidget): The widget to (un)highlight.
+        active (bool): Whether the widget is highlighted.
+    """
+    if bool(widget.property(ACTIVE_PROPERTY)) == active:
+        return
+    widget.setProperty(ACTIVE_PROPERTY, active)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
@@ -1,8 +1,20 @@
-from typing import Callable
+import itertools
+import sys
+import weakref
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
 
 from napari.settings import get_settings
 from napari.utils.theme import get_theme, register_theme
 from napari.viewer import Viewer
+from qtpy.QtCore import QObject, QTimer
+
+from napari_toolkit.utils.utils import _fit_arguments
+
+try:
+    # Private napari API, only needed to notice (re)registered themes
+    from napari.utils.theme import _themes
+except ImportError:
+    _themes = None
 
 
 def change_theme(viewer: Viewer):
@@ -23,23 +35,217 @@ def change_theme(viewer: Viewer):
     settings.appearance.theme = "custom"
 
 
+class ThemePalette(NamedTuple):
+    """Colors of a Napari theme as stylesheet strings ("rgb(r, g, b)").
+
+    Attributes:
+        name (str): Name of the theme.
+        highlight (str): Color of checked/selected elements.
+        disabled (str): Text color of disabled elements, the text color blended halfway
+            towards the foreground color.
+        text (str): Text color.
+        background (str): Background color.
+        foreground (str): Foreground color, e.g. of buttons.
+    """
+
+    name: str
+    highlight: str
+    disabled: str
+    text: str
+    background: str
+    foreground: str
+
+
+# Theme name -> (napari theme, palette), cleared whenever themes are (re)registered or the
+# active theme changes, so restyling widgets never has to query the napari settings.
+_THEME_CACHE: Dict[str, Tuple[Any, ThemePalette]] = {}
+_current_theme: Optional[str] = None
+_cache_connected = False
+_cache_enabled = True
+
+
+def _invalidate_theme_cache(*args, **kwargs) -> None:
+    global _current_theme
+    _THEME_CACHE.clear()
+    _current_theme = None
+
+
+def _mix(color_a, color_b, weight: float) -> str:
+    """Blends two colors, weight is the fraction of color_b."""
+    a, b = color_a.as_rgb_tuple(alpha=False), color_b.as_rgb_tuple(alpha=False)
+    r, g, b = (round(x + (y - x) * weight) for x, y in zip(a, b))
+    return f"rgb({r}, {g}, {b})"
+
+
+def _get_cached_theme() -> Tuple[Any, ThemePalette]:
+    global _current_theme, _cache_connected, _cache_enabled
+    if not _cache_connected:
+        get_settings().appearance.events.theme.connect(_invalidate_theme_cache)
+        try:
+            _themes.events.connect(_invalidate_theme_cache)
+        except AttributeError:
+            # Registered themes can not be observed, a cached theme could be outdated
+            _cache_enabled = False
+        _cache_connected = True
+    if _current_theme is None or not _cache_enabled:
+        _current_theme = get_settings().appearance.theme
+
+    entry = _THEME_CACHE.get(_current_theme) if _cache_enabled else None
+    if entry is None:
+        theme = get_theme(_current_theme)
+        palette = ThemePalette(
+            name=_current_theme,
+            highlight=theme.highlight.as_rgb(),
+            disabled=_mix(theme.text, theme.foreground, 0.5),
+            text=theme.text.as_rgb(),
+            background=theme.background.as_rgb(),
+            foreground=theme.foreground.as_rgb(),
+        )
+        entry = (theme, palette)
+        if _cache_enabled:
+            _THEME_CACHE[_current_theme] = entry
+    return entry
+
+
 def get_theme_colors() -> dict:
     """Retrieves the color settings of the currently active Napari theme.
 
+    The theme is cached until a theme is registered or the active theme changes, the
+    returned object is shared and must not be modified. If the napari version does not allow
+    to observe registered themes, the theme is looked up on every call.
+
     Returns:
         dict: A dictionary containing theme color mappings.
     """
-    theme_name = get_settings().appearance.theme
-    theme_colors = get_theme(theme_name)
-    return theme_colors
+    return _get_cached_theme()[0]
+
+
+def get_theme_palette() -> ThemePalette:
+    """Retrieves the precomputed colors of the currently active Napari theme.
+
+    This is cheap enough to be called whenever a widget is created or restyled.
+
+    Example usage:
+        ```python
+            button.setStyleSheet(f"background-color: {get_theme_palette().highlight};")
+        ```
+
+    Returns:
+        ThemePalette: The highlight, disabled, text, background and foreground colors.
+    """
+    return _get_cached_theme()[1]
+
 
+class QThemeBroadcaster(QObject):
+    """Forwards Napari theme changes to all registered listeners.
 
-def connect_theme_change(funct: Callable) -> None:
+    The broadcaster subscribes to the Napari theme event once. Bound methods (e.g.
+    `widget.on_theme_change`) are only referenced weakly and removed as soon as their object
+    is garbage collected, listeners of deleted Qt widgets are dropped on the next broadcast.
+    Bursts of theme events are coalesced and all listeners are called in a single pass from
+    the event loop, with the latest event like a direct connection to the Napari event.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._listeners: Dict[int, Callable[[], Optional[Callable]]] = {}
+        self._counter = itertools.count()
+        self._event: Any = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.broadcast)
+        get_settings().appearance.events.theme.connect(self._on_theme_event)
+
+    def __len__(self) -> int:
+        return len(self._listeners)
+
+    def connect(self, funct: Callable) -> int:
+        """Registers a listener, bound methods are referenced weakly.
+
+        Args:
+            funct (Callable): The function to be executed on theme change.
+
+        Returns:
+            int: A key which can be passed to `disconnect`.
+        """
+        key = next(self._counter)
+        if hasattr(funct, "__self__") and hasattr(funct, "__func__"):
+            ref = weakref.WeakMethod(funct, lambda _: self._listeners.pop(key, None))
+        else:
+            ref = lambda: funct  # noqa: E731
+        self._listeners[key] = ref
+        return key
+
+    def disconnect(self, key: int) -> None:
+        """Removes a listener.
+
+        Args:
+            key (int): The key returned by `connect`.
+        """
+        self._listeners.pop(key, None)
+
+    def _on_theme_event(self, event: Any = None) -> None:
+        self._event = event
+        self._timer.start()
+
+    def broadcast(self) -> None:
+        """Calls all live listeners with the latest theme event and drops deleted ones.
+
+        Listeners without parameters are called without the event. Exceptions of a listener
+        are passed to `sys.excepthook` (which napari shows as notification), the remaining
+        listeners are called anyway.
+        """
+        self._timer.stop()
+        event, self._event = self._event, None
+        for key, ref in list(self._listeners.items()):
+            funct = ref()
+            if funct is None:
+                self._listeners.pop(key, None)
+                continue
+            try:
+                _fit_arguments(funct)(event)
+            except RuntimeError as error:
+                # The wrapped C++ widget was deleted while the Python object is still alive
+                if "deleted" in str(error):
+                    self._listeners.pop(key, None)
+                else:
+                    sys.excepthook(*sys.exc_info())
+            except Exception:  # noqa: BLE001
+                sys.excepthook(*sys.exc_info())
+
+
+_broadcaster: Optional[QThemeBroadcaster] = None
+
+
+def get_theme_broadcaster() -> QThemeBroadcaster:
+    """Returns the theme broadcaster shared by all widgets, it is created on first use."""
+    global _broadcaster
+    if _broadcaster is None:
+        _broadcaster = QThemeBroadcaster()
+    return _broadcaster
+
+
+def connect_theme_change(funct: Callable) -> int:
     """Connects a function to the Napari theme change event.
 
-    This allows automatic execution of the given function whenever the theme changes.
+    This allows automatic execution of the given function whenever the theme changes. The
+    function is registered at the central `QThemeBroadcaster`, bound methods are only
+    referenced weakly, so widgets can connect their own methods without being kept alive.
 
     Args:
         funct (Callable): The function to be executed on theme change.
+
+    Returns:
+        int: A key which can be passed to `disconnect_theme_change`.
+    """
+    return get_theme_broadcaster().connect(funct)
+
+
+def disconnect_theme_change(key: int) -> None:
+    """Disconnects a function connected by `connect_theme_change`.
+
+    Args:
+        key (int): The key returned by `connect_theme_change`.
     """
-    get_settings().appearance.events.theme.connect(funct)
+    get_theme_broadcaster().disconnect(key)
@@ -0,0 +1,252 @@
+import contextlib
+import math
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple
+
+import numpy as np
+from qtpy.QtCore import QObject, QRunnable, Qt, QThreadPool, Signal
+from qtpy.QtGui import QImage, QPixmap
+
+if TYPE_CHECKING:
+    from napari.layers import Layer
+
+# (layer id, data version, contrast limits)
+ThumbnailKey = Tuple[int, int, Optional[Tuple[float, ...]]]
+# Layer events which change the look of a layer, in-place edits do not update its thumbnail
+_EDIT_EVENTS = ("paint", "labels_update")
+_CHANGE_EVENTS = ("data", "thumbnail") + _EDIT_EVENTS
+
+
+def _downsample(
+    data: Any, rgb: bool, contrast_limits: Optional[Tuple[float, ...]], size: int
+) -> np.ndarray:
+    """Renders the central plane of the data as RGBA, reading only every n-th pixel."""
+    while data.ndim > 2 + rgb:
+        data = data[data.shape[0] // 2]
+    step = max(1, math.ceil(max(data.shape[:2]) / size))
+    plane = np.asarray(data[::step, ::step], dtype=np.float32)
+
+    if contrast_limits is None:
+        low, high = float(plane.min()), float(plane.max())
+    else:
+        low, high = contrast_limits[0], contrast_limits[-1]
+    plane = np.clip((plane - low) / max(high - low, 1e-12), 0, 1) * 255
+    plane = plane.astype(np.uint8)
+    if not rgb:
+        plane = np.repeat(plane[..., np.newaxis], 3, axis=-1)
+    return plane
+
+
+def _render(source: Any, rgb: bool, contrast_limits: Optional[Tuple], size: int) -> QImage:
+    """Renders a thumbnail from a napari thumbnail (RGB(A) uint8) or from the layer data."""
+    if isinstance(source, np.ndarray) and source.dtype == np.uint8 and source.ndim == 3:
+        rgba = source
+    else:
+        rgba = _downsample(source, rgb, contrast_limits, size)
+    if rgba.shape[-1] == 3:
+        alpha = np.full(rgba.shape[:2] + (1,), 255, dtype=np.uint8)
+        rgba = np.concatenate([rgba, alpha], axis=-1)
+    rgba = np.ascontiguousarray(rgba)
+    height, width = rgba.shape[:2]
+    image = QImage(rgba.tobytes(), width, height, 4 * width, QImage.Format_RGBA8888).copy()
+    if max(width, height) > size:
+        image = image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return image
+
+
+class _RenderTask(QRunnable):
+    """Renders one thumbnail on the global thread pool."""
+
+    def __init__(self, cache: "QThumbnailCache", key: ThumbnailKey, args: tuple) -> None:
+        super().__init__()
+        self.cache = cache
+        self.key = key
+        self.args = args
+
+    def run(self) -> None:
+        try:
+            image = _render(*self.args)
+        except Exception:  # noqa: BLE001
+            # A broken thumbnail must not break the dropdown, the layer is listed without one
+            image = None
+        # The cache might be deleted in the meantime
+        with contextlib.suppress(RuntimeError):
+            self.cache._rendered.emit(self.key, image)
+
+
+class QThumbnailCache(QObject):
+    """An LRU cache of layer thumbnails with a byte budget, rendered on worker threads.
+
+    Thumbnails are created from `layer.thumbnail` if available, otherwise from a strided
+    downsample of the central plane of the data (the smallest level of multiscale data), so
+    only a few pixels are read even for large or lazily loaded arrays. Rendering happens on
+    the global QThreadPool, `request` never blocks and `thumbnail_ready` is emitted on the GUI
+    thread once a thumbnail is available.
+
+    Thumbnails are cached per (layer id, data version, contrast limits). The data version is
+    increased on every visual change of a layer, i.e. on its `data` and `thumbnail` events
+    (e.g. a new colormap) and on in-place edits of labels (`paint`, `labels_update`), so
+    outdated thumbnails are never returned. napari does not update `layer.thumbnail` after
+    in-place edits, such thumbnails are rendered from the data until the next `thumbnail`
+    event.
+    Each layer keeps at most one thumbnail and the least recently used thumbnails are dropped
+    as soon as the cache exceeds `max_bytes`.
+
+    Use `get_thumbnail_cache` to get the cache shared by all widgets instead of creating one.
+
+    Attributes:
+        max_bytes (int): The byte budget of the cached pixmaps.
+        size (int): The maximum width and height of the thumbnails in pixels.
+        thumbnail_ready (Signal): Emitted with the layer when its thumbnail was rendered.
+    """
+
+    thumbnail_ready = Signal(object)
+    _rendered = Signal(object, object)
+
+    def __init__(
+        self, max_bytes: int = 8 * 1024 * 1024, size: int = 32, parent: Optional[QObject] = None
+    ) -> None:
+        super().__init__(parent)
+        self.max_bytes = max_bytes
+        self.size = size
+        self._entries: OrderedDict[ThumbnailKey, Tuple[QPixmap, int]] = OrderedDict()
+        self._keys: Dict[int, ThumbnailKey] = {}
+        self._versions: Dict[int, int] = {}
+        # Layers whose napari thumbnail is outdated by an in-place edit
+        self._stale: Set[int] = set()
+        self._pending: Dict[ThumbnailKey, weakref.ReferenceType] = {}
+        self._nbytes = 0
+        self._rendered.connect(self._on_rendered)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def nbytes(self) -> int:
+        """Returns the size of all cached thumbnails in bytes."""
+        return self._nbytes
+
+    def key(self, layer: "Layer") -> ThumbnailKey:
+        """Returns the cache key of the current state of a layer."""
+        layer_id = id(layer)
+        if layer_id not in self._versions:
+            self._versions[layer_id] = 0
+            # The emitters are owned by the layer and only hold the bound method weakly
+            events = getattr(layer, "events", None)
+            for name in _CHANGE_EVENTS:
+                emitter = getattr(events, name, None)
+                if emitter is not None:
+                    emitter.connect(self._on_change)
+            weakref.finalize(layer, self._forget, layer_id)
+        contrast_limits = getattr(layer, "contrast_limits", None)
+        if contrast_limits is not None:
+            contrast_limits = tuple(float(limit) for limit in contrast_limits)
+        return layer_id, self._versions[layer_id], contrast_limits
+
+    def cached(self, layer: "Layer") -> Optional[QPixmap]:
+        """Returns the thumbnail of a layer if it is cached and up to date, never renders.
+
+        Args:
+            layer (Layer): The layer.
+
+        Returns:
+            Optional[QPixmap]: The thumbnail, None if it is not cached.
+        """
+        key = self.key(layer)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def request(self, layer: "Layer") -> Optional[QPixmap]:
+        """Returns the cached thumbnail of a layer or starts rendering it in the background.
+
+        Args:
+            layer (Layer): The layer.
+
+        Returns:
+            Optional[QPixmap]: The thumbnail, None if it is rendered (`thumbnail_ready` is
+                emitted once it is available).
+        """
+        pixmap = self.cached(layer)
+        key = self.key(layer)
+        if pixmap is not None or key in self._pending:
+            return pixmap
+
+        # The sources are picked on the GUI thread, the worker only reads arrays
+        thumbnail = getattr(layer, "thumbnail", None)
+        if isinstance(thumbnail, np.ndarray) and thumbnail.size and key[0] not in self._stale:
+            source = thumbnail
+        else:
+            source = layer.data
+            if getattr(layer, "multiscale", False):
+                source = source[-1]
+        args = (source, bool(getattr(layer, "rgb", False)), key[2], self.size)
+        self._pending[key] = weakref.ref(layer)
+        QThreadPool.globalInstance().start(_RenderTask(self, key, args))
+        return None
+
+    def setMaxBytes(self, max_bytes: int) -> None:
+        """Changes the byte budget, thumbnails above the budget are dropped immediately."""
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def clear(self) -> None:
+        """Drops all cached thumbnails."""
+        self._entries.clear()
+        self._keys.clear()
+        self._nbytes = 0
+
+    def _on_rendered(self, key: ThumbnailKey, image: Optional[QImage]) -> None:
+        ref = self._pending.pop(key, None)
+        layer = ref() if ref is not None else None
+        # Results of deleted or changed layers are outdated
+        if layer is None or image is None or self.key(layer) != key:
+            return
+        self._discard(self._keys.get(key[0]))
+        pixmap = QPixmap.fromImage(image)
+        nbytes = 4 * pixmap.width() * pixmap.height()
+        self._entries[key] = (pixmap, nbytes)
+        self._keys[key[0]] = key
+        self._nbytes += nbytes
+        self._evict()
+        if key in self._entries:
+            self.thumbnail_ready.emit(layer)
+
+    def _discard(self, key: Optional[ThumbnailKey]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry[1]
+            self._keys.pop(key[0], None)
+
+    def _evict(self) -> None:
+        while self._entries and self._nbytes > self.max_bytes:
+            self._discard(next(iter(self._entries)))
+
+    def _on_change(self, event) -> None:
+        layer_id = id(event.source)
+        if event.type in _EDIT_EVENTS:
+            self._stale.add(layer_id)
+        elif event.type == "thumbnail":
+            self._stale.discard(layer_id)
+        if layer_id in self._versions:
+            self._versions[layer_id] += 1
+            self._discard(self._keys.get(layer_id))
+
+    def _forget(self, layer_id: int) -> None:
+        # Ids are reused after the layer is deleted, a new layer must not inherit anything
+        self._versions.pop(layer_id, None)
+        self._stale.discard(layer_id)
+        self._discard(self._keys.get(layer_id))
+
+
+_cache: Optional[QThumbnailCache] = None
+
+
+def get_thumbnail_cache() -> QThumbnailCache:
+    """Returns the thumbnail cache shared by all widgets, it is created on first use."""
+    global _cache
+    if _cache is None:
+        _cache = QThumbnailCache()
+    return _cache
@@ -1,7 +1,65 @@
+import functools
+import inspect
 from typing import Callable, Optional
 
-from qtpy.QtGui import QKeySequence
-from qtpy.QtWidgets import QLayout, QShortcut, QWidget
+from qtpy.QtWidgets import QLayout, QWidget
+
+from napari_toolkit.utils.background import QBackgroundRunner
+from napari_toolkit.utils.instrumentation import (
+    CallbackProbe,
+    _find_setup_function,
+    is_instrumentation_enabled,
+)
+from napari_toolkit.utils.scheduler import Debounced, Throttled
+from napari_toolkit.utils.shortcuts import get_shortcut_manager
+
+
+def _fit_arguments(function: Callable) -> Callable:
+    """Drops surplus signal arguments, like Qt does when connecting a slot directly."""
+    try:
+        parameters = inspect.signature(function).parameters.values()
+    except (TypeError, ValueError):
+        return function
+    if any(p.kind == p.VAR_POSITIONAL for p in parameters):
+        return function
+    n_args = sum(p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD) for p in parameters)
+    return lambda *args: function(*args[:n_args])
+
+
+def emit_on_change(signal: str, getter: str = "value") -> Callable:
+    """Decorates a setter of a composite widget so its change signal is only emitted on change.
+
+    The value is read with the getter before and after the setter runs, the signal is emitted
+    only if it differs. The decorated setter must not emit the signal itself and gets a
+    keyword argument `force` to emit the signal anyway.
+
+    Example usage:
+        ```python
+            @emit_on_change("index_changed")
+            def setValue(self, value):
+                self.current_value = value
+        ```
+
+    Args:
+        signal (str): The attribute name of the change signal.
+        getter (str, optional): The method name which returns the current value.
+            Defaults to "value".
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(setter: Callable) -> Callable:
+        @functools.wraps(setter)
+        def wrapper(self, value, *, force: bool = False) -> None:
+            old_value = getattr(self, getter)()
+            setter(self, value)
+            if force or getattr(self, getter)() != old_value:
+                getattr(self, signal).emit()
+
+        return wrapper
+
+    return decorator
 
 
 def connect_widget(
@@ -12,6 +70,15 @@ def connect_widget(
     shortcut: Optional[str] = None,
     tooltips: Optional[str] = None,
     stretch: int = 1,
+    debounce_ms: Optional[int] = None,
+    throttle_ms: Optional[int] = None,
+    leading: Optional[bool] = None,
+    trailing: bool = True,
+    background: bool = False,
+    on_result: Optional[Callable] = None,
+    instrument: bool = False,
+    shortcut_function: Optional[Callable] = None,
+    shortcut_group: Optional[str] = None,
 ) -> QWidget:
     """
     Adds a widget to a layout, connects an optional function to a widget event,
@@ -25,19 +92,55 @@ def connect_widget(
         shortcut (Optional[str], optional): A keyboard shortcut to trigger the function.
         tooltips (Optional[str], optional): Tooltip text for the widget.
         stretch (int,optional) Stretch factor of the Widget
+        debounce_ms (Optional[int], optional): Only call the function once the event paused for
+            this many milliseconds, e.g. while a slider is dragged. Defaults to None.
+        throttle_ms (Optional[int], optional): Call the function at most once per this many
+            milliseconds. Ignored if `debounce_ms` is given. Defaults to None.
+        leading (Optional[bool], optional): Call the function at the start of a burst. Defaults
+            to False for debounce and True for throttle.
+        trailing (bool, optional): Call the function with the latest event arguments at the end
+            of a burst. Defaults to True.
+        background (bool, optional): Run the function on a worker thread. A new trigger makes
+            running calls stale (see `is_cancelled`), only the latest result is used.
+            Defaults to False.
+        on_result (Optional[Callable], optional): Called on the GUI thread with the return
+            value of the function, only used with `background`. Defaults to None.
+        instrument (bool, optional): Record the timings of the function, see
+            `get_callback_stats`. Always on after `enable_instrumentation`. Defaults to False.
+        shortcut_function (Optional[Callable], optional): The function triggered by the shortcut
+            instead of `function`. Defaults to None.
+        shortcut_group (Optional[str], optional): Group of the shortcut, see
+            `set_shortcut_group_enabled`. Defaults to None.
 
     Returns:
         QWidget: The configured widget added to the layout.
     """
     if function and widget_event:
+        probe = None
+        if instrument or is_instrumentation_enabled():
+            probe = CallbackProbe(widget, _find_setup_function())
+            function = probe.measure(_fit_arguments(function))
+        if background:
+            function = QBackgroundRunner(_fit_arguments(function), on_result, parent=widget)
+        if debounce_ms is not None:
+            leading = False if leading is None else leading
+            function = Debounced(_fit_arguments(function), debounce_ms, leading, trailing)
+        elif throttle_ms is not None:
+            leading = True if leading is None else leading
+            function = Throttled(_fit_arguments(function), throttle_ms, leading, trailing)
+        if probe is not None:
+            function = probe.trigger(function)
         widget_event.connect(function)
-        if shortcut:
-            key = QShortcut(QKeySequence(shortcut), widget)
-            key.activated.connect(function)
+        if shortcut_function is None:
+            shortcut_function = function
 
     if tooltips:
         widget.setToolTip(tooltips)
 
     if layout is not None:
         layout.addWidget(widget, stretch=stretch)
+
+    # Registered after adding the widget to the layout, so it is assigned to the right window
+    if shortcut and shortcut_function:
+        get_shortcut_manager().register(widget, shortcut, shortcut_function, shortcut_group)
     return widget
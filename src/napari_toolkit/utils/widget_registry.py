@@ -0,0 +1,189 @@
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Type, Union
+
+from qtpy.QtCore import QDateTime
+from qtpy.QtWidgets import (
+    QCheckBox,
+    QComboBox,
+    QDateTimeEdit,
+    QDoubleSpinBox,
+    QLineEdit,
+    QPlainTextEdit,
+    QProgressBar,
+    QRadioButton,
+    QSlider,
+    QSpinBox,
+    QTextEdit,
+    QWidget,
+)
+
+Validator = Union[type, Tuple[type, ...], Callable[[Any], bool]]
+
+
+class ValueHandler(NamedTuple):
+    """Getter, setter and validator used by `get_value`/`set_value` for a widget type.
+
+    Attributes:
+        getter (Callable[[QWidget], Any]): Returns the value of the widget.
+        setter (Callable[[QWidget, Any], None]): Assigns a value to the widget.
+        validator (Optional[Callable[[Any], bool]]): Returns False for values the setter can not handle.
+        expected (str): Description of valid values, used in the error message.
+        signal (Optional[Callable[[QWidget], Any]]): Returns the signal emitted when the value
+            of the widget changes.
+    """
+
+    getter: Callable[[QWidget], Any]
+    setter: Callable[[QWidget, Any], None]
+    validator: Optional[Callable[[Any], bool]] = None
+    expected: str = "a valid value"
+    signal: Optional[Callable[[QWidget], Any]] = None
+
+
+_HANDLERS: Dict[type, ValueHandler] = {}
+_CACHE: Dict[type, Optional[ValueHandler]] = {}
+
+
+def register_widget(
+    widget_type: Type[QWidget],
+    getter: Callable[[QWidget], Any],
+    setter: Callable[[QWidget, Any], None],
+    validator: Optional[Validator] = None,
+    expected: str = "a valid value",
+    signal: Optional[Callable[[QWidget], Any]] = None,
+) -> None:
+    """Registers how `get_value` and `set_value` handle a widget type.
+
+    The handler is used for the given type and all its subclasses, unless a subclass has a
+    handler of its own. Registering a type again replaces its handler.
+
+    Example usage:
+        ```python
+            register_widget(
+                MyWidget,
+                getter=lambda w: w.my_value(),
+                setter=lambda w, v: w.set_my_value(v),
+                validator=(int, float),
+                expected="a number",
+                signal=lambda w: w.my_value_changed,
+            )
+        ```
+
+    Args:
+        widget_type (Type[QWidget]): The widget class.
+        getter (Callable[[QWidget], Any]): Function returning the value of a widget.
+        setter (Callable[[QWidget, Any], None]): Function assigning a value to a widget.
+        validator (Optional[Validator], optional): A type, tuple of types or predicate the value
+            has to satisfy before it is passed to the setter. Defaults to None.
+        expected (str, optional): Description of valid values, used in the error message.
+            Defaults to "a valid value".
+        signal (Optional[Callable[[QWidget], Any]], optional): Function returning the signal
+            which is emitted when the value of a widget changes. Defaults to None.
+    """
+    if isinstance(validator, (type, tuple)):
+        value_types = validator
+
+        def validator(value):
+            return isinstance(value, value_types)
+
+    _HANDLERS[widget_type] = ValueHandler(getter, setter, validator, expected, signal)
+    _CACHE.clear()
+
+
+def get_handler(widget_type: Type[QWidget]) -> Optional[ValueHandler]:
+    """Returns the handler of a widget type.
+
+    The handler is resolved through the MRO of the type, the result is cached per class.
+
+    Args:
+        widget_type (Type[QWidget]): The widget class.
+
+    Returns:
+        Optional[ValueHandler]: The handler or None if the type is not supported.
+    """
+    try:
+        return _CACHE[widget_type]
+    except KeyError:
+        pass
+    handler = None
+    for cls in widget_type.__mro__:
+        if cls in _HANDLERS:
+            handler = _HANDLERS[cls]
+            break
+    _CACHE[widget_type] = handler
+    return handler
+
+
+def set_selection(widget: QWidget, value: Any) -> None:
+    """Selects an item of a selection widget (e.g. QComboBox) by its text or index.
+
+    A (text, index) pair as returned by `get_selection` is resolved by the text first and
+    falls back to the index if the text is not found.
+    """
+    if isinstance(value, (tuple, list)) and len(value) == 2:
+        index = widget.findText(value[0])
+        widget.setCurrentIndex(index if index != -1 else value[1])
+    elif isinstance(value, str):
+        index = widget.findText(value)
+        if index != -1:
+            widget.setCurrentIndex(index)
+    elif isinstance(value, int):
+        widget.setCurrentIndex(value)
+
+
+def get_selection(widget: QWidget) -> Tuple[str, int]:
+    """Returns the current text and index of a selection widget (e.g. QComboBox)."""
+    return widget.currentText(), widget.currentIndex()
+
+
+# 1. Buttons & Checkable Widgets
+for _cls in (QCheckBox, QRadioButton):
+    register_widget(
+        _cls,
+        lambda w: w.isChecked(),
+        lambda w, v: w.setChecked(v),
+        bool,
+        "a boolean",
+        lambda w: w.toggled,
+    )
+# 2. Input & Text Fields
+register_widget(
+    QLineEdit,
+    lambda w: w.text(),
+    lambda w, v: w.setText(v),
+    str,
+    "a string",
+    lambda w: w.textChanged,
+)
+for _cls in (QTextEdit, QPlainTextEdit):
+    register_widget(
+        _cls,
+        lambda w: w.toPlainText(),
+        lambda w, v: w.setPlainText(v),
+        str,
+        "a string",
+        lambda w: w.textChanged,
+    )
+# 3. Numeric Inputs (Spinbox, Slider, Progress)
+for _cls in (QSpinBox, QDoubleSpinBox, QSlider):
+    register_widget(
+        _cls,
+        lambda w: w.value(),
+        lambda w, v: w.setValue(v),
+        (int, float),
+        "a number",
+        lambda w: w.valueChanged,
+    )
+# A progress bar is no input, its value changes are not user edits
+register_widget(
+    QProgressBar, lambda w: w.value(), lambda w, v: w.setValue(v), (int, float), "a number"
+)
+# 4. Selection Widgets
+register_widget(QComboBox, get_selection, set_selection, signal=lambda w: w.currentIndexChanged)
+# 5.1 Dialog - Date
+register_widget(
+    QDateTimeEdit,
+    lambda w: w.dateTime().toString("yyyy-MM-dd HH:mm:ss"),
+    lambda w, v: w.setDateTime(QDateTime.fromString(v, "yyyy-MM-dd HH:mm:ss")),
+    str,
+    "a string",
+    lambda w: w.dateTimeChanged,
+)
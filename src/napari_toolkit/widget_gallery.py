@@ -40,6 +40,7 @@ from napari_toolkit.widgets import (
     setup_pushbutton,
     setup_radiobutton,
     setup_savefileselect,
+    setup_searchswitch,
     setup_slider,
     setup_spinbox,
     setup_textedit,
@@ -216,6 +217,13 @@ class GalleryWidget(QWidget):
         _ = setup_hswitch(layout_sw, ["A", "B", "C"], default=1, function=lambda: print("QHSwitch"))
         _ = setup_label(layout_sw, "QVSwitch")
         _ = setup_vswitch(layout_sw, ["A", "B", "C"], default=1, function=lambda: print("QVSwitch"))
+        _ = setup_label(layout_sw, "QSearchSwitch")
+        _ = setup_searchswitch(
+            layout_sw,
+            [f"Class {i}" for i in range(1000)],
+            default=1,
+            function=lambda: print("QSearchSwitch"),
+        )
 
         return _container
 
@@ -1,60 +1,83 @@
-from .acknowledgements import setup_acknowledgements
-from .buttons.icon_button import setup_iconbutton
-from .buttons.push_button import setup_pushbutton
-from .buttons.radio_button import setup_radiobutton
-from .buttons.toggle_button import setup_togglebutton
-from .buttons.tool_button import setup_toolbutton
-from .checkbox import setup_checkbox
-from .color.color_picker import setup_colorpicker
-from .color.colorbar import setup_colorbar
-from .color.edit_color_picker import setup_editcolorpicker
-from .combobox import setup_combobox
-from .file_select import setup_dirselect, setup_fileselect, setup_savefileselect
-from .icon_wrapper import setup_icon_wrapper
-from .layer_select import setup_layerselect
-from .progressbar.progress_edit import setup_progressbaredit
-from .progressbar.progressbar import setup_progressbar
-from .sliders.double_slider import setup_doubleslider
-from .sliders.edit_slider import setup_editdoubleslider, setup_editslider
-from .sliders.labeled_slider import setup_labeleddoubleslider, setup_labeledslider
-from .sliders.slider import setup_slider
-from .spinbox import setup_doublespinbox, setup_spinbox
-from .switch import setup_hswitch, setup_vswitch
-from .text_edit import setup_label, setup_lineedit, setup_plaintextedit, setup_textedit
-from .timeedit import setup_timeedit
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "setup_acknowledgements",
-    "setup_pushbutton",
-    "setup_radiobutton",
-    "setup_togglebutton",
-    "setup_checkbox",
-    "setup_colorpicker",
-    "setup_colorbar",
-    "setup_editcolorpicker",
-    "setup_combobox",
-    "setup_dirselect",
-    "setup_fileselect",
-    "setup_savefileselect",
-    "setup_layerselect",
-    "setup_progressbaredit",
-    "setup_progressbar",
-    "setup_doubleslider",
-    "setup_editdoubleslider",
-    "setup_editslider",
-    "setup_labeleddoubleslider",
-    "setup_labeledslider",
-    "setup_slider",
-    "setup_doublespinbox",
-    "setup_spinbox",
-    "setup_hswitch",
-    "setup_vswitch",
-    "setup_label",
-    "setup_lineedit",
-    "setup_plaintextedit",
-    "setup_textedit",
-    "setup_timeedit",
-    "setup_icon_wrapper",
-    "setup_iconbutton",
-    "setup_toolbutton",
-]
+from napari_toolkit._lazy import attach
+
+# Submodules are only imported when one of their names is first used, which keeps heavy
+# dependencies (matplotlib, napari) out of the import path of plugins that do not need them.
+_LAZY_IMPORTS = {
+    "setup_acknowledgements": ".acknowledgements",
+    "setup_pushbutton": ".buttons.push_button",
+    "setup_radiobutton": ".buttons.radio_button",
+    "setup_togglebutton": ".buttons.toggle_button",
+    "setup_callbackstats": ".callback_stats",
+    "setup_checkbox": ".checkbox",
+    "setup_colorpicker": ".color.color_picker",
+    "setup_colorbar": ".color.colorbar",
+    "setup_editcolorpicker": ".color.edit_color_picker",
+    "setup_combobox": ".combobox",
+    "setup_dirselect": ".file_select",
+    "setup_fileselect": ".file_select",
+    "setup_savefileselect": ".file_select",
+    "setup_layerselect": ".layer_select",
+    "setup_featurestable": ".features_table",
+    "setup_progressbaredit": ".progressbar.progress_edit",
+    "setup_progressbar": ".progressbar.progressbar",
+    "setup_doubleslider": ".sliders.double_slider",
+    "setup_editdoubleslider": ".sliders.edit_slider",
+    "setup_editslider": ".sliders.edit_slider",
+    "setup_labeleddoubleslider": ".sliders.labeled_slider",
+    "setup_labeledslider": ".sliders.labeled_slider",
+    "setup_slider": ".sliders.slider",
+    "setup_doublespinbox": ".spinbox",
+    "setup_spinbox": ".spinbox",
+    "setup_searchswitch": ".search_switch",
+    "setup_hswitch": ".switch",
+    "setup_vswitch": ".switch",
+    "setup_label": ".text_edit",
+    "setup_lineedit": ".text_edit",
+    "setup_plaintextedit": ".text_edit",
+    "setup_textedit": ".text_edit",
+    "setup_timeedit": ".timeedit",
+    "setup_icon_wrapper": ".icon_wrapper",
+    "setup_iconbutton": ".buttons.icon_button",
+    "setup_toolbutton": ".buttons.tool_button",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, _LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    from .acknowledgements import setup_acknowledgements  # noqa: F401
+    from .buttons.icon_button import setup_iconbutton  # noqa: F401
+    from .buttons.push_button import setup_pushbutton  # noqa: F401
+    from .buttons.radio_button import setup_radiobutton  # noqa: F401
+    from .buttons.toggle_button import setup_togglebutton  # noqa: F401
+    from .buttons.tool_button import setup_toolbutton  # noqa: F401
+    from .callback_stats import setup_callbackstats  # noqa: F401
+    from .checkbox import setup_checkbox  # noqa: F401
+    from .color.color_picker import setup_colorpicker  # noqa: F401
+    from .color.colorbar import setup_colorbar  # noqa: F401
+    from .color.edit_color_picker import setup_editcolorpicker  # noqa: F401
+    from .combobox import setup_combobox  # noqa: F401
+    from .features_table import setup_featurestable  # noqa: F401
+    from .file_select import setup_dirselect, setup_fileselect, setup_savefileselect  # noqa: F401
+    from .icon_wrapper import setup_icon_wrapper  # noqa: F401
+    from .layer_select import setup_layerselect  # noqa: F401
+    from .progressbar.progress_edit import setup_progressbaredit  # noqa: F401
+    from .progressbar.progressbar import setup_progressbar  # noqa: F401
+    from .search_switch import setup_searchswitch  # noqa: F401
+    from .sliders.double_slider import setup_doubleslider  # noqa: F401
+    from .sliders.edit_slider import setup_editdoubleslider, setup_editslider  # noqa: F401
+    from .sliders.labeled_slider import (  # noqa: F401
+        setup_labeleddoubleslider,
+        setup_labeledslider,
+    )
+    from .sliders.slider import setup_slider  # noqa: F401
+    from .spinbox import setup_doublespinbox, setup_spinbox  # noqa: F401
+    from .switch import setup_hswitch, setup_vswitch  # noqa: F401
+    from .text_edit import (  # noqa: F401
+        setup_label,
+        setup_lineedit,
+        setup_plaintextedit,
+        setup_textedit,
+    )
+    from .timeedit import setup_timeedit  # noqa: F401
@@ -79,6 +79,7 @@ def setup_iconbutton(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Creates a push button with an icon and adds it to the specified layout.
 
@@ -94,9 +95,10 @@ def setup_iconbutton(
         tooltips (Optional[str], optional): Tooltip text for the button. Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut for quick access. Defaults to None.
         stretch (int, optional): The stretch factor in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The initialized push button with an icon.
     """
-    _widget = setup_pushbutton(layout, text, function, tooltips, shortcut, stretch)
+    _widget = setup_pushbutton(layout, text, function, tooltips, shortcut, stretch, **kwargs)
     return setup_icon(_widget, icon_name=icon_name, theme=theme)
@@ -12,6 +12,7 @@ def setup_pushbutton(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QPushButton, configure it, and add it to a layout.
 
@@ -28,6 +29,7 @@ def setup_pushbutton(
             Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut to trigger the button. Defaults to None.
         stretch (int, optional): The stretch factor for the button in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QPushButton widget added to the layout.
@@ -43,4 +45,5 @@ def setup_pushbutton(
         shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
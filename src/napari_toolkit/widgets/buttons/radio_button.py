@@ -13,6 +13,7 @@ def setup_radiobutton(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QRadioButton, configure it, and add it to a layout.
 
@@ -28,6 +29,7 @@ def setup_radiobutton(
         tooltips (Optional[str], optional): Tooltip text to display when hovering over the radio button. Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut to trigger the radio button. Defaults to None.
         stretch (int, optional): The stretch factor for the radio button in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QRadioButton widget added to the layout.
@@ -44,4 +46,5 @@ def setup_radiobutton(
         shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
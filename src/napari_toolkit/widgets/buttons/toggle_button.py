@@ -2,8 +2,10 @@ from typing import Callable, Optional
 
 from qtpy.QtWidgets import QLayout, QPushButton, QWidget
 
-from napari_toolkit.utils.theme import connect_theme_change, get_theme_colors
+from napari_toolkit.utils.styling import CHECKED_STATE, install_highlight_style
+from napari_toolkit.utils.theme import connect_theme_change, get_theme_palette
 from napari_toolkit.utils.utils import connect_widget
+from napari_toolkit.utils.widget_registry import register_widget
 
 
 class QToggleButton(QPushButton):
@@ -15,24 +17,28 @@ class QToggleButton(QPushButton):
         """
         super().__init__(parent)
         self.setCheckable(True)  # Makes it toggleable
-        self.clicked.connect(self.toggle_button)
         self.set_color()
         connect_theme_change(self.on_theme_change)
 
     def toggle_button(self):
-        if self.isChecked():
-            # self.setStyleSheet("background-color:  rgb(0,100, 167);")
-            self.setStyleSheet(f"background-color:  {self.highlight_color};")
-        else:
-            self.setStyleSheet("")
+        """Kept for compatibility, the highlight follows the checked state via the stylesheet."""
 
     def set_color(self):
-        theme_colors = get_theme_colors()
-        self.highlight_color = theme_colors.highlight
+        self.highlight_color = get_theme_palette().highlight
+        install_highlight_style(self, self.highlight_color, state=CHECKED_STATE)
 
     def on_theme_change(self, *args, **kwargs):
         self.set_color()
-        self.setStyleSheet(f"background-color: {self.highlight_color};")
+
+
+register_widget(
+    QToggleButton,
+    lambda w: w.isChecked(),
+    lambda w, v: w.setChecked(v),
+    bool,
+    "a boolean",
+    lambda w: w.toggled,
+)
 
 
 def setup_togglebutton(
@@ -43,6 +49,7 @@ def setup_togglebutton(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QToggleButton, configure it, and add it to a layout.
 
@@ -58,6 +65,7 @@ def setup_togglebutton(
         tooltips (Optional[str], optional): Tooltip text to display when hovering over the button. Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut to trigger the button. Defaults to None.
         stretch (int, optional): The stretch factor for the button in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QToggleButton widget added to the layout.
@@ -65,7 +73,6 @@ def setup_togglebutton(
 
     _widget = QToggleButton(text)
     _widget.setChecked(checked)
-    _widget.toggle_button()
 
     return connect_widget(
         layout,
@@ -75,4 +82,5 @@ def setup_togglebutton(
         shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
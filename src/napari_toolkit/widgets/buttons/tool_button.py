@@ -70,6 +70,7 @@ def setup_toolbutton(
     tooltips: Optional[str] = None,
     default=0,
     stretch: int = 1,
+    **kwargs,
 ) -> QToolButton:
     """Create a QToolButton with a dropdown menu of exclusive options.
 
@@ -89,6 +90,7 @@ def setup_toolbutton(
             Defaults to 0.
         stretch (int, optional): Stretch factor for the button in the layout.
             Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QToolButton: The configured QToolButton added to the layout.
@@ -108,15 +110,14 @@ def setup_toolbutton(
         if i == default:
             act.setChecked(True)
         group.addAction(act)
-    if function is not None:
-        menu.triggered.connect(function)
     _widget.setMenu(menu)
     return connect_widget(
         layout,
         _widget,
-        widget_event=None,
-        function=None,
+        widget_event=menu.triggered,
+        function=function,
         shortcut=None,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
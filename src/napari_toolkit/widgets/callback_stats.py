@@ -0,0 +1,116 @@
+from typing import Optional
+
+from qtpy.QtCore import QTimer
+from qtpy.QtWidgets import (
+    QHBoxLayout,
+    QHeaderView,
+    QLayout,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from napari_toolkit.utils.instrumentation import get_callback_stats, reset_callback_stats
+
+_COLUMNS = [
+    ("Setup", "setup"),
+    ("Widget", "widget"),
+    ("Calls", "calls"),
+    ("Total [ms]", "total_ms"),
+    ("Mean [ms]", "mean_ms"),
+    ("P95 [ms]", "p95_ms"),
+    ("Max [ms]", "max_ms"),
+    ("Delay [ms]", "mean_delay_ms"),
+]
+
+
+class QCallbackStats(QWidget):
+    """A table of the timings of all instrumented callbacks, the most expensive first.
+
+    The table is refreshed periodically while the widget is visible.
+
+    Example usage:
+        ```python
+            enable_instrumentation()
+            viewer.window.add_dock_widget(MyPlugin(viewer))
+            viewer.window.add_dock_widget(QCallbackStats(), name="Callback Stats")
+        ```
+
+    Attributes:
+        table (QTableWidget): The table showing the statistics.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None, refresh_ms: int = 1000) -> None:
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.table = QTableWidget(0, len(_COLUMNS))
+        self.table.setHorizontalHeaderLabels([title for title, _ in _COLUMNS])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        layout.addWidget(self.table)
+
+        buttons = QHBoxLayout()
+        refresh_button = QPushButton("Refresh")
+        refresh_button.clicked.connect(self.refresh)
+        reset_button = QPushButton("Reset")
+        reset_button.clicked.connect(self.reset)
+        buttons.addWidget(refresh_button)
+        buttons.addWidget(reset_button)
+        layout.addLayout(buttons)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(refresh_ms)
+        self._timer.timeout.connect(self.refresh)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Updates the table with the current statistics."""
+        stats = get_callback_stats()
+        self.table.setUpdatesEnabled(False)
+        self.table.setRowCount(len(stats))
+        for i, row in enumerate(stats):
+            for j, (_, key) in enumerate(_COLUMNS):
+                value = row[key]
+                text = f"{value:.2f}" if isinstance(value, float) else str(value)
+                self.table.setItem(i, j, QTableWidgetItem(text))
+        self.table.setUpdatesEnabled(True)
+
+    def reset(self) -> None:
+        """Clears all recorded timings."""
+        reset_callback_stats()
+        self.refresh()
+
+    def showEvent(self, event):
+        self._timer.start()
+        self.refresh()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+
+def setup_callbackstats(
+    layout: QLayout,
+    refresh_ms: int = 1000,
+    stretch: int = 1,
+) -> QWidget:
+    """Create a QCallbackStats table and add it to a layout.
+
+    Args:
+        layout (QLayout): The layout to which the table will be added.
+        refresh_ms (int, optional): Refresh interval in milliseconds while visible. Defaults to 1000.
+        stretch (int, optional): The stretch factor for the table in the layout. Defaults to 1.
+
+    Returns:
+        QWidget: The QCallbackStats widget added to the layout.
+    """
+    _widget = QCallbackStats(refresh_ms=refresh_ms)
+    if layout is not None:
+        layout.addWidget(_widget, stretch=stretch)
+    return _widget
@@ -12,6 +12,7 @@ def setup_checkbox(
     function: Optional[Callable] = None,
     tooltips: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QCheckBox, configure it, and add it to a layout.
 
@@ -26,6 +27,7 @@ def setup_checkbox(
         function (Optional[Callable], optional): A callback function to execute when the `stateChanged` signal is triggered. Defaults to None.
         tooltips (Optional[str], optional): Tooltip text to display when hovering over the checkbox. Defaults to None.
         stretch (int, optional): The stretch factor for the checkbox in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QCheckBox widget added to the layout.
@@ -41,4 +43,5 @@ def setup_checkbox(
         shortcut=None,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
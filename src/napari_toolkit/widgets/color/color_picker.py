@@ -4,6 +4,7 @@ from qtpy.QtGui import QColor
 from qtpy.QtWidgets import QColorDialog, QLayout, QPushButton, QSizePolicy, QWidget
 
 from napari_toolkit.utils.utils import connect_widget
+from napari_toolkit.utils.widget_registry import register_widget
 
 
 class QColorPicker(QPushButton):
@@ -62,6 +63,14 @@ class QColorPicker(QPushButton):
         self.update_button_color()
 
 
+register_widget(
+    QColorPicker,
+    lambda w: w.get_color(),
+    lambda w, v: w.set_color(v),
+    signal=lambda w: w.clicked,
+)
+
+
 def setup_colorpicker(
     layout: QLayout,
     initial_color: Tuple[int] = (255, 255, 255),
@@ -70,6 +79,7 @@ def setup_colorpicker(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Creates and adds a QColorPicker widget to the specified layout.
 
@@ -81,6 +91,7 @@ def setup_colorpicker(
         tooltips (Optional[str], optional): Tooltip text for the widget. Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut for quick access. Defaults to None.
         stretch (int, optional): The stretch factor in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The initialized QColorPicker widget.
@@ -96,4 +107,5 @@ def setup_colorpicker(
         shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
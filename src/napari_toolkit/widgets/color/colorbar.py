@@ -1,11 +1,46 @@
-from typing import Tuple
+from typing import Callable, Dict, Optional, Tuple
 
-import matplotlib
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from qtpy.QtWidgets import QLayout, QWidget
+import numpy as np
+from qtpy.QtCore import QPointF, QRectF, QSize, Qt
+from qtpy.QtGui import QColor, QFont, QLinearGradient, QPainter
+from qtpy.QtWidgets import QLayout, QSizePolicy, QWidget
 
-matplotlib.use("Qt5Agg")
+# Pixels per inch used to translate the matplotlib style figsize for non-matplotlib backends.
+_FIGSIZE_DPI = 100
+
+_COLORBAR_BACKENDS: Dict[str, Callable[..., QWidget]] = {}
+_DEFAULT_BACKEND = "matplotlib"
+
+
+def register_colorbar_backend(name: str, factory: Callable[..., QWidget]) -> None:
+    """Registers a backend which can be selected in `setup_colorbar`.
+
+    The factory is called with the keyword arguments `colormap`, `text_low`, `text_high`,
+    `color_low`, `color_high` and `figsize` and has to return the colorbar QWidget. Heavy
+    dependencies should be imported inside the factory, so they are only loaded on first use.
+
+    Args:
+        name (str): Name of the backend.
+        factory (Callable[..., QWidget]): Function creating the colorbar widget.
+    """
+    _COLORBAR_BACKENDS[name] = factory
+
+
+def set_colorbar_backend(name: str) -> None:
+    """Sets the backend used by `setup_colorbar` if no backend is given explicitly.
+
+    Args:
+        name (str): Name of a registered backend.
+
+    Raises:
+        ValueError: If no backend with this name is registered.
+    """
+    global _DEFAULT_BACKEND
+    if name not in _COLORBAR_BACKENDS:
+        raise ValueError(
+            f"Unknown colorbar backend '{name}'. Available backends are {list(_COLORBAR_BACKENDS)}."
+        )
+    _DEFAULT_BACKEND = name
 
 
 def get_colorbar(
@@ -21,6 +56,8 @@ def get_colorbar(
     This function creates a horizontal colorbar using a specified colormap, with
     customizable labels and text colors for the low and high ends. The figure background
     is set to transparent, and axis ticks and labels are removed.
+    Matplotlib is imported on the first call and the figure is created without pyplot,
+    so the global matplotlib backend is left untouched.
 
     Args:
         colormap_name (str): Name of the colormap to use (e.g., "viridis", "coolwarm").
@@ -31,11 +68,16 @@ def get_colorbar(
         figsize (Tuple[float, float], optional): Size of the figure in inches (width, height). Defaults to (1, 0.3).
 
     Returns:
-        plt.Figure: The Matplotlib figure containing the colorbar.
+        matplotlib.figure.Figure: The Matplotlib figure containing the colorbar.
     """
-    cmap = plt.get_cmap(colormap_name)
+    import matplotlib
+    from matplotlib.cm import ScalarMappable
+    from matplotlib.figure import Figure
 
-    fig, ax = plt.subplots(figsize=figsize)  # Adjust the figure size
+    cmap = matplotlib.colormaps[colormap_name]
+
+    fig = Figure(figsize=figsize)  # Adjust the figure size
+    ax = fig.add_subplot()
     # Set figure background to transparent
     fig.patch.set_alpha(0.0)
     ax.set_facecolor("none")
@@ -64,9 +106,9 @@ def get_colorbar(
     )
 
     # Create a ScalarMappable and add the colorbar
-    sm = plt.cm.ScalarMappable(cmap=cmap)  # , norm=norm)
+    sm = ScalarMappable(cmap=cmap)
     sm.set_array([])  # Empty array needed for colorbar
-    cb = plt.colorbar(sm, cax=ax, orientation="horizontal")  # , shrink=0.1, aspect=50)
+    cb = fig.colorbar(sm, cax=ax, orientation="horizontal")
     cb.outline.set_edgecolor("none")
 
     # Remove the axis ticks and labels completely
@@ -76,11 +118,115 @@ def get_colorbar(
     cb.ax.set_xticks([])  # Ensure no ticks remain
     cb.ax.set_yticks([])
 
-    plt.subplots_adjust(left=0, right=1, top=1, bottom=0)
+    fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
 
     return fig
 
 
+def _matplotlib_colorbar(
+    colormap: str,
+    text_low: str,
+    text_high: str,
+    color_low: str,
+    color_high: str,
+    figsize: Tuple[float, float],
+) -> QWidget:
+    """Creates the colorbar as a Matplotlib FigureCanvas."""
+    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+
+    fig = get_colorbar(colormap, text_low, text_high, color_low, color_high, figsize)
+    return FigureCanvas(fig)
+
+
+class QColorbar(QWidget):
+    """A horizontal colorbar painted with Qt.
+
+    The colorbar is drawn as a linear gradient with a label at each end and does not
+    require matplotlib.
+
+    Attributes:
+        colors (np.ndarray): The RGBA colors (0-1) of the gradient stops.
+        text_low (str): Label for the low end of the colorbar.
+        text_high (str): Label for the high end of the colorbar.
+        color_low (QColor): Text color for the low label.
+        color_high (QColor): Text color for the high label.
+    """
+
+    def __init__(
+        self,
+        colors: np.ndarray,
+        text_low: str = "low",
+        text_high: str = "high",
+        color_low: str = "white",
+        color_high: str = "black",
+        figsize: Tuple[float, float] = (1, 0.3),
+        parent: Optional[QWidget] = None,
+    ) -> None:
+        """Initializes the QColorbar widget.
+
+        Args:
+            colors (np.ndarray): The RGBA colors (0-1) of the gradient stops, shape (N, 4).
+            text_low (str, optional): Label for the low end of the colorbar. Defaults to "low".
+            text_high (str, optional): Label for the high end of the colorbar. Defaults to "high".
+            color_low (str, optional): Text color for the low label. Defaults to "white".
+            color_high (str, optional): Text color for the high label. Defaults to "black".
+            figsize (Tuple[float, float], optional): Size of the colorbar in inches (width, height). Defaults to (1, 0.3).
+            parent (Optional[QWidget], optional): The parent widget. Defaults to None.
+        """
+        super().__init__(parent)
+        self.colors = np.asarray(colors, dtype=float)
+        self.text_low = text_low
+        self.text_high = text_high
+        self.color_low = QColor(color_low)
+        self.color_high = QColor(color_high)
+        self._size = QSize(int(figsize[0] * _FIGSIZE_DPI), int(figsize[1] * _FIGSIZE_DPI))
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.setMinimumHeight(self._size.height())
+
+    def sizeHint(self) -> QSize:
+        return self._size
+
+    def paintEvent(self, event) -> None:
+        """Paints the gradient and the labels."""
+        painter = QPainter(self)
+        rect = QRectF(self.rect())
+
+        gradient = QLinearGradient(QPointF(rect.left(), 0), QPointF(rect.right(), 0))
+        n = len(self.colors)
+        for i, color in enumerate(self.colors):
+            gradient.setColorAt(i / max(n - 1, 1), QColor.fromRgbF(*color))
+        painter.fillRect(rect, gradient)
+
+        font = QFont(self.font())
+        font.setBold(True)
+        painter.setFont(font)
+        text_rect = rect.adjusted(0.02 * rect.width(), 0, -0.02 * rect.width(), 0)
+        painter.setPen(self.color_low)
+        painter.drawText(text_rect, int(Qt.AlignLeft | Qt.AlignVCenter), self.text_low)
+        painter.setPen(self.color_high)
+        painter.drawText(text_rect, int(Qt.AlignRight | Qt.AlignVCenter), self.text_high)
+        painter.end()
+
+
+def _napari_colorbar(
+    colormap: str,
+    text_low: str,
+    text_high: str,
+    color_low: str,
+    color_high: str,
+    figsize: Tuple[float, float],
+) -> QWidget:
+    """Creates the colorbar as a QColorbar using the colors of a napari colormap."""
+    from napari.utils.colormaps import ensure_colormap
+
+    colors = ensure_colormap(colormap).map(np.linspace(0, 1, 256))
+    return QColorbar(colors, text_low, text_high, color_low, color_high, figsize)
+
+
+register_colorbar_backend("matplotlib", _matplotlib_colorbar)
+register_colorbar_backend("napari", _napari_colorbar)
+
+
 def setup_colorbar(
     layout: QLayout,
     colormap: str = "viridis",
@@ -89,11 +235,14 @@ def setup_colorbar(
     color_low: str = "white",
     color_high: str = "black",
     figsize: Tuple[float, float] = (1, 0.3),
+    backend: Optional[str] = None,
 ) -> QWidget:
     """Create a colorbar and add it to a layout.
 
     This function generates a colorbar using a specified colormap and custom labels.
-    The colorbar is embedded into a Qt layout using a Matplotlib FigureCanvas.
+    By default the colorbar is embedded into a Qt layout using a Matplotlib FigureCanvas,
+    the "napari" backend paints it with Qt instead. The dependencies of a backend are
+    only imported when the backend is used.
 
     Args:
         layout (QLayout): The layout to which the colorbar will be added.
@@ -103,11 +252,27 @@ def setup_colorbar(
         color_low (str, optional): Text color for the low label. Defaults to "white".
         color_high (str, optional): Text color for the high label. Defaults to "black".
         figsize (Tuple[float, float], optional): Size of the colorbar figure (width, height). Defaults to (1, 0.3).
+        backend (Optional[str], optional): Name of the backend ("matplotlib", "napari" or a
+            registered custom backend). Defaults to the backend set by `set_colorbar_backend`.
 
     Returns:
-        QWidget: The Matplotlib FigureCanvas widget containing the colorbar.
+        QWidget: The widget containing the colorbar.
+
+    Raises:
+        ValueError: If the backend is unknown.
     """
-    fig = get_colorbar(colormap, text_low, text_high, color_low, color_high, figsize)
-    canvas = FigureCanvas(fig)
-    layout.addWidget(canvas)
-    return canvas
+    backend = _DEFAULT_BACKEND if backend is None else backend
+    if backend not in _COLORBAR_BACKENDS:
+        raise ValueError(
+            f"Unknown colorbar backend '{backend}'. Available backends are {list(_COLORBAR_BACKENDS)}."
+        )
+    _widget = _COLORBAR_BACKENDS[backend](
+        colormap=colormap,
+        text_low=text_low,
+        text_high=text_high,
+        color_low=color_low,
+        color_high=color_high,
+        figsize=figsize,
+    )
+    layout.addWidget(_widget)
+    return _widget
@@ -5,6 +5,7 @@ from qtpy.QtCore import Signal
 from qtpy.QtWidgets import QHBoxLayout, QLayout, QSizePolicy, QWidget
 
 from napari_toolkit.utils.utils import connect_widget
+from napari_toolkit.utils.widget_registry import register_widget
 from napari_toolkit.widgets.color.color_picker import setup_colorpicker
 from napari_toolkit.widgets.sliders.edit_slider import setup_editdoubleslider
 from napari_toolkit.widgets.text_edit import setup_lineedit
@@ -121,6 +122,14 @@ class QEditColorPicker(QWidget):
         self.oppacity_slider.setValue(oppacity)
 
 
+register_widget(
+    QEditColorPicker,
+    lambda w: w.get_color(),
+    lambda w, v: w.set_color(v),
+    signal=lambda w: w.changed,
+)
+
+
 def setup_editcolorpicker(
     layout: QLayout,
     initial_color: Tuple[int, int, int] = (255, 255, 255),
@@ -128,6 +137,7 @@ def setup_editcolorpicker(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Creates and adds a QEditColorPicker to the given layout.
 
@@ -138,6 +148,7 @@ def setup_editcolorpicker(
         tooltips (Optional[str], optional): Tooltip text for the widget. Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut for quick access. Defaults to None.
         stretch (int, optional): The stretch factor in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The initialized QEditColorPicker instance.
@@ -153,4 +164,5 @@ def setup_editcolorpicker(
         shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
@@ -12,6 +12,7 @@ def setup_combobox(
     function: Optional[Callable] = None,
     tooltips: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QComboBox, configure it, and add it to a layout.
 
@@ -26,6 +27,7 @@ def setup_combobox(
         function (Optional[Callable], optional): A callback function to execute when the `currentTextChanged` signal is triggered. Defaults to None.
         tooltips (Optional[str], optional): Tooltip text to display when hovering over the combo box. Defaults to None.
         stretch (int, optional): The stretch factor for the combo box in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QComboBox widget added to the layout.
@@ -45,4 +47,5 @@ def setup_combobox(
         shortcut=None,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
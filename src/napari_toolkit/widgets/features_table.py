@@ -0,0 +1,359 @@
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from qtpy.QtCore import (
+    QItemSelection,
+    QItemSelectionModel,
+    QModelIndex,
+    QObject,
+    QTimer,
+    Signal,
+)
+from qtpy.QtWidgets import QAbstractItemView, QLayout, QTableView, QWidget
+
+from napari_toolkit.data_structs.table_model import QArrayTableModel
+from napari_toolkit.utils.lifecycle import connect_tracked, disconnect_tracked
+from napari_toolkit.utils.utils import connect_widget
+
+if TYPE_CHECKING:
+    from napari.layers import Layer
+
+
+def _runs(rows: Sequence[int]) -> List[Tuple[int, int]]:
+    """Groups sorted, unique rows into (first, last) ranges of consecutive rows."""
+    rows = np.asarray(rows, dtype=int)
+    if rows.size == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(rows) != 1) + 1
+    firsts = rows[np.r_[0, breaks]]
+    lasts = rows[np.r_[breaks - 1, rows.size - 1]]
+    return list(zip(firsts.tolist(), lasts.tolist()))
+
+
+def _equal(old: np.ndarray, new: np.ndarray) -> np.ndarray:
+    """Compares two columns elementwise, NaNs are equal to NaNs."""
+    try:
+        equal = np.asarray(old == new, dtype=bool)
+    except (TypeError, ValueError):
+        equal = None
+    if equal is None or equal.shape != old.shape:
+        return np.zeros(len(old), dtype=bool)
+    if old.dtype.kind == "f" and new.dtype.kind == "f":
+        equal |= np.isnan(old) & np.isnan(new)
+    return equal
+
+
+class QFeaturesTableModel(QArrayTableModel):
+    """A table model of the features of a napari layer, updated row by row.
+
+    The model listens to the data and features events of the layer. Added and removed objects
+    (e.g. points) are applied as row insertions and removals, changed values are signaled as
+    `dataChanged` of the affected row ranges, only a change of the columns resets the model.
+    This keeps the selection and scroll position of views intact, even for large tables.
+
+    Changing `layer.features` in place emits no napari event, call `refresh` afterwards.
+
+    Args:
+        layer (Optional[Layer], optional): A layer with features, e.g. Points, Shapes or
+            Labels. Defaults to None.
+        editable (bool, optional): Whether cells can be edited, edits are written to
+            `layer.features`. Defaults to False.
+        parent (Optional[QObject], optional): The parent object. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        layer: Optional["Layer"] = None,
+        editable: bool = False,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(None, editable=editable, parent=parent)
+        self._layer: Optional[weakref.ReferenceType] = None
+        self._removing: Optional[List[int]] = None
+        self._synced: Any = None
+        self.setLayer(layer)
+
+    def layer(self) -> Optional["Layer"]:
+        """Returns the layer of the model, None if it has none or it was deleted."""
+        return self._layer() if self._layer is not None else None
+
+    def setLayer(self, layer: Optional["Layer"]) -> None:
+        """Shows the features of another layer, the model is reset.
+
+        Args:
+            layer (Optional[Layer]): The layer, None clears the model.
+        """
+        old_layer = self.layer()
+        if old_layer is not None:
+            disconnect_tracked(self, old_layer.events.data, self._on_data)
+            disconnect_tracked(self, old_layer.events.features, self._on_features)
+        self._layer = weakref.ref(layer) if layer is not None else None
+        self._removing = None
+        if layer is not None:
+            connect_tracked(self, layer.events.data, self._on_data)
+            connect_tracked(self, layer.events.features, self._on_features)
+        self.setSource(layer.features if layer is not None else None)
+
+    def refresh(self) -> None:
+        """Updates the model to the current features of the layer.
+
+        Rows behind the previous end are inserted, missing rows at the end are removed and
+        rows with changed values are signaled. Other rows are left untouched.
+        """
+        self._update(None)
+
+    def _on_features(self, event) -> None:
+        # napari emits the features event right after the data events, which were applied
+        layer = self.layer()
+        if layer is not None and layer.features is self._synced:
+            self._synced = None
+            return
+        self.refresh()
+
+    def _clear_synced(self) -> None:
+        self._synced = None
+
+    def _on_data(self, event) -> None:
+        # napari reports the removed indices before the removal, the features afterwards
+        action = getattr(event, "action", None)
+        if action == "removing":
+            self._removing = [int(index) for index in event.data_indices]
+        elif action in ("adding", "changing"):
+            return
+        else:
+            removing, self._removing = self._removing, None
+            self._update(removing if action == "removed" else None)
+        layer = self.layer()
+        if layer is not None:
+            # A features event with the same frame changed nothing, unless it comes later
+            self._synced = layer.features
+            QTimer.singleShot(0, self._clear_synced)
+
+    def _update(self, removed: Optional[List[int]]) -> None:
+        layer = self.layer()
+        if layer is None:
+            return
+        frame = layer.features
+        names = [str(name) for name in frame.columns]
+        if names != self._header or frame is self._source:
+            # New columns or a frame changed in place, nothing to compare against
+            if names == self._header and len(frame) == self._row_count:
+                self._set_source(frame, None)
+                self._emit_changed(0, self._row_count - 1)
+            else:
+                self.setSource(frame)
+            return
+
+        old_columns = [np.asarray(column) for column in self._columns]
+        if removed:
+            rows = np.unique(np.asarray(removed, dtype=int))
+            rows = rows[(rows >= 0) & (rows < self._row_count)]
+            for first, last in reversed(_runs(rows)):
+                self.beginRemoveRows(QModelIndex(), first, last)
+                self._row_count -= last - first + 1
+                self.endRemoveRows()
+            keep = np.ones(len(old_columns[0]) if old_columns else 0, dtype=bool)
+            keep[rows] = False
+            old_columns = [column[keep] for column in old_columns]
+
+        count = len(frame)
+        if count < self._row_count:
+            self.beginRemoveRows(QModelIndex(), count, self._row_count - 1)
+            self._row_count = count
+            self.endRemoveRows()
+        common = self._row_count
+        self._set_source(frame, None)
+        self._row_count = common
+        if count > common:
+            self.beginInsertRows(QModelIndex(), common, count - 1)
+            self._row_count = count
+            self.endInsertRows()
+
+        changed = np.zeros(common, dtype=bool)
+        for old, new in zip(old_columns, self._columns):
+            changed |= ~_equal(old[:common], np.asarray(new)[:common])
+        for first, last in _runs(np.flatnonzero(changed)):
+            self._emit_changed(first, last)
+
+    def _emit_changed(self, first: int, last: int) -> None:
+        if last >= first and self.columnCount():
+            self.dataChanged.emit(self.index(first, 0), self.index(last, self.columnCount() - 1))
+
+
+class QFeaturesTable(QTableView):
+    """A live table of the features of a napari layer with a synchronized selection.
+
+    The table shows a `QFeaturesTableModel`, edits of the layer are applied row by row. Rows
+    are selected together with the objects of the layer in both directions: `selected_data`
+    for Points and Shapes, `selected_label` for Labels (matched by the "index" feature).
+
+    Args:
+        parent (Optional[QWidget], optional): The parent widget. Defaults to None.
+        layer (Optional[Layer], optional): The layer. Defaults to None.
+        editable (bool, optional): Whether cells can be edited. Defaults to False.
+
+    Attributes:
+        selection_changed (Signal): Emitted with the sorted selected rows when they change.
+    """
+
+    selection_changed = Signal(list)
+
+    def __init__(
+        self,
+        parent: Optional[QWidget] = None,
+        layer: Optional["Layer"] = None,
+        editable: bool = False,
+    ) -> None:
+        super().__init__(parent)
+        self._syncing = False
+        self._selected_rows: List[int] = []
+        self.setModel(QFeaturesTableModel(editable=editable, parent=self))
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        if not editable:
+            self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.selectionModel().selectionChanged.connect(self._on_view_selection)
+        # Rows of removed objects leave the selection, this is no selection by the user
+        model = self.model()
+        model.rowsAboutToBeInserted.connect(self._begin_rows_change)
+        model.rowsAboutToBeRemoved.connect(self._begin_rows_change)
+        model.rowsInserted.connect(self._end_rows_change)
+        model.rowsRemoved.connect(self._end_rows_change)
+        model.modelReset.connect(self._on_layer_selection)
+        self.connect(layer)
+
+    def layer(self) -> Optional["Layer"]:
+        """Returns the layer of the table."""
+        return self.model().layer()
+
+    def connect(self, layer: Optional["Layer"]) -> None:
+        """Shows the features of a layer and synchronizes the selection with it.
+
+        Args:
+            layer (Optional[Layer]): The layer, None clears the table.
+        """
+        old_layer = self.layer()
+        if old_layer is not None:
+            for emitter in self._selection_events(old_layer):
+                disconnect_tracked(self, emitter, self._on_layer_selection)
+        self.model().setLayer(layer)
+        if layer is not None:
+            for emitter in self._selection_events(layer):
+                connect_tracked(self, emitter, self._on_layer_selection)
+        self._on_layer_selection()
+
+    def selectedRows(self) -> List[int]:
+        """Returns the sorted selected rows."""
+        return sorted(index.row() for index in self.selectionModel().selectedRows())
+
+    def _selection_events(self, layer: "Layer") -> List[Any]:
+        if hasattr(layer, "selected_data"):
+            return [layer.selected_data.events.items_changed]
+        if "selected_label" in layer.events:
+            return [layer.events.selected_label]
+        return []
+
+    def _label_rows(self, layer: "Layer") -> np.ndarray:
+        if "index" not in layer.features:
+            return np.zeros(0, dtype=int)
+        return np.flatnonzero(layer.features["index"].to_numpy() == layer.selected_label)
+
+    def _begin_rows_change(self, *args) -> None:
+        self._syncing = True
+
+    def _end_rows_change(self, *args) -> None:
+        self._syncing = False
+        self._on_layer_selection()
+
+    def _on_layer_selection(self, *args) -> None:
+        layer = self.layer()
+        if self._syncing or layer is None:
+            return
+        if hasattr(layer, "selected_data"):
+            rows = sorted(int(row) for row in layer.selected_data)
+        elif hasattr(layer, "selected_label"):
+            rows = self._label_rows(layer).tolist()
+        else:
+            return
+        model = self.model()
+        selection = QItemSelection()
+        for first, last in _runs([row for row in rows if row < model.rowCount()]):
+            selection.select(model.index(first, 0), model.index(last, model.columnCount() - 1))
+        self._syncing = True
+        try:
+            self.selectionModel().select(
+                selection, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows
+            )
+        finally:
+            self._syncing = False
+        self._emit_selection()
+
+    def _on_view_selection(self, *args) -> None:
+        if self._syncing:
+            return
+        layer = self.layer()
+        rows = self.selectedRows()
+        if layer is not None:
+            self._syncing = True
+            try:
+                if hasattr(layer, "selected_data"):
+                    layer.selected_data = set(rows)
+                elif hasattr(layer, "selected_label") and rows and "index" in layer.features:
+                    layer.selected_label = int(layer.features["index"].iloc[rows[-1]])
+            finally:
+                self._syncing = False
+        self._emit_selection()
+
+    def _emit_selection(self) -> None:
+        rows = self.selectedRows()
+        if rows != self._selected_rows:
+            self._selected_rows = rows
+            self.selection_changed.emit(rows)
+
+
+def setup_featurestable(
+    layout: QLayout,
+    layer: Optional["Layer"] = None,
+    editable: bool = False,
+    function: Optional[Callable[[List[int]], None]] = None,
+    tooltips: Optional[str] = None,
+    shortcut: Optional[str] = None,
+    stretch: int = 1,
+    **kwargs,
+) -> QWidget:
+    """Adds a live table of the features of a napari layer to a layout.
+
+    The table follows edits of the layer row by row and its selection is synchronized with
+    the selection of the layer (selected points/shapes or the selected label).
+
+    Example usage:
+        ```python
+            points = viewer.add_points(coords, features={"intensity": intensity})
+            setup_featurestable(layout, points, function=lambda rows: print(rows))
+        ```
+
+    Args:
+        layout (QLayout): The layout to add the table to.
+        layer (Optional[Layer], optional): A Points, Shapes or Labels layer. Defaults to None.
+        editable (bool, optional): Whether cells can be edited, edits are written to layer.features. Defaults to False.
+        function (Optional[Callable[[List[int]], None]], optional): Called with the selected rows when the selection changes. Defaults to None.
+        tooltips (Optional[str], optional): Tooltip text for the table. Defaults to None.
+        shortcut (Optional[str], optional): A keyboard shortcut to trigger the function. Defaults to None.
+        stretch (int, optional): The stretch factor for the table in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
+
+    Returns:
+        QWidget: The QFeaturesTable added to the layout.
+    """
+    _widget = QFeaturesTable(layer=layer, editable=editable)
+    return connect_widget(
+        layout,
+        _widget,
+        widget_event=_widget.selection_changed,
+        function=function,
+        shortcut=shortcut,
+        tooltips=tooltips,
+        stretch=stretch,
+        **kwargs,
+    )
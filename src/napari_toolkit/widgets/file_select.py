@@ -12,6 +12,7 @@ from qtpy.QtWidgets import (
 )
 
 from napari_toolkit.utils.utils import connect_widget
+from napari_toolkit.utils.widget_registry import register_widget
 
 
 class QDirSelect(QWidget):
@@ -172,6 +173,20 @@ class QFileSelect(QWidget):
         return self.line_edit.text()
 
 
+register_widget(
+    QDirSelect,
+    lambda w: w.get_dir(),
+    lambda w, v: w.set_dir(v),
+    signal=lambda w: w.line_edit.textChanged,
+)
+register_widget(
+    QFileSelect,
+    lambda w: w.get_file(),
+    lambda w, v: w.set_file(v),
+    signal=lambda w: w.line_edit.textChanged,
+)
+
+
 def setup_fileselect(
     layout: QLayout,
     text: str = "Select",
@@ -182,6 +197,7 @@ def setup_fileselect(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Creates and adds a file selection widget to the given layout.
 
@@ -198,6 +214,7 @@ def setup_fileselect(
         tooltips (Optional[str], optional): Tooltip text for the widget. Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut for quick access. Defaults to None.
         stretch (int, optional): The stretch factor in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The initialized `QFileSelect` widget.
@@ -219,6 +236,7 @@ def setup_fileselect(
         shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
 
 
@@ -232,6 +250,7 @@ def setup_savefileselect(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Creates and adds a file selection widget for saving files to the given layout.
 
@@ -248,6 +267,7 @@ def setup_savefileselect(
         tooltips (Optional[str], optional): Tooltip text for the widget. Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut for quick access. Defaults to None.
         stretch (int, optional): The stretch factor in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The initialized `QFileSelect` widget for saving files.
@@ -265,6 +285,7 @@ def setup_savefileselect(
         shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
 
 
@@ -277,6 +298,7 @@ def setup_dirselect(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Creates and adds a directory selection widget to the given layout.
 
@@ -292,6 +314,7 @@ def setup_dirselect(
         tooltips (Optional[str], optional): Tooltip text for the widget. Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut for quick access. Defaults to None.
         stretch (int, optional): The stretch factor in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The initialized `QDirSelect` widget.
@@ -306,4 +329,5 @@ def setup_dirselect(
         shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
@@ -2,86 +2,205 @@ from typing import Callable, Optional
 
 from napari.layers import Layer
 from napari.viewer import Viewer
-from qtpy.QtWidgets import QComboBox, QLayout, QWidget
+from qtpy.QtCore import QModelIndex, QSize
+from qtpy.QtGui import QIcon
+from qtpy.QtWidgets import (
+    QComboBox,
+    QLayout,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QWidget,
+)
 
+from napari_toolkit.utils.layer_model import (
+    LAYER_ROLE,
+    LayerInfo,
+    QLayerFilterProxyModel,
+    get_layer_model,
+)
+from napari_toolkit.utils.thumbnails import QThumbnailCache, get_thumbnail_cache
 from napari_toolkit.utils.utils import connect_widget
 
 
+class _ThumbnailDelegate(QStyledItemDelegate):
+    """Decorates the popup items with the cached layer thumbnails, never renders itself."""
+
+    def __init__(self, cache: QThumbnailCache, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.cache = cache
+        self.enabled = True
+
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        super().initStyleOption(option, index)
+        if not self.enabled:
+            return
+        # The space is reserved in any case, rows do not jump when thumbnails arrive
+        option.decorationSize = QSize(self.cache.size, self.cache.size)
+        layer = index.data(LAYER_ROLE)
+        pixmap = self.cache.cached(layer) if layer is not None else None
+        if pixmap is not None:
+            option.icon = QIcon(pixmap)
+            option.features |= QStyleOptionViewItem.HasDecoration
+
+
 class QLayerSelect(QComboBox):
     """
     A QComboBox widget that dynamically updates with the names of layers in a Napari viewer.
 
+    The combo box is a view of the layer model shared by all layer selectors of a viewer (see
+    `get_layer_model`), so layer events are processed once for all selectors. If the model
+    applies layer events in batches (coalescing mode), selection changes are signaled at most
+    once per batch.
+
+    With thumbnails enabled, the popup shows a thumbnail next to each layer. Thumbnails are
+    requested from the shared `QThumbnailCache` only when the popup is shown and are rendered
+    on worker threads, the popup is repainted as they arrive.
+
+    Layers can be further filtered with a predicate on their `LayerInfo` (dtype, shape, ndim,
+    scale, multiscale flag and metadata keys), which is read from the metadata index of the
+    shared model instead of the layer data, e.g.
+    `predicate=lambda info: info.ndim == 3 and "spacing" in info.metadata_keys`.
+
     Args:
         parent (Optional[QWidget]): The parent widget.
         layer_type (Optional[Type[Layer]]): A specific Napari layer type to filter by (e.g., Image, Labels).
+        thumbnails (bool): Show layer thumbnails in the popup.
+        predicate (Optional[Callable[[LayerInfo], bool]]): Only layers fulfilling the predicate are listed.
     """
 
-    def __init__(self, parent=None, layer_type=Layer):
+    def __init__(self, parent=None, layer_type=Layer, thumbnails=False, predicate=None):
         super().__init__(parent)
         self.layer_type = layer_type
+        self.predicate = predicate
         self.value = self.currentText()
-        self.currentIndexChanged.connect(self.update_tooltip)
+        self.currentTextChanged.connect(self.update_tooltip)
         self.update_tooltip()
-        self.layer_names = {}
+        self._layer_model = None
+        self._batch_state = None
+        self._thumbnail_delegate = None
+        self.setThumbnailsEnabled(thumbnails)
 
-    def _update(self, event):
+    def connect(self, viewer: Viewer, coalesce: Optional[bool] = None):
         """
-        Updates the combo box with the names of layers in the viewer that match the specified layer type.
+        Shows the layers of the Napari viewer, the combo box is updated when layers are added,
+        removed, moved or renamed.
 
         Args:
-            event: The Napari event triggered by a layer being added or removed.
+            viewer (Viewer): The Napari viewer instance to connect to.
+            coalesce (Optional[bool], optional): Apply bursts of layer events in one batch, see
+                `QLayerListModel.setCoalescing`. None keeps the mode of the shared model.
+                Defaults to None.
         """
-        # print(event.type)
-        # for attr in dir(event):
-        #     if not attr.startswith("_"):  # Skip private attributes
-        #         print(f"{attr}: {getattr(event, attr)}")
-
-        if event.type == "removed":
-            layer = event.value
-            if isinstance(layer, self.layer_type):
-
-                item_index = self.findText(layer.name)
-                if item_index != -1:
-                    self.removeItem(item_index)
-                    del self.layer_names[layer]
-        elif event.type == "inserted":
-            layer = event.value
-            if isinstance(layer, self.layer_type):
-                self.addItem(layer.name)
-                self.layer_names[layer] = layer.name
-                layer.events.name.connect(self._update)
-        elif event.type == "name":
-            layer = event.source  # The layer that triggered the event
-            old_name = self.layer_names.get(layer)
-            new_name = layer.name
-            self.layer_names[layer] = new_name
-
-            item_index = self.findText(old_name)
-            if item_index != -1:  # If the old name exists
-                self.setItemText(item_index, new_name)
-            else:
-                self.addItem(new_name)
-
-    def connect(self, viewer: Viewer):
+        if self._layer_model is not None:
+            self._layer_model.batch_started.disconnect(self._on_batch_started)
+            self._layer_model.batch_finished.disconnect(self._on_batch_finished)
+        self._layer_model = get_layer_model(viewer, coalesce)
+        self._layer_model.batch_started.connect(self._on_batch_started)
+        self._layer_model.batch_finished.connect(self._on_batch_finished)
+        self._set_proxy()
+
+    def setPredicate(self, predicate: Optional[Callable[[LayerInfo], bool]]) -> None:
+        """Changes the predicate the listed layers have to fulfill.
+
+        Args:
+            predicate (Optional[Callable[[LayerInfo], bool]]): The predicate on the LayerInfo
+                of a layer, None lists all layers of the layer type.
         """
-        Connects the widget to the Napari viewer's layer events to update the combo box
-        when layers are added or removed.
+        self.predicate = predicate
+        if self._layer_model is not None:
+            self._set_proxy()
+
+    def refilter(self) -> None:
+        """Re-evaluates the predicate, e.g. if it depends on state outside of the layers."""
+        model = self.model()
+        if isinstance(model, QLayerFilterProxyModel) and model.predicate is not None:
+            model.invalidateFilter()
+
+    def _set_proxy(self):
+        old_proxy = self.model()
+        self.setModel(self._layer_model.proxy(self.layer_type, self.predicate, self))
+        # Proxies with a predicate belong to this selector, shared ones to the layer model
+        if isinstance(old_proxy, QLayerFilterProxyModel) and old_proxy.parent() is self:
+            old_proxy.deleteLater()
+
+    def _on_batch_started(self):
+        blocked = self.blockSignals(True)
+        self._batch_state = (self.currentIndex(), self.currentText(), self.currentLayer(), blocked)
+
+    def _on_batch_finished(self):
+        if self._batch_state is None:
+            return
+        index, text, layer, blocked = self._batch_state
+        self._batch_state = None
+        # Signals blocked by the caller stay blocked and the changes are not signaled
+        self.blockSignals(blocked)
+        if blocked:
+            return
+        layer_changed = self.currentLayer() is not layer
+        if layer_changed or self.currentIndex() != index:
+            self.currentIndexChanged.emit(self.currentIndex())
+        if layer_changed or self.currentText() != text:
+            self.currentTextChanged.emit(self.currentText())
+
+    def currentLayer(self) -> Optional[Layer]:
+        """Returns the selected layer, None if no layer is selected.
+
+        Unlike resolving `currentText` in `viewer.layers`, this is correct for layers with
+        duplicate names.
+        """
+        return self.currentData(LAYER_ROLE)
+
+    def findLayer(self, layer: Layer) -> int:
+        """Returns the index of a layer in the combo box, -1 if it is not listed."""
+        model = self.model()
+        if not isinstance(model, QLayerFilterProxyModel):
+            return -1
+        model.sourceModel().flush()
+        return model.row(layer)
+
+    def setCurrentLayer(self, layer: Layer) -> None:
+        """Selects a layer, if it is listed."""
+        index = self.findLayer(layer)
+        if index != -1:
+            self.setCurrentIndex(index)
+
+    def thumbnailsEnabled(self) -> bool:
+        """Returns if layer thumbnails are shown in the popup."""
+        return self._thumbnail_delegate is not None and self._thumbnail_delegate.enabled
+
+    def setThumbnailsEnabled(self, enabled: bool) -> None:
+        """Shows or hides layer thumbnails in the popup.
 
         Args:
-            viewer (Viewer): The Napari viewer instance to connect to.
+            enabled (bool): Whether thumbnails are shown.
         """
+        if self._thumbnail_delegate is None:
+            if not enabled:
+                return
+            cache = get_thumbnail_cache()
+            self._thumbnail_delegate = _ThumbnailDelegate(cache, self)
+            self.setItemDelegate(self._thumbnail_delegate)
+            cache.thumbnail_ready.connect(self._on_thumbnail_ready)
+        self._thumbnail_delegate.enabled = enabled
+        if enabled and self.view().isVisible():
+            self.requestThumbnails()
+
+    def requestThumbnails(self) -> None:
+        """Requests the thumbnails of all listed layers, this is done when the popup is shown."""
+        cache = self._thumbnail_delegate.cache
+        for row in range(self.count()):
+            layer = self.itemData(row, LAYER_ROLE)
+            if layer is not None:
+                cache.request(layer)
 
-        viewer.layers.events.inserted.connect(self._update)
-        viewer.layers.events.removed.connect(self._update)
-        self.layer_names = {
-            layer: layer.name
-            for layer in viewer.layers
-            if self.layer_type is None or isinstance(layer, self.layer_type)
-        }
-        for layer in self.layer_names:
-            layer.events.name.connect(self._update)
+    def showPopup(self):
+        if self.thumbnailsEnabled():
+            self.requestThumbnails()
+        super().showPopup()
 
-        self.addItems(list(self.layer_names.values()))
+    def _on_thumbnail_ready(self, layer):
+        if self.view().isVisible():
+            self.view().viewport().update()
 
     def update_tooltip(self):
         # Set the tooltip to the current item’s text
@@ -96,6 +215,10 @@ def setup_layerselect(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    coalesce: Optional[bool] = None,
+    thumbnails: bool = False,
+    predicate: Optional[Callable[[LayerInfo], bool]] = None,
+    **kwargs,
 ) -> QWidget:
     """
     Adds a LayerSelectionWidget to a layout with optional configurations, including connecting
@@ -109,13 +232,17 @@ def setup_layerselect(
         tooltips (Optional[str], optional): Tooltip text for the widget. Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut to trigger the function. Defaults to None.
         stretch (int, optional): The stretch factor for the spinbox in the layout. Defaults to 1.
+        coalesce (Optional[bool], optional): Apply bursts of layer events (e.g. opening hundreds of tiles) in one batch. None keeps the mode of the viewer's layer model. Defaults to None.
+        thumbnails (bool, optional): Show layer thumbnails in the dropdown, they are rendered in the background when the dropdown is opened. Defaults to False.
+        predicate (Optional[Callable[[LayerInfo], bool]], optional): Only list layers whose LayerInfo (dtype, shape, ndim, scale, multiscale, metadata_keys) fulfills the predicate, evaluated without touching the layer data. Defaults to None.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The configured LayerSelectionWidget added to the layout.
     """
-    _widget = QLayerSelect(layer_type=layer_type)
+    _widget = QLayerSelect(layer_type=layer_type, thumbnails=thumbnails, predicate=predicate)
     if viewer:
-        _widget.connect(viewer)
+        _widget.connect(viewer, coalesce)
     _widget.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon)
     return connect_widget(
         layout,
@@ -125,4 +252,5 @@ def setup_layerselect(
         shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
@@ -3,7 +3,8 @@ from typing import Callable, Optional
 from qtpy.QtCore import Signal
 from qtpy.QtWidgets import QHBoxLayout, QLayout, QLineEdit, QProgressBar, QPushButton, QWidget
 
-from napari_toolkit.utils.utils import connect_widget
+from napari_toolkit.utils.utils import connect_widget, emit_on_change
+from napari_toolkit.utils.widget_registry import register_widget
 
 
 class QProgressbarEdit(QWidget):
@@ -86,19 +87,22 @@ class QProgressbarEdit(QWidget):
         except ValueError:
             pass
 
+    @emit_on_change("index_changed")
     def setValue(self, value: int) -> None:
         """Sets the progress bar and line edit to a new value.
 
-        Ensures the value is within the allowed range before updating.
+        Ensures the value is within the allowed range before updating. `index_changed` is
+        only emitted if the value changed, unless `force=True` is passed.
 
         Args:
             value (int): The new value to set.
         """
         if 0 <= value <= self.max_value:
             self.current_value = value
-            self.line_edit.setText(str(self.current_value))
+            text = str(self.current_value)
+            if self.line_edit.text() != text:
+                self.line_edit.setText(text)
             self.progress_bar.setValue(self.current_value)
-            self.index_changed.emit()
 
     def setMinimum(self, value: int) -> None:
         self.min_value = value
@@ -124,6 +128,16 @@ class QProgressbarEdit(QWidget):
         return self.current_value
 
 
+register_widget(
+    QProgressbarEdit,
+    lambda w: w.value(),
+    lambda w, v: w.setValue(v),
+    (int, float),
+    "a number",
+    lambda w: w.index_changed,
+)
+
+
 def setup_progressbaredit(
     layout: QLayout,
     minimum: Optional[int] = None,
@@ -133,6 +147,7 @@ def setup_progressbaredit(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QProgressbarEdit, configure it, and add it to a layout.
 
@@ -149,6 +164,7 @@ def setup_progressbaredit(
         tooltips (Optional[str], optional): Tooltip text to display when hovering over the progress bar. Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut to trigger the progress bar's associated action. Defaults to None.
         stretch (int, optional): The stretch factor for the progress bar in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QProgressbarEdit widget added to the layout.
@@ -163,4 +179,5 @@ def setup_progressbaredit(
         shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
@@ -0,0 +1,265 @@
+from typing import Any, Callable, List, Optional
+
+from qtpy.QtCore import (
+    QEvent,
+    QModelIndex,
+    QObject,
+    QSize,
+    QSortFilterProxyModel,
+    QStringListModel,
+    Qt,
+    Signal,
+)
+from qtpy.QtWidgets import QLayout, QLineEdit, QListView, QVBoxLayout, QWidget
+
+from napari_toolkit.utils.styling import install_highlight_style
+from napari_toolkit.utils.theme import connect_theme_change, get_theme_palette
+from napari_toolkit.utils.utils import emit_on_change
+from napari_toolkit.utils.widget_registry import get_selection, register_widget, set_selection
+from napari_toolkit.widgets.switch import _setup_switch
+
+
+class QSearchSwitch(QWidget):
+    """A switch for thousands of options with an incremental text filter.
+
+    It has the same API as QHSwitch/QVSwitch, but the options are shown in a QListView with
+    uniform item sizes in a wrapping flow layout, so only the visible items are rendered.
+    Typing into the filter field narrows the options down (case insensitive substring match).
+    Indices always refer to the unfiltered options. Like the buttons of a switch, clicking
+    an option emits `clicked` even if it is the current one, moving through the options with
+    the arrow keys selects them.
+
+    Attributes:
+        options (List[str]): The options.
+        value (Optional[str]): The current option.
+        index (Optional[int]): The index of the current option.
+        filter_edit (QLineEdit): The filter text field.
+        view (QListView): The view of the filtered options.
+        clicked (Signal): Emitted when the current option changes or is clicked.
+    """
+
+    clicked = Signal()
+
+    def __init__(
+        self,
+        parent: Optional[QWidget] = None,
+        fixed_color: Optional[Any] = None,
+        placeholder: str = "Filter...",
+    ):
+        super().__init__(parent)
+        self.fixed_color = fixed_color
+        self.options = []
+        self._option_index = {}
+        self.value = None
+        self.index = None
+        self._updating = False
+        self._index_at_press = None
+
+        self._model = QStringListModel(self)
+        self._proxy = QSortFilterProxyModel(self)
+        self._proxy.setSourceModel(self._model)
+        self._proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText(placeholder)
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.textChanged.connect(self.setFilterText)
+
+        self.view = QListView()
+        self.view.setModel(self._proxy)
+        self.view.setUniformItemSizes(True)
+        self.view.setFlow(QListView.LeftToRight)
+        self.view.setWrapping(True)
+        self.view.setResizeMode(QListView.Adjust)
+        self.view.setLayoutMode(QListView.Batched)
+        self.view.setBatchSize(200)
+        self.view.setSpacing(2)
+        self.view.setEditTriggers(QListView.NoEditTriggers)
+        self.view.setSelectionMode(QListView.SingleSelection)
+        self.view.clicked.connect(self._on_item_pressed)
+        # Enter or double clicks, repeated selections do not emit
+        self.view.activated.connect(self._on_item_activated)
+        self.view.selectionModel().currentChanged.connect(self._on_current_changed)
+        self.view.viewport().installEventFilter(self)
+
+        _layout = QVBoxLayout(self)
+        _layout.setContentsMargins(0, 0, 0, 0)
+        _layout.addWidget(self.filter_edit)
+        _layout.addWidget(self.view)
+
+        self.set_color()
+        connect_theme_change(self.on_theme_change)
+
+    def addItems(self, items: List[str]):
+        """Appends options."""
+        self.setItems(self.options + list(items), keep_current=True)
+
+    def setItems(self, items: List[str], keep_current: bool = True):
+        """Replaces all options in one pass.
+
+        Args:
+            items (List[str]): The new options.
+            keep_current (bool, optional): Keep the current option if it still exists.
+                Defaults to True.
+        """
+        value = self.value if keep_current else None
+        self.options = list(items)
+        self._option_index = {}
+        for idx, item in enumerate(self.options):
+            self._option_index.setdefault(item, idx)
+        self.value = None
+        self.index = None
+        self._updating = True
+        try:
+            self._model.setStringList(self.options)
+        finally:
+            self._updating = False
+        self._check(self._option_index.get(value))
+
+    def setFilterText(self, text: str):
+        """Shows only the options containing the text.
+
+        Args:
+            text (str): The filter text, an empty text shows all options.
+        """
+        if self.filter_edit.text() != text:
+            self.filter_edit.setText(text)
+            return
+        # Filtering moves the current index of the view, which is no user selection
+        self._updating = True
+        try:
+            self._proxy.setFilterFixedString(text)
+        finally:
+            self._updating = False
+        self._sync_view()
+
+    def setGridSize(self, size: QSize):
+        """Sets a fixed cell size, which aligns the options in a grid."""
+        self.view.setGridSize(size)
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.MouseButtonPress:
+            self._index_at_press = self.index
+        return False
+
+    def _on_item_pressed(self, proxy_index: QModelIndex):
+        # A press on another option already selected it through the current index of the
+        # view, a click on the current option is emitted like a click on a switch button
+        index = self._proxy.mapToSource(proxy_index).row()
+        force, self._index_at_press = self._index_at_press == index, None
+        self.setCurrentIndex(index, force=force)
+
+    def _on_item_activated(self, proxy_index: QModelIndex):
+        self.setCurrentIndex(self._proxy.mapToSource(proxy_index).row())
+
+    def _on_current_changed(self, current: QModelIndex, previous: QModelIndex):
+        if not self._updating and current.isValid():
+            self.setCurrentIndex(self._proxy.mapToSource(current).row())
+
+    def _uncheck(self):
+        self.value = None
+        self.index = None
+        self.view.clearSelection()
+
+    def _check(self, idx: int):
+        if idx is not None and 0 <= idx < len(self.options):
+            self.value = self.options[idx]
+            self.index = idx
+            self._sync_view()
+
+    def _sync_view(self):
+        """Selects the current option in the view if it passes the filter."""
+        if self.index is None:
+            return
+        proxy_index = self._proxy.mapFromSource(self._model.index(self.index, 0))
+        if proxy_index.isValid():
+            self.view.setCurrentIndex(proxy_index)
+            self.view.scrollTo(proxy_index)
+        else:
+            self.view.clearSelection()
+
+    def next(self, *args, **kwargs):
+        """Go to the next visible option"""
+        rows = self._proxy.rowCount()
+        if rows == 0:
+            return
+        row = -1
+        if self.index is not None:
+            row = self._proxy.mapFromSource(self._model.index(self.index, 0)).row()
+        proxy_index = self._proxy.index((row + 1) % rows, 0)
+        self.setCurrentIndex(self._proxy.mapToSource(proxy_index).row())
+
+    def set_color(self):
+        if self.fixed_color is not None:
+            self.highlight_color = self.fixed_color
+        else:
+            self.highlight_color = get_theme_palette().highlight
+        install_highlight_style(self, self.highlight_color, "QListView::item", ":selected")
+
+    def on_theme_change(self, *args, **kwargs):
+        self.set_color()
+
+    def currentText(self):
+        return self.value
+
+    def currentIndex(self):
+        return self.index
+
+    @emit_on_change("clicked", getter="currentIndex")
+    def setCurrentIndex(self, value):
+        """Selects an option, `clicked` is only emitted if the selection changed.
+
+        Args:
+            value (int): Index of the option, an invalid index clears the selection.
+            force (bool, optional): Emit `clicked` even if the selection did not change.
+        """
+        if value == self.index:
+            return
+        self._uncheck()
+        self._check(value)
+
+    def findText(self, value):
+        return self._option_index.get(value, -1)
+
+
+register_widget(QSearchSwitch, get_selection, set_selection, signal=lambda w: w.clicked)
+
+
+def setup_searchswitch(
+    layout: QLayout,
+    options: List[str],
+    function: Optional[Callable[[str], None]] = None,
+    default: int = None,
+    fixed_color: Optional[Any] = None,
+    placeholder: str = "Filter...",
+    shortcut: Optional[str] = None,
+    tooltips: Optional[str] = None,
+    stretch: int = 1,
+    **kwargs,
+):
+    """Create a searchable switch widget (QSearchSwitch), configure it, and add it to a layout.
+
+    This function creates a `QSearchSwitch` widget for large option sets (e.g. thousands of
+    label classes), populates it with options, sets a default selection if provided, and
+    connects an optional callback function. A shortcut key can be assigned to go to the next
+    visible option.
+
+    Args:
+        layout (QLayout): The layout to which the QSearchSwitch will be added.
+        options (List[str]): A list of string options for the switch widget.
+        function (Optional[Callable[[str], None]], optional): A callback function executed when the selected option changes. Defaults to None.
+        default (Optional[int], optional): The index of the default selected option. Defaults to None.
+        fixed_color: Optiona[Any]: qt Color information. If given this one is used, else the theme color.
+        placeholder (str, optional): Placeholder text of the filter field. Defaults to "Filter...".
+        shortcut (Optional[str], optional): A keyboard shortcut to go to the next option. Defaults to None.
+        tooltips (Optional[str], optional): Tooltip text for the widget. Defaults to None.
+        stretch (int, optional): The stretch factor for the switch in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
+
+    Returns:
+        QWidget: The configured QSearchSwitch widget added to the layout.
+    """
+    _widget = QSearchSwitch(fixed_color=fixed_color, placeholder=placeholder)
+    return _setup_switch(
+        _widget, layout, options, function, default, shortcut, tooltips, stretch, **kwargs
+    )
@@ -4,7 +4,8 @@ import numpy as np
 from qtpy.QtCore import Qt, Signal
 from qtpy.QtWidgets import QHBoxLayout, QLayout, QLineEdit, QPushButton, QSlider, QWidget
 
-from napari_toolkit.utils.utils import connect_widget
+from napari_toolkit.utils.utils import connect_widget, emit_on_change
+from napari_toolkit.utils.widget_registry import register_widget
 from napari_toolkit.widgets.sliders.double_slider import QDoubleSlider
 
 
@@ -15,7 +16,7 @@ class QEditSlider(QWidget):
     and optional increment/decrement buttons.
 
     Attributes:
-        index_changed (Signal): A signal emitted when the slider value changes.
+        index_changed (Signal): A signal emitted when the value changes.
         min_value (int): The minimum allowed value.
         max_value (int): The maximum allowed value.
         current_value (int): The current value of the slider.
@@ -60,7 +61,7 @@ class QEditSlider(QWidget):
         self.slider.setMaximum(self.max_value)
         self.slider.setValue(self.current_value)
         self.slider.valueChanged.connect(self.update_edit)
-        self.slider.sliderReleased.connect(self.update_progress)
+        self.slider.sliderReleased.connect(self._on_slider_released)
         self.slider.setContentsMargins(0, 0, 0, 0)
 
         self.line_edit = QLineEdit(self)
@@ -89,11 +90,14 @@ class QEditSlider(QWidget):
 
     def update_edit(self) -> None:
         """Updates the line edit field when the slider value changes."""
-        try:
-            value = int(self.slider.value())
-            self.line_edit.setText(str(value))
-        except ValueError:
-            pass
+        self._set_text(str(int(self.slider.value())))
+
+    def _set_text(self, text: str) -> None:
+        if self.line_edit.text() != text:
+            self.line_edit.setText(text)
+
+    def _on_slider_released(self) -> None:
+        self.setValue(self.slider.value())
 
     def update_progress(self) -> None:
         """Updates the slider value when a new value is entered in the line edit."""
@@ -104,19 +108,20 @@ class QEditSlider(QWidget):
         except ValueError:
             pass
 
+    @emit_on_change("index_changed")
     def setValue(self, value: int) -> None:
         """Sets the slider and line edit to a new value.
 
-        Ensures the value is within the allowed range before updating.
+        Ensures the value is within the allowed range before updating. `index_changed` is
+        only emitted if the value changed, unless `force=True` is passed.
 
         Args:
             value (int): The new value to set.
         """
         if self.min_value <= value <= self.max_value:
             self.current_value = value
-            self.line_edit.setText(str(self.current_value))
+            self._set_text(str(self.current_value))
             self.slider.setValue(self.current_value)
-            self.index_changed.emit()
 
     def increment_value(self) -> None:
         """Increments the slider value by 1."""
@@ -137,7 +142,7 @@ class QEditDoubleSlider(QWidget):
     input and optional increment/decrement buttons.
 
     Attributes:
-        index_changed (Signal): A signal emitted when the slider value changes.
+        index_changed (Signal): A signal emitted when the value changes.
         digits (int): The number of decimal places retained.
         digit_factor (int): The factor used for internal scaling.
         min_value (float): The minimum allowed value.
@@ -190,7 +195,7 @@ class QEditDoubleSlider(QWidget):
         self.slider.setValue(self.current_value)
 
         self.slider.valueChanged.connect(self.update_edit)
-        self.slider.sliderReleased.connect(self.update_progress)
+        self.slider.sliderReleased.connect(self._on_slider_released)
         self.slider.setContentsMargins(0, 0, 0, 0)
 
         self.line_edit = QLineEdit(self)
@@ -220,11 +225,14 @@ class QEditDoubleSlider(QWidget):
 
     def update_edit(self) -> None:
         """Updates the line edit field when the slider value changes."""
-        try:
-            value = self.slider.value()
-            self.line_edit.setText(str(value))
-        except ValueError:
-            pass
+        self._set_text(str(self.slider.value()))
+
+    def _set_text(self, text: str) -> None:
+        if self.line_edit.text() != text:
+            self.line_edit.setText(text)
+
+    def _on_slider_released(self) -> None:
+        self.setValue(self.slider.value())
 
     def update_progress(self) -> None:
         """Updates the slider value when a new value is entered in the line edit."""
@@ -234,10 +242,12 @@ class QEditDoubleSlider(QWidget):
         except ValueError:
             pass
 
+    @emit_on_change("index_changed")
     def setValue(self, value: float) -> None:
         """Sets the slider and line edit to a new value.
 
-        Ensures the value is within the allowed range before updating.
+        Ensures the value is within the allowed range before updating. `index_changed` is
+        only emitted if the value changed, unless `force=True` is passed.
 
         Args:
             value (float): The new value to set.
@@ -245,9 +255,8 @@ class QEditDoubleSlider(QWidget):
         if self.min_value <= value <= self.max_value:
             value = np.round(value, self.digits)
             self.current_value = value
-            self.line_edit.setText(str(self.current_value))
+            self._set_text(str(self.current_value))
             self.slider.setValue(self.current_value)
-            self.index_changed.emit()
 
     def increment_value(self) -> None:
         """Increments the slider value by the smallest allowed step."""
@@ -261,6 +270,17 @@ class QEditDoubleSlider(QWidget):
         return self.current_value
 
 
+for _cls in (QEditSlider, QEditDoubleSlider):
+    register_widget(
+        _cls,
+        lambda w: w.value(),
+        lambda w, v: w.setValue(v),
+        (int, float),
+        "a number",
+        lambda w: w.index_changed,
+    )
+
+
 def setup_editslider(
     layout: QLayout,
     minimum: Optional[int] = 0,
@@ -271,6 +291,7 @@ def setup_editslider(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QEditSlider, configure it, and add it to a layout.
 
@@ -288,6 +309,7 @@ def setup_editslider(
         tooltips (Optional[str], optional): Tooltip text to display when hovering over the slider. Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut to trigger the slider's associated action. Defaults to None.
         stretch (int, optional): The stretch factor for the slider in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QEditSlider widget added to the layout.
@@ -304,6 +326,7 @@ def setup_editslider(
         shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
 
 
@@ -318,6 +341,7 @@ def setup_editdoubleslider(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QEditDoubleSlider, configure it, and add it to a layout.
 
@@ -336,6 +360,7 @@ def setup_editdoubleslider(
         tooltips (Optional[str], optional): Tooltip text to display when hovering over the slider. Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut to trigger the slider's associated action. Defaults to None.
         stretch (int, optional): The stretch factor for the slider in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QEditFloatSlider widget added to the layout.
@@ -356,4 +381,5 @@ def setup_editdoubleslider(
         shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
@@ -4,6 +4,7 @@ from qtpy.QtCore import Qt
 from qtpy.QtWidgets import QHBoxLayout, QLabel, QLayout, QSlider, QWidget
 
 from napari_toolkit.utils.utils import connect_widget
+from napari_toolkit.utils.widget_registry import register_widget
 from napari_toolkit.widgets.sliders.double_slider import QDoubleSlider
 
 
@@ -142,6 +143,16 @@ class QLabeledDoubleSlider(_QLabeledSlider):
         self.label.setFixedWidth(10 + (len(str(int(value))) + self.max_digits) * 10)
 
 
+register_widget(
+    _QLabeledSlider,
+    lambda w: w.value(),
+    lambda w, v: w.setValue(v),
+    (int, float),
+    "a number",
+    lambda w: w.slider.valueChanged,
+)
+
+
 def setup_labeledslider(
     layout: QLayout,
     minimum: Optional[int] = None,
@@ -152,6 +163,7 @@ def setup_labeledslider(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QLabeledSlider, configure it, and add it to a layout.
 
@@ -169,6 +181,7 @@ def setup_labeledslider(
         tooltips (Optional[str], optional): Tooltip text to display when hovering over the slider. Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut to trigger the slider's associated action. Defaults to None.
         stretch (int, optional): The stretch factor for the slider in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QLabelSlider widget added to the layout.
@@ -192,6 +205,7 @@ def setup_labeledslider(
         shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
 
 
@@ -206,6 +220,7 @@ def setup_labeleddoubleslider(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QLabeledDoubleSlider, configure it, and add it to a layout.
 
@@ -224,6 +239,7 @@ def setup_labeleddoubleslider(
         tooltips (Optional[str], optional): Tooltip text to display when hovering over the slider. Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut to trigger the slider's associated action. Defaults to None.
         stretch (int, optional): The stretch factor for the slider in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QFloatLabelSlider widget added to the layout.
@@ -247,4 +263,5 @@ def setup_labeleddoubleslider(
         shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
@@ -16,6 +16,7 @@ def setup_slider(
     tooltips: Optional[str] = None,
     shortcut: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QSlider, configure it, and add it to a layout.
 
@@ -33,6 +34,7 @@ def setup_slider(
         tooltips (Optional[str], optional): Tooltip text to display when hovering over the slider. Defaults to None.
         shortcut (Optional[str], optional): A keyboard shortcut to trigger the slider's associated action. Defaults to None.
         stretch (int, optional): The stretch factor for the slider in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QSlider widget added to the layout.
@@ -58,4 +60,5 @@ def setup_slider(
         shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
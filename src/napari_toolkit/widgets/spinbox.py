@@ -16,6 +16,7 @@ def setup_spinbox(
     suffix: Optional[str] = None,
     tooltips: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QSpinBox, configure it, and add it to a layout.
 
@@ -35,6 +36,7 @@ def setup_spinbox(
         suffix (Optional[str], optional): Text to display after the spinbox value. Defaults to None.
         tooltips (Optional[str], optional): Tooltip text to display when hovering over the spinbox. Defaults to None.
         stretch (int, optional): The stretch factor for the spinbox in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QSpinBox widget added to the layout.
@@ -62,6 +64,7 @@ def setup_spinbox(
         shortcut=None,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
 
 
@@ -77,6 +80,7 @@ def setup_doublespinbox(
     digits: int = 2,
     tooltips: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QDoubleSpinBox, configure it, and add it to a layout.
 
@@ -97,6 +101,7 @@ def setup_doublespinbox(
         digits (int, optional): The number of decimal places to display. Defaults to 2.
         tooltips (Optional[str], optional): Tooltip text to display when hovering over the spinbox. Defaults to None.
         stretch (int, optional): The stretch factor for the spinbox in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QDoubleSpinBox widget added to the layout.
@@ -125,4 +130,5 @@ def setup_doublespinbox(
         shortcut=None,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
@@ -1,15 +1,28 @@
 from typing import Any, Callable, List, Optional
 
 from qtpy.QtCore import Signal
-from qtpy.QtGui import QKeySequence
-from qtpy.QtWidgets import QHBoxLayout, QLayout, QPushButton, QShortcut, QVBoxLayout, QWidget
+from qtpy.QtWidgets import (
+    QButtonGroup,
+    QHBoxLayout,
+    QLayout,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
 
-from napari_toolkit.utils.theme import connect_theme_change, get_theme_colors
-from napari_toolkit.utils.utils import connect_widget
+from napari_toolkit.utils.styling import install_highlight_style, set_active
+from napari_toolkit.utils.theme import connect_theme_change, get_theme_palette
+from napari_toolkit.utils.utils import connect_widget, emit_on_change
+from napari_toolkit.utils.widget_registry import get_selection, register_widget, set_selection
 
 
 class _QSwitch(QWidget):
-    """A widget that provides a toggleable switch with multiple button options."""
+    """A widget that provides a toggleable switch with multiple button options.
+
+    The buttons are managed by a QButtonGroup with the option index as id and the options are
+    indexed by text, so selecting an option only touches the previously and newly active
+    button and `findText` is a dictionary lookup, independent of the number of options.
+    """
 
     clicked = Signal()
 
@@ -19,8 +32,12 @@ class _QSwitch(QWidget):
 
         self.buttons = []
         self.options = []
+        self._option_index = {}
         self.value = None
         self.index = None
+        self._group = QButtonGroup(self)
+        self._group.setExclusive(False)
+        self._group.idClicked.connect(self._on_button_pressed)
         self._layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(self._layout)
 
@@ -29,31 +46,58 @@ class _QSwitch(QWidget):
 
     def addItems(self, items):
         """Add Items as buttons to the widget"""
-        for i, item in enumerate(items):
-            _btn = QPushButton(item)
-            _btn.clicked.connect(lambda _, idx=i: self._on_button_pressed(idx))
-            self._layout.addWidget(_btn)
-            self.buttons.append(_btn)
-            self.options.append(item)
+        self.setUpdatesEnabled(False)
+        try:
+            for item in items:
+                idx = len(self.buttons)
+                _btn = QPushButton(item)
+                self._group.addButton(_btn, idx)
+                self._layout.addWidget(_btn)
+                self.buttons.append(_btn)
+                self.options.append(item)
+                self._option_index.setdefault(item, idx)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def setItems(self, items):
+        """Replaces all options in one pass, the current option is kept if it still exists.
+
+        Args:
+            items (List[str]): The new options.
+        """
+        value = self.value
+        self.setUpdatesEnabled(False)
+        try:
+            for btn in self.buttons:
+                self._group.removeButton(btn)
+                self._layout.removeWidget(btn)
+                btn.deleteLater()
+            self.buttons = []
+            self.options = []
+            self._option_index = {}
+            self.value = None
+            self.index = None
+            self.addItems(items)
+            self._check(self._option_index.get(value))
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _on_button_pressed(self, idx: int):
         """
-        Handles the button press event, updating the selected option.
+        Handles the button press event, updating the selected option. `clicked` is emitted
+        on every press, also if the active button is pressed again.
 
         Args:
             idx (int): Index of the button pressed.
         """
-        self._uncheck()
-        self._check(idx)
-        self.clicked.emit()
+        self.setCurrentIndex(idx, force=True)
 
     def _uncheck(self):
-        """Unchecks all buttons and resets the selection state."""
+        """Unchecks the active button and resets the selection state."""
+        if self.index is not None:
+            set_active(self.buttons[self.index], False)
         self.value = None
         self.index = None
-        for btn in self.buttons:
-            btn.setChecked(False)
-            btn.setStyleSheet("")
 
     def _check(self, idx: int):
         """
@@ -65,27 +109,24 @@ class _QSwitch(QWidget):
         if idx is not None and 0 <= idx < len(self.buttons):
             self.value = self.options[idx]
             self.index = idx
-            self.buttons[idx].setChecked(True)
-
-            # self.setStyleSheet("background-color:  rgb(0,100, 167);")
-            self.buttons[idx].setStyleSheet(f"background-color: {self.highlight_color};")
+            set_active(self.buttons[idx], True)
 
     def next(self, *args, **kwargs):
         """Just go to the next item"""
-        idx = (self.index + 1) % len(self.options)
-        self._on_button_pressed(idx)
+        if not self.options:
+            return
+        idx = 0 if self.index is None else (self.index + 1) % len(self.options)
+        self.setCurrentIndex(idx)
 
     def set_color(self):
         if self.fixed_color is not None:
             self.highlight_color = self.fixed_color
         else:
-            theme_colors = get_theme_colors()
-            self.highlight_color = theme_colors.highlight
+            self.highlight_color = get_theme_palette().highlight
+        install_highlight_style(self, self.highlight_color)
 
     def on_theme_change(self, *args, **kwargs):
         self.set_color()
-        if self.index is not None:
-            self.buttons[self.index].setStyleSheet(f"background-color: {self.highlight_color};")
 
     def currentText(self):
         return self.buttons[self.index].text()
@@ -93,16 +134,21 @@ class _QSwitch(QWidget):
     def currentIndex(self):
         return self.index
 
+    @emit_on_change("clicked", getter="currentIndex")
     def setCurrentIndex(self, value):
+        """Selects an option, `clicked` is only emitted if the selection changed.
+
+        Args:
+            value (int): Index of the option, an invalid index clears the selection.
+            force (bool, optional): Emit `clicked` even if the selection did not change.
+        """
+        if value == self.index:
+            return
         self._uncheck()
         self._check(value)
-        self.clicked.emit()
 
     def findText(self, value):
-        try:
-            return self.options.index(value)
-        except ValueError:
-            return -1
+        return self._option_index.get(value, -1)
 
 
 class QHSwitch(_QSwitch):
@@ -137,6 +183,9 @@ class QVSwitch(_QSwitch):
         super().__init__(parent, fixed_color)
 
 
+register_widget(_QSwitch, get_selection, set_selection, signal=lambda w: w.clicked)
+
+
 def _setup_switch(
     _widget: QWidget,
     layout: QLayout,
@@ -146,6 +195,7 @@ def _setup_switch(
     shortcut: Optional[str] = None,
     tooltips: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Configure a switch-like widget, set options, and add it to a layout.
 
@@ -163,6 +213,7 @@ def _setup_switch(
         shortcut (Optional[str], optional): A keyboard shortcut to toggle the switch. Defaults to None.
         tooltips (Optional[str], optional): Tooltip text for the widget. Defaults to None.
         stretch (int, optional): The stretch factor for the spinbox in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The configured switch widget added to the layout.
@@ -172,18 +223,16 @@ def _setup_switch(
     if default is not None:
         _widget._check(default)
 
-    if shortcut:
-        key = QShortcut(QKeySequence(shortcut), _widget)
-        key.activated.connect(_widget.next)
-
     return connect_widget(
         layout,
         _widget,
         widget_event=_widget.clicked,
         function=function,
-        shortcut=None,
+        shortcut=shortcut,
         tooltips=tooltips,
         stretch=stretch,
+        shortcut_function=_widget.next,
+        **kwargs,
     )
 
 
@@ -196,6 +245,7 @@ def setup_vswitch(
     shortcut: Optional[str] = None,
     tooltips: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ):
     """Create a vertical switch widget (QVSwitch), configure it, and add it to a layout.
 
@@ -212,11 +262,14 @@ def setup_vswitch(
         shortcut (Optional[str], optional): A keyboard shortcut to toggle the switch. Defaults to None.
         tooltips (Optional[str], optional): Tooltip text for the widget. Defaults to None.
         stretch (int, optional): The stretch factor for the spinbox in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
     Returns:
         QWidget: The configured QVSwitch widget added to the layout.
     """
     _widget = QVSwitch(fixed_color=fixed_color)
-    return _setup_switch(_widget, layout, options, function, default, shortcut, tooltips, stretch)
+    return _setup_switch(
+        _widget, layout, options, function, default, shortcut, tooltips, stretch, **kwargs
+    )
 
 
 def setup_hswitch(
@@ -228,6 +281,7 @@ def setup_hswitch(
     shortcut: Optional[str] = None,
     tooltips: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ):
     """Create a horizontal switch widget (QHSwitch), configure it, and add it to a layout.
 
@@ -244,9 +298,12 @@ def setup_hswitch(
         shortcut (Optional[str], optional): A keyboard shortcut to toggle the switch. Defaults to None.
         tooltips (Optional[str], optional): Tooltip text for the widget. Defaults to None.
         stretch (int, optional): The stretch factor for the spinbox in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The configured QHSwitch widget added to the layout.
     """
     _widget = QHSwitch(fixed_color=fixed_color)
-    return _setup_switch(_widget, layout, options, function, default, shortcut, tooltips, stretch)
+    return _setup_switch(
+        _widget, layout, options, function, default, shortcut, tooltips, stretch, **kwargs
+    )
@@ -61,6 +61,7 @@ def setup_lineedit(
     readonly: bool = False,
     tooltips: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QLineEdit, configure it, and add it to a layout.
 
@@ -76,6 +77,7 @@ def setup_lineedit(
         readonly (bool, optional): If True, makes the QLineEdit read-only. Defaults to False.
         tooltips (Optional[str], optional): Tooltip text to display when hovering over the QLineEdit. Defaults to None.
         stretch (int, optional): The stretch factor for the QLineEdit in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QLineEdit widget added to the layout.
@@ -94,6 +96,7 @@ def setup_lineedit(
         shortcut=None,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
 
 
@@ -105,6 +108,7 @@ def setup_textedit(
     readonly: bool = False,
     tooltips: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QTextEdit, configure it, and add it to a layout.
 
@@ -120,6 +124,7 @@ def setup_textedit(
         readonly (bool, optional): If True, makes the QTextEdit read-only. Defaults to False.
         tooltips (Optional[str], optional): Tooltip text to display when hovering over the QTextEdit. Defaults to None.
         stretch (int, optional): The stretch factor for the QTextEdit in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QTextEdit widget added to the layout.
@@ -139,6 +144,7 @@ def setup_textedit(
         shortcut=None,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )
 
 
@@ -150,6 +156,7 @@ def setup_plaintextedit(
     readonly: bool = False,
     tooltips: Optional[str] = None,
     stretch: int = 1,
+    **kwargs,
 ) -> QWidget:
     """Create a QPlainTextEdit, configure it, and add it to a layout.
 
@@ -166,6 +173,7 @@ def setup_plaintextedit(
         readonly (bool, optional): If True, makes the QPlainTextEdit read-only. Defaults to False.
         tooltips (Optional[str], optional): Tooltip text to display when hovering over the QPlainTextEdit. Defaults to None.
         stretch (int, optional): The stretch factor for the QPlainTextEdit in the layout. Defaults to 1.
+        **kwargs: Callback options forwarded to `connect_widget` (e.g. `debounce_ms`, `throttle_ms`).
 
     Returns:
         QWidget: The QPlainTextEdit widget added to the layout.
@@ -185,4 +193,5 @@ def setup_plaintextedit(
         shortcut=None,
         tooltips=tooltips,
         stretch=stretch,
+        **kwargs,
     )